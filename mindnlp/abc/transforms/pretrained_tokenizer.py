@@ -18,7 +18,10 @@ Cell mixin
 """
 
 import os
+import threading
+from collections import OrderedDict
 from typing import Union, List, Optional
+import numpy as np
 from mindspore import log as logger
 from mindspore.dataset.transforms.transforms import PyTensorOperation
 
@@ -27,14 +30,91 @@ from tokenizers import AddedToken, Tokenizer
 from mindnlp.utils.download import cached_path
 from mindnlp.abc.mixins import SpecialTokensMixin
 
+
+def _to_str(text_input):
+    """Convert a `str`, `bytes` or string NumPy scalar to `str`."""
+    if isinstance(text_input, bytes):
+        return text_input.decode("utf-8", "ignore")
+    if isinstance(text_input, np.ndarray):
+        if text_input.dtype.type is np.bytes_:
+            text_input = np.char.decode(text_input, "utf-8")
+        return str(text_input)
+    return str(text_input)
+
+
+# Rough size of an encoding per token: ids, type ids, masks, offsets and the token string.
+_ENCODING_BYTES_PER_TOKEN = 64
+
+
+class _EncodingCache:
+    """Thread-safe LRU cache of encodings bounded by entry count and estimated bytes."""
+
+    def __init__(self, max_entries=None, max_bytes=None):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.bytes = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        """Return the cached value of `key`, or None."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def put(self, key, value, size):
+        """Cache `value` of estimated `size` bytes, evicting least recently used entries."""
+        if self.max_bytes is not None and size > self.max_bytes:
+            return
+        with self._lock:
+            if key in self._entries:
+                self.bytes -= self._entries.pop(key)[1]
+            self._entries[key] = (value, size)
+            self.bytes += size
+            while (self.max_entries is not None and len(self._entries) > self.max_entries) or \
+                (self.max_bytes is not None and self.bytes > self.max_bytes):
+                self.bytes -= self._entries.popitem(last=False)[1][1]
+
+    def clear(self):
+        """Remove all entries."""
+        with self._lock:
+            self._entries.clear()
+            self.bytes = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state['_lock'] = None
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+
 class PreTrainedTokenizer(SpecialTokensMixin, PyTensorOperation):
     """
     Pretrained Tokenizer abstract class.
     """
 
     _tokenizer: Tokenizer = None
+    _cache: _EncodingCache = None
+    return_token = False
+    return_offsets = False
+    return_word_ids = False
 
     def __init__(self, **kwargs):
+        self.return_offsets = kwargs.pop('return_offsets', False)
+        self.return_word_ids = kwargs.pop('return_word_ids', False)
        # We call this after having initialized the backend tokenizer because we update it.
         super().__init__(**kwargs)
 
@@ -96,16 +176,127 @@ class PreTrainedTokenizer(SpecialTokensMixin, PyTensorOperation):
 
     def _add_tokens(self, new_tokens: Union[List[str], List[AddedToken]], special_tokens: bool = False) -> int:
 
+        if self._cache is not None:
+            self._cache.clear()
         if special_tokens:
             return self._tokenizer.add_special_tokens(new_tokens)
 
         return self._tokenizer.add_tokens(new_tokens)
 
+    def enable_cache(self, max_entries=4096, max_bytes=None):
+        """
+        Memoize the results of `encode`, which also serves the transform, in a bounded LRU cache,
+        so repeated texts such as queries, labels and prompt templates are tokenized once.
+        Cached encodings are shared between calls and should not be modified in place.
+        The cache is cleared when tokens are added.
+
+        Args:
+            max_entries (int): Maximum number of cached texts. Default: 4096.
+            max_bytes (int): Maximum estimated size of the cached encodings in bytes. Default: None.
+        """
+        self._cache = _EncodingCache(max_entries, max_bytes)
+
+    def disable_cache(self):
+        """Disable and drop the encoding cache."""
+        self._cache = None
+
+    def cache_info(self):
+        """
+        Statistics of the encoding cache.
+
+        Returns:
+            dict, with the number of `hits`, `misses`, cached `entries` and estimated `bytes`,
+            or None if the cache is disabled.
+        """
+        if self._cache is None:
+            return None
+        return {'hits': self._cache.hits, 'misses': self._cache.misses,
+                'entries': len(self._cache), 'bytes': self._cache.bytes}
+
     def encode(self, text_input):
         """encode funtion"""
-        tokens = self._tokenizer.encode(text_input)
+        if self._cache is None or not isinstance(text_input, str):
+            return self._tokenizer.encode(text_input)
+        tokens = self._cache.get(text_input)
+        if tokens is None:
+            tokens = self._tokenizer.encode(text_input)
+            size = len(text_input) + len(tokens.ids) * _ENCODING_BYTES_PER_TOKEN
+            self._cache.put(text_input, tokens, size)
         return tokens
 
+    def _encoding_outputs(self, encoding):
+        """
+        Outputs of the transform for an encoding: its tokens or ids, followed by its character
+        offsets and word ids if `return_offsets` and `return_word_ids` are set.
+        """
+        output = np.array(encoding.tokens) if self.return_token is True else np.array(encoding.ids)
+        if not self.return_offsets and not self.return_word_ids:
+            return output
+        outputs = [output]
+        if self.return_offsets:
+            outputs.append(np.array(encoding.offsets, dtype=np.int32).reshape(-1, 2))
+        if self.return_word_ids:
+            outputs.append(np.array([-1 if word_id is None else word_id for word_id in encoding.word_ids],
+                                    dtype=np.int32))
+        return tuple(outputs)
+
+    def encode_batch(self, texts, max_length=None, pad_id=None, return_offsets=False, return_word_ids=False):
+        """
+        Encode a batch of texts with the multithreaded `encode_batch` of the backend tokenizer,
+        and pad the ids into a single array.
+
+        Args:
+            texts (Sequence[Union[str, bytes, numpy.ndarray]]): Texts to be encoded.
+            max_length (int): If set, ids are truncated to `max_length`. Default: None.
+            pad_id (int): Id the batch is padded with. Default: None, the id of `pad_token`,
+                or 0 if it is not set.
+            return_offsets (bool): Whether to also return the character offsets of the tokens. Default: False.
+            return_word_ids (bool): Whether to also return the word ids of the tokens. Default: False.
+
+        Returns:
+            - **input_ids** (numpy.ndarray) - Int32 ids of shape (batch size, longest length).
+            - **attention_mask** (numpy.ndarray) - Int32 mask of the same shape, 1 for tokens and 0 for padding.
+            - **offsets** (numpy.ndarray) - Int32 (start, end) character offsets of shape
+              (batch size, longest length, 2), (0, 0) for padding. Only returned if `return_offsets` is True.
+            - **word_ids** (numpy.ndarray) - Int32 word ids of the same shape as `input_ids`, -1 for special
+              tokens and padding. Only returned if `return_word_ids` is True.
+        """
+        if pad_id is None:
+            pad_id = self.pad_token_id if self._pad_token is not None else 0
+        # Imported here, since mindnlp.transforms imports the tokenizers built on this class.
+        from mindnlp.transforms.pad_transform import pad_sequences # pylint: disable=import-outside-toplevel
+        encodings = self._tokenizer.encode_batch([_to_str(text) for text in texts])
+        input_ids, lengths = pad_sequences([encoding.ids[:max_length] for encoding in encodings],
+                                           pad_value=pad_id, dtype=np.int32)
+        seq_length = input_ids.shape[1]
+        attention_mask = (np.arange(seq_length) < lengths[:, None]).astype(np.int32)
+        outputs = [input_ids, attention_mask]
+        if return_offsets:
+            # The (start, end) pairs of a row are padded flat, as one row of twice its length.
+            offsets, _ = pad_sequences([np.array(encoding.offsets[:length], dtype=np.int32).reshape(-1)
+                                        for encoding, length in zip(encodings, lengths)],
+                                       max_length=2 * seq_length, dtype=np.int32)
+            outputs.append(offsets.reshape(len(encodings), seq_length, 2))
+        if return_word_ids:
+            word_ids, _ = pad_sequences([[-1 if word_id is None else word_id for word_id in encoding.word_ids[:length]]
+                                         for encoding, length in zip(encodings, lengths)],
+                                        max_length=seq_length, pad_value=-1, dtype=np.int32)
+            outputs.append(word_ids)
+        return tuple(outputs)
+
+    def per_batch_map(self, texts, batch_info=None):
+        """
+        Batch-level transform for `Dataset.batch`, encoding a batch of texts at once with
+        `encode_batch` instead of one row at a time. The offsets and word ids columns follow
+        if `return_offsets` and `return_word_ids` are set.
+
+        Examples:
+            >>> dataset = dataset.batch(32, per_batch_map=tokenizer.per_batch_map, input_columns=['text'],
+            ...                         output_columns=['input_ids', 'attention_mask'])
+        """
+        # pylint: disable=unused-argument
+        return self.encode_batch(texts, return_offsets=self.return_offsets, return_word_ids=self.return_word_ids)
+
     def decode(self, ids:list):
         """decode function"""
         return self._tokenizer.decode(ids)
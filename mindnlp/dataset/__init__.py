@@ -23,3 +23,5 @@ from .sequence_tagging import *
 from .text_generation import *
 from .hf_datasets import *
 from .register import load_dataset, process
+from .process_cache import enable_process_cache, disable_process_cache
+from .sources import ShardedSource, set_dataset_epoch
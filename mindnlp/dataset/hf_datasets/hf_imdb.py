@@ -102,7 +102,7 @@ def HF_IMDB(
 
 @process.register
 def HF_IMDB_Process(dataset, tokenizer, vocab, batch_size=64, max_len=500, \
-                    bucket_boundaries=None, drop_remainder=False):
+                    bucket_boundaries=None, drop_remainder=False, sort_by_length=False):
     """
     the process of the IMDB dataset
 
@@ -114,6 +114,8 @@ def HF_IMDB_Process(dataset, tokenizer, vocab, batch_size=64, max_len=500, \
         max_len (int): max length of the sentence.
         bucket_boundaries (list[int]): A list consisting of the upper boundaries of the buckets.
         drop_remainder (bool): If True, will drop the last batch for each bucket if it is not a full batch
+        sort_by_length (bool): Evaluation mode. If True, samples are batched in order of length and each
+            batch is padded to its own longest sample. Default: False.
 
     Returns:
         - **dataset** (MapDataset) - dataset after transforms.
@@ -131,4 +133,4 @@ def HF_IMDB_Process(dataset, tokenizer, vocab, batch_size=64, max_len=500, \
     """
 
     return IMDB_Process(dataset, tokenizer, vocab, batch_size, max_len, \
-                        bucket_boundaries, drop_remainder)
+                        bucket_boundaries, drop_remainder, sort_by_length)
@@ -25,6 +25,7 @@ from mindspore.dataset import TextFileDataset, transforms
 from mindspore.dataset import text
 from mindnlp.utils.download import cache_file
 from mindnlp.dataset.register import load_dataset, process
+from mindnlp.dataset.process_cache import cached_process
 from mindnlp.configs import DEFAULT_ROOT
 from mindnlp.utils import untar
 
@@ -181,17 +182,20 @@ def Multi30k_Process(dataset, vocab, batch_size=64, max_len=500, \
     en_pad_value = vocab['en'].tokens_to_ids('<pad>')
     de_pad_value = vocab['de'].tokens_to_ids('<pad>')
 
-    en_lookup_op = text.Lookup(vocab['en'], unknown_token='<unk>')
-    de_lookup_op = text.Lookup(vocab['de'], unknown_token='<unk>')
+    def _process(dataset):
+        # The columns are tokenized by the caller, so only lookup and padding are mapped.
+        en_lookup_op = text.Lookup(vocab['en'], unknown_token='<unk>')
+        de_lookup_op = text.Lookup(vocab['de'], unknown_token='<unk>')
 
-    dataset = dataset.map([en_lookup_op], 'en')
-    dataset = dataset.map([de_lookup_op], 'de')
+        dataset = dataset.map([en_lookup_op], 'en')
+        dataset = dataset.map([de_lookup_op], 'de')
 
-    en_pad_op = transforms.PadEnd([max_len], en_pad_value)
-    de_pad_op = transforms.PadEnd([max_len], de_pad_value)
+        en_pad_op = transforms.PadEnd([max_len], en_pad_value)
+        de_pad_op = transforms.PadEnd([max_len], de_pad_value)
 
-    dataset = dataset.map([en_pad_op], 'en')
-    dataset = dataset.map([de_pad_op], 'de')
+        dataset = dataset.map([en_pad_op], 'en')
+        return dataset.map([de_pad_op], 'de')
 
+    dataset = cached_process(_process, dataset, vocab, max_len)
     dataset = dataset.batch(batch_size, drop_remainder=drop_remainder)
     return dataset
@@ -17,6 +17,8 @@ common process
 """
 
 from mindspore.dataset import text
+from mindnlp.transforms import TextToIds
+from mindnlp.dataset.process_cache import cached_process
 
 def common_process(dataset, column, tokenizer, vocab):
     '''
@@ -32,12 +34,56 @@ def common_process(dataset, column, tokenizer, vocab):
         - **dataset** (MapDataset) -dataset after process
         - **newVocab** (Vocab) -new vocab created from dataset if 'vocab' is None
 
+    Note:
+        If the process cache is enabled by `enable_process_cache`, the result is saved on the
+        first call and loaded from the cache when called again with the same inputs.
+
+    '''
+
+    def _process(dataset):
+        if vocab is None :
+            dataset = dataset.map(tokenizer, column)
+            new_vocab = text.Vocab.from_dataset(dataset, column, special_tokens=["<pad>", "<unk>"])
+            return dataset.map(text.Lookup(new_vocab, unknown_token='<unk>'), column), new_vocab
+
+        return dataset.map(TextToIds(tokenizer, vocab), column)
+
+    return cached_process(_process, dataset, column, tokenizer, vocab)
+
+
+def common_columns_process(dataset, columns, tokenizer, vocab):
+    '''
+    common process of several text columns sharing one vocab, such as sentence pairs
+
+    Args:
+        dataset (GeneratorDataset|ZipDataset): dataset needs to be process
+        columns (list[str]): The language column names
+        tokenizer (TextTensorOperation): Tokenizer you what to used
+        vocab (Vocab): The vocab to be used, defaults to None. If None, a new vocab will be created
+            from all the columns
+
+    Returns:
+        - **dataset** (MapDataset) -dataset after process
+        - **vocab** (Vocab) -`vocab`, or the new vocab created from dataset if 'vocab' is None
+
+    Note:
+        If the process cache is enabled by `enable_process_cache`, the result is saved on the
+        first call and loaded from the cache when called again with the same inputs.
+
     '''
+    columns = list(columns)
 
-    if vocab is None :
-        dataset = dataset.map(tokenizer, column)
-        new_vocab = text.Vocab.from_dataset(dataset, column, special_tokens=["<pad>", "<unk>"])
-        return dataset.map(text.Lookup(new_vocab, unknown_token='<unk>'), column), new_vocab
+    def _process(dataset):
+        if vocab is None:
+            for col in columns:
+                dataset = dataset.map(tokenizer, input_columns=col)
+            new_vocab = text.Vocab.from_dataset(dataset, columns=columns, special_tokens=["<pad>", "<unk>"])
+            for col in columns:
+                dataset = dataset.map(text.Lookup(new_vocab, unknown_token='<unk>'), input_columns=col)
+            return dataset, new_vocab
+        for col in columns:
+            dataset = dataset.map(TextToIds(tokenizer, vocab), input_columns=col)
+        return dataset
 
-    dataset = dataset.map(tokenizer, column)
-    return dataset.map(text.Lookup(vocab, unknown_token='<unk>'), column)
+    result = cached_process(_process, dataset, columns, tokenizer, vocab)
+    return result if vocab is None else (result, vocab)
@@ -0,0 +1,296 @@
+# Copyright 2022 Huawei Technologies Co., Ltd
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ============================================================================
+"""
+Cache of preprocessed datasets keyed by a fingerprint of their inputs
+"""
+import hashlib
+import json
+import os
+import shutil
+import numpy as np
+from mindspore import log
+from mindspore.dataset import GeneratorDataset, RandomSampler, text
+from mindnlp.configs import DEFAULT_ROOT
+
+_CACHE_CONFIG = {'cache_dir': None}
+_MAX_DEPTH = 4
+
+
+def enable_process_cache(cache_dir=None):
+    """
+    Enable caching of the results of dataset process functions. The token ids and vocab
+    produced for a given (source, tokenizer, vocab, params) are saved to `cache_dir`
+    on the first run, and memory-mapped on later runs.
+
+    Args:
+        cache_dir (str): Directory of the cache. Default: `~/.mindnlp/cache/process`.
+    """
+    if cache_dir is None:
+        cache_dir = os.path.join(DEFAULT_ROOT, 'cache', 'process')
+    _CACHE_CONFIG['cache_dir'] = cache_dir
+
+
+def disable_process_cache():
+    """Disable caching of the results of dataset process functions."""
+    _CACHE_CONFIG['cache_dir'] = None
+
+
+class _Unfingerprintable(Exception):
+    """Raised when an input can not be fingerprinted reliably."""
+
+
+def _update_hash(hasher, obj, depth=0):
+    """Feed a stable description of `obj` into `hasher`."""
+    if depth > _MAX_DEPTH:
+        raise _Unfingerprintable(type(obj).__name__)
+    if obj is None or isinstance(obj, (str, int, float, bool, bytes)):
+        hasher.update(repr(obj).encode('utf-8'))
+    elif isinstance(obj, (list, tuple)):
+        hasher.update(b'[')
+        for value in obj:
+            _update_hash(hasher, value, depth + 1)
+        hasher.update(b']')
+    elif isinstance(obj, dict):
+        hasher.update(b'{')
+        for key in sorted(obj, key=repr):
+            _update_hash(hasher, key, depth + 1)
+            _update_hash(hasher, obj[key], depth + 1)
+        hasher.update(b'}')
+    elif isinstance(obj, np.ndarray):
+        hasher.update(obj.dtype.str.encode('utf-8') + repr(obj.shape).encode('utf-8') + obj.tobytes())
+    elif isinstance(obj, text.Vocab):
+        _update_hash(hasher, obj.vocab(), depth + 1)
+    elif callable(getattr(obj, 'to_str', None)):
+        hasher.update(obj.to_str().encode('utf-8'))
+    elif hasattr(obj, '__code__'):
+        code = obj.__code__
+        hasher.update(obj.__qualname__.encode('utf-8') + code.co_code)
+        _update_hash(hasher, [c for c in code.co_consts if not hasattr(c, 'co_code')], depth + 1)
+    elif hasattr(obj, '__dict__'):
+        hasher.update(type(obj).__qualname__.encode('utf-8'))
+        # A class defining `__getstate__` leaves out the state it can rebuild, such as caches.
+        state = obj.__getstate__() if '__getstate__' in vars(type(obj)) else vars(obj)
+        _update_hash(hasher, {key: value for key, value in state.items()
+                              if not key.startswith('__')}, depth + 1)
+    else:
+        raise _Unfingerprintable(type(obj).__name__)
+
+
+def _source_fingerprint(source):
+    """Fingerprint a dataset source by the path, size and modification time of its file."""
+    path = getattr(source, 'path', None)
+    if path is None or not os.path.exists(path):
+        raise _Unfingerprintable(type(source).__name__)
+    stat = os.stat(path)
+    return [type(source).__qualname__, os.path.abspath(path), stat.st_size, stat.st_mtime_ns] + \
+        [getattr(source, name, None) for name in ('num_shards', 'shard_id', 'shuffle', 'seed')]
+
+
+def _update_dataset_hash(hasher, dataset):
+    """Feed the pipeline of `dataset`, from its sources to itself, into `hasher`."""
+    for child in dataset.children:
+        _update_dataset_hash(hasher, child)
+    hasher.update(type(dataset).__name__.encode('utf-8'))
+    if getattr(dataset, 'source', None) is not None:
+        _update_hash(hasher, _source_fingerprint(dataset.source))
+    elif not dataset.children:
+        dataset_dir = getattr(dataset, 'dataset_dir', None)
+        if dataset_dir is None:
+            raise _Unfingerprintable(type(dataset).__name__)
+        _update_hash(hasher, [os.path.abspath(dataset_dir), getattr(dataset, 'usage', None)])
+    if getattr(dataset, 'operations', None) is not None:
+        _update_hash(hasher, [dataset.operations, dataset.input_columns, dataset.output_columns])
+    _update_hash(hasher, [getattr(dataset, name, None) for name in
+                          ('column_names', 'num_samples', 'num_shards', 'shard_id', 'batch_size')])
+
+
+def _is_shuffled(dataset):
+    if isinstance(getattr(dataset, 'sampler', None), RandomSampler) or \
+        getattr(getattr(dataset, 'source', None), 'shuffle', False) is True:
+        return True
+    return any(_is_shuffled(child) for child in dataset.children)
+
+
+class _CachedSource:
+    """Random-access source over columns saved by `_write_cache`."""
+
+    def __init__(self, path):
+        self.path = path
+        with open(os.path.join(path, 'meta.json'), 'r', encoding='utf-8') as file:
+            self.meta = json.load(file)
+        self.column_names = [column['name'] for column in self.meta['columns']]
+        self._arrays = None
+
+    def _load(self):
+        arrays = []
+        for idx, column in enumerate(self.meta['columns']):
+            values = np.memmap(os.path.join(self.path, f'{idx}.values'), dtype=column['dtype'], mode='r',
+                               shape=tuple(column['values_shape'])) if column['values_shape'][0] else \
+                np.zeros(column['values_shape'], dtype=column['dtype'])
+            offsets = np.load(os.path.join(self.path, f'{idx}.offsets.npy'), mmap_mode='r')
+            arrays.append((values, offsets))
+        return arrays
+
+    def __getitem__(self, index):
+        if self._arrays is None:
+            self._arrays = self._load()
+        row = []
+        for column, (values, offsets) in zip(self.meta['columns'], self._arrays):
+            value = values[offsets[index]: offsets[index + 1]]
+            if column['kind'] == 'scalar':
+                value = np.array(value[0])
+            elif column['kind'] == 'str':
+                value = np.array(value.tobytes().decode('utf-8'))
+            else:
+                value = np.array(value)
+            row.append(value)
+        return tuple(row)
+
+    def __len__(self):
+        return self.meta['num_rows']
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state['_arrays'] = None
+        return state
+
+
+def _row_kind(value):
+    if value.dtype.kind == 'U':
+        if value.ndim != 0:
+            raise _Unfingerprintable('string array')
+        return 'str'
+    if value.dtype.kind not in 'biuf':
+        raise _Unfingerprintable(str(value.dtype))
+    return 'scalar' if value.ndim == 0 else 'ragged'
+
+
+def _write_cache(dataset, path):
+    """Iterate `dataset` once and save each column as a flat values file and an offsets array."""
+    column_names = dataset.get_col_names()
+    files = [open(os.path.join(path, f'{idx}.values'), 'wb') # pylint: disable=consider-using-with
+             for idx in range(len(column_names))]
+    columns = [None] * len(column_names)
+    offsets = [[0] for _ in column_names]
+    num_rows = 0
+    try:
+        for row in dataset.create_tuple_iterator(output_numpy=True, num_epochs=1):
+            for idx, value in enumerate(row):
+                kind = _row_kind(value)
+                if kind == 'str':
+                    value = np.frombuffer(str(value).encode('utf-8'), dtype=np.uint8)
+                elif kind == 'scalar':
+                    value = value.reshape((1,))
+                if columns[idx] is None:
+                    columns[idx] = {'name': column_names[idx], 'kind': kind,
+                                    'dtype': value.dtype.str, 'row_shape': list(value.shape[1:])}
+                elif columns[idx]['kind'] != kind or columns[idx]['dtype'] != value.dtype.str \
+                    or columns[idx]['row_shape'] != list(value.shape[1:]):
+                    raise _Unfingerprintable(f'column {column_names[idx]} changes type or shape')
+                files[idx].write(np.ascontiguousarray(value).tobytes())
+                offsets[idx].append(offsets[idx][-1] + value.shape[0])
+            num_rows += 1
+    finally:
+        for file in files:
+            file.close()
+    for idx, column in enumerate(columns):
+        if column is None:
+            column = columns[idx] = {'name': column_names[idx], 'kind': 'ragged', 'dtype': '<i4', 'row_shape': []}
+        column['values_shape'] = [offsets[idx][-1]] + column['row_shape']
+        np.save(os.path.join(path, f'{idx}.offsets.npy'), np.array(offsets[idx], dtype=np.int64))
+    with open(os.path.join(path, 'meta.json'), 'w', encoding='utf-8') as file:
+        json.dump({'columns': columns, 'num_rows': num_rows}, file)
+
+
+def _save_vocab(vocab, path):
+    if isinstance(vocab, text.Vocab):
+        vocab_type, tokens = 'mindspore', vocab.vocab()
+    else:
+        vocab_type, tokens = 'mindnlp', dict(vocab.vocab)
+    with open(os.path.join(path, 'vocab.json'), 'w', encoding='utf-8') as file:
+        json.dump({'type': vocab_type, 'tokens': tokens}, file, ensure_ascii=False)
+
+
+def _load_vocab(path):
+    # pylint: disable=import-outside-toplevel
+    with open(os.path.join(path, 'vocab.json'), 'r', encoding='utf-8') as file:
+        data = json.load(file)
+    if data['type'] == 'mindspore':
+        return text.Vocab.from_dict(data['tokens'])
+    from mindnlp.vocab import Vocab
+    return Vocab(data['tokens'])
+
+
+def _load_cache(path, shuffle):
+    source = _CachedSource(path)
+    dataset = GeneratorDataset(source, column_names=source.column_names, shuffle=shuffle)
+    if os.path.exists(os.path.join(path, 'vocab.json')):
+        return dataset, _load_vocab(path)
+    return dataset
+
+
+def cached_process(process_fn, dataset, *params):
+    """
+    Run `process_fn(dataset)` through the process cache.
+
+    If the cache is enabled and the pipeline of `dataset`, together with `params`, can be
+    fingerprinted, the processed rows (and the vocab, if `process_fn` returns one) are
+    saved on the first call, and later calls load them with memory maps instead of
+    re-running tokenization, vocab building and lookup. Otherwise `process_fn` is
+    called directly.
+
+    Args:
+        process_fn (function): Function taking `dataset` and returning a processed dataset,
+            or a tuple of the processed dataset and its vocab.
+        dataset (Dataset): Dataset to be processed.
+        params: Everything else the result depends on, such as column names, the
+            tokenizer and the vocab.
+
+    Returns:
+        The result of `process_fn`, loaded from the cache if enabled.
+    """
+    cache_dir = _CACHE_CONFIG['cache_dir']
+    if cache_dir is None:
+        return process_fn(dataset)
+
+    hasher = hashlib.sha256()
+    try:
+        _update_dataset_hash(hasher, dataset)
+        _update_hash(hasher, [process_fn.__module__, process_fn.__qualname__, list(params)])
+    except _Unfingerprintable as err:
+        log.warning(f"The process cache is skipped, because `{err}` can not be fingerprinted.")
+        return process_fn(dataset)
+
+    path = os.path.join(cache_dir, hasher.hexdigest())
+    shuffle = _is_shuffled(dataset)
+    if os.path.exists(os.path.join(path, 'meta.json')):
+        return _load_cache(path, shuffle)
+
+    result = process_fn(dataset)
+    processed, vocab = result if isinstance(result, tuple) else (result, None)
+    tmp_path = f'{path}.tmp{os.getpid()}'
+    os.makedirs(tmp_path, exist_ok=True)
+    try:
+        _write_cache(processed, tmp_path)
+        if vocab is not None:
+            _save_vocab(vocab, tmp_path)
+        if os.path.exists(path):
+            shutil.rmtree(path)
+        os.replace(tmp_path, path)
+    except _Unfingerprintable as err:
+        shutil.rmtree(tmp_path, ignore_errors=True)
+        log.warning(f"The process cache is skipped, because `{err}` can not be cached.")
+        return result
+    return _load_cache(path, shuffle)
@@ -18,7 +18,6 @@ SQuAD1 load function
 # pylint: disable=C0103
 
 import os
-import json
 from typing import Tuple, Union
 import numpy as np
 
@@ -29,7 +28,10 @@ from mindspore.dataset import GeneratorDataset, transforms
 from mindnlp.vocab import Vocab
 from mindnlp.utils.download import cache_file
 from mindnlp.dataset.register import load_dataset, process
-from mindnlp.transforms import BasicTokenizer, Lookup
+from mindnlp.dataset.process_cache import cached_process
+from mindnlp.dataset.readers import convert_to_jsonl, iter_json_array
+from mindnlp.dataset.sources import ShardedSource
+from mindnlp.transforms import BasicTokenizer, Lookup, TextToIds
 from mindnlp.configs import DEFAULT_ROOT
 
 URL = {
@@ -43,54 +45,37 @@ MD5 = {
 }
 
 
-class Squad1():
+class Squad1(ShardedSource):
     """
     SQuAD1 dataset source
     """
 
-    def __init__(self, path):
+    def __init__(self, path, **kwargs):
         self.path = path
-        self._id = []
-        self._context = []
-        self._question = []
-        self._anwsers = []
-        self._s_idex = []
-        self._load()
-
-    def _load(self):
-        with open(self.path, 'r', encoding='utf8') as f:
-            data = json.load(f)
-            data = data['data']
-
-            for article in data:
-                for paragragh in article['paragraphs']:
-                    context = paragragh['context']
-                    for qa in paragragh['qas']:
-                        ids = qa['id']
-                        question = qa['question']
-                        for ans in qa['answers']:
-                            self._id.append(ids)
-                            self._context.append(context)
-                            self._question.append(question)
-                            answer = ans['text']
-                            self._anwsers.append(answer)
-                            s_idx = ans['answer_start']
-                            self._s_idex.append(s_idx)
-                            break
-
-    def __getitem__(self, index):
-        return self._id[index], self._context[index], self._question[index],\
-            self._anwsers[index], self._s_idex[index]
+        super().__init__(convert_to_jsonl(path, self._records, path + '.squad1.jsonl'), **kwargs)
+
+    def _records(self):
+        for article in iter_json_array(self.path, 'data'):
+            for paragragh in article['paragraphs']:
+                context = paragragh['context']
+                for qa in paragragh['qas']:
+                    for ans in qa['answers']:
+                        yield [qa['id'], context, qa['question'], ans['text'], ans['answer_start']]
+                        break
 
-    def __len__(self):
-        return len(self._anwsers)
+    def _parse(self, record):
+        return tuple(record)
 
 
 @load_dataset.register
 def SQuAD1(
     root: str = DEFAULT_ROOT,
     split: Union[Tuple[str], str] = ('train', 'dev'),
-    proxies=None
+    proxies=None,
+    num_shards=None,
+    shard_id=None,
+    shuffle=False,
+    seed=0
 ):
     r"""
     Load the SQuAD1 dataset
@@ -100,6 +85,11 @@ def SQuAD1(
         split (str|Tuple[str]): Split or splits to be returned.
             Default:('train','dev').
         proxies (dict): a dict to identify proxies,for example: {"https": "https://127.0.0.1:7890"}.
+        num_shards (int): Number of shards the records are divided into, one per rank. Default: None.
+        shard_id (int): The shard loaded by this rank. Default: None.
+        shuffle (bool): Whether to shuffle the records of the shard, in a new order every epoch.
+            Default: False.
+        seed (int): Seed of the shuffle, which gives every rank the same order. Default: 0.
 
     Returns:
         - **datasets_list** (list) -A list of loaded datasets.
@@ -136,7 +126,8 @@ def SQuAD1(
         file_list.append(path)
 
     for _, file in enumerate(file_list):
-        dataset = GeneratorDataset(source=Squad1(file),
+        source = Squad1(file, num_shards=num_shards, shard_id=shard_id, shuffle=shuffle, seed=seed)
+        dataset = GeneratorDataset(source=source,
                                    column_names=[
                                        "id" ,"context", "question", "answers", "answer_start"],
                                    shuffle=False)
@@ -168,6 +159,10 @@ def SQuAD1_Process(dataset, char_vocab, word_vocab=None,\
     Returns:
         - MapDataset, Squad1 Dataset after process.
 
+    Note:
+        If the process cache is enabled by `enable_process_cache`, the processed rows are saved on
+        the first call and loaded from the cache when called again with the same inputs.
+
     Raises:
         TypeError: If `word_vocab` is not of type text.Vocab.
         TypeError: If `char_vocab` is not of type text.Vocab.
@@ -194,124 +189,133 @@ def SQuAD1_Process(dataset, char_vocab, word_vocab=None,\
         >>> print(next(squad_dev))
     """
 
-    c_char_list = []
-    q_char_list = []
-    c_lens = []
-    q_lens = []
-    s_idx = []
-    e_idx = []
-    pad_value_char = char_vocab.lookup_ids("<pad>")
-    abnormals = [' ', '\n', '\u3000', '\u202f', '\u2009','\u200B', '\u0303', '\u092e']
-    for data in dataset:
-        context = data[1].asnumpy().tolist()
-        question = data[2].asnumpy().tolist()
-        answer = data[3].asnumpy().tolist()
-        c_token = tokenizer(context)
-        c_len = len(c_token)
-        q_token = tokenizer(question)
-        q_len = len(q_token)
-        answer_token = tokenizer(answer)
-        answer_len = len(answer_token)
-        s_index = int(data[4])
-        e_index = s_index + len(answer)
-        c_char = []
-        q_char = []
-        # find the starting and ending position of the answer
-        l = 0
-        s_found = False
-        for i, token in enumerate(c_token):
-            while l < len(context):
-                if context[l] in abnormals:
-                    l += 1
-                else:
-                    break
-
-            l += len(token)
-            if l > s_index and s_found is False:
-                s_index = i
-                s_found = True
-            if l >= e_index:
-                e_index = i
-                break
-        # exceptional cases
-        if s_index >= c_len or e_index >= c_len:
+    def _process(dataset):
+        c_char_list = []
+        q_char_list = []
+        c_lens = []
+        q_lens = []
+        s_idx = []
+        e_idx = []
+        pad_value_char = char_vocab.lookup_ids("<pad>")
+        abnormals = [' ', '\n', '\u3000', '\u202f', '\u2009','\u200B', '\u0303', '\u092e']
+        for data in dataset:
+            context = data[1].asnumpy().tolist()
+            question = data[2].asnumpy().tolist()
+            answer = data[3].asnumpy().tolist()
+            c_token = tokenizer(context)
+            c_len = len(c_token)
+            q_token = tokenizer(question)
+            q_len = len(q_token)
+            answer_token = tokenizer(answer)
+            answer_len = len(answer_token)
+            s_index = int(data[4])
+            e_index = s_index + len(answer)
+            c_char = []
+            q_char = []
+            # find the starting and ending position of the answer
+            l = 0
+            s_found = False
             for i, token in enumerate(c_token):
-                if token == answer_token[0]:
-                    s_index = i
-                    if c_token[i + answer_len - 1] == answer_token[-1]:
-                        e_index = i + answer_len - 1
+                while l < len(context):
+                    if context[l] in abnormals:
+                        l += 1
+                    else:
                         break
-        # define lookup operation in char vocab
-        char_lookup = Lookup(char_vocab, unk_token="<unk>")
-        # generate the char list of the context(after lookup and padding operation)
-        for token in c_token:
-            token_ids = char_lookup(list(token))
-            token_ids = list(token_ids)
-            if isinstance(token_ids, int):
-                token_list = []
-                token_list.append(token_ids)
-                token_ids = token_list
-            Pad_char = transforms.PadEnd(pad_shape=[max_char_len], pad_value=pad_value_char)
-            token_pad = Pad_char(token_ids)
-            token_pad = np.array(token_pad, dtype=np.int32)
-            c_char.append(token_pad)
-        # generate the char list of the question(after lookup and padding operation)
-        for token in q_token:
-            token_ids = char_lookup(list(token))
-            token_ids = list(token_ids)
-            if isinstance(token_ids, int):
-            # if type(token_ids)==int:
-                token_list = []
-                token_list.append(token_ids)
-                token_ids = token_list
-            Pad_char = transforms.PadEnd(pad_shape=[max_char_len], pad_value=pad_value_char)
-            token_pad = Pad_char(token_ids)
-            token_pad = np.array(token_pad, dtype=np.int32)
-            q_char.append(token_pad)
-
-        c_lens.append(c_len)
-        q_lens.append(q_len)
-        s_idx.append(s_index)
-        e_idx.append(e_index)
-        c_char_list.append(c_char)
-        q_char_list.append(q_char)
-
-    data = (c_char_list, q_char_list, c_lens, q_lens, s_idx, e_idx)
-    dataset2 = ds.NumpySlicesDataset(data=data, column_names=["c_char", "q_char", "c_lens",\
-                                     "q_lens", "s_idx", "e_idx"], shuffle=False)
-
-    dataset = dataset.zip(dataset2)
-    dataset = dataset.rename(input_columns="id", output_columns="ids")
-    columns_to_project = ["ids", "context", "question", "c_char", "q_char", "c_lens", "q_lens", "s_idx", "e_idx"]
-    dataset = dataset.project(columns=columns_to_project)
-
-    dataset = dataset.map(tokenizer, 'context', 'c_word')
-    dataset = dataset.map(tokenizer, 'question', 'q_word')
-
-    if word_vocab is None:
-        word_vocab = Vocab.from_dataset(dataset, columns=['c_word', 'q_word'],\
-                                             special_tokens=["<unk>", "<pad>"], special_first=True)
-
-    # lookup_op = text.Lookup(word_vocab, unknown_token='<unk>')
-    lookup_op = Lookup(word_vocab, unk_token="<unk>")
-    type_cast_op = transforms.TypeCast(mindspore.int32)
-    pad_value_word = word_vocab.lookup_ids('<pad>')
-
-    dataset = dataset.map(lookup_op, 'c_word')
-    dataset = dataset.map(lookup_op, 'q_word')
-    dataset = dataset.map(type_cast_op, 'c_lens')
-    dataset = dataset.map(type_cast_op, 'q_lens')
-    dataset = dataset.map(type_cast_op, 's_idx')
-    dataset = dataset.map(type_cast_op, 'e_idx')
-
-    pad_op_context = transforms.PadEnd([max_context_len], pad_value_word)
-    dataset = dataset.map([pad_op_context], 'c_word')
-    pad_op_question = transforms.PadEnd([max_question_len], pad_value_word)
-    dataset = dataset.map([pad_op_question], 'q_word')
-    pad_char_context = transforms.PadEnd([max_context_len, max_char_len], pad_value_word)
-    dataset = dataset.map([pad_char_context], 'c_char')
-    pad_char_question = transforms.PadEnd([max_question_len, max_char_len], pad_value_word)
-    dataset = dataset.map([pad_char_question], 'q_char')
 
+                l += len(token)
+                if l > s_index and s_found is False:
+                    s_index = i
+                    s_found = True
+                if l >= e_index:
+                    e_index = i
+                    break
+            # exceptional cases
+            if s_index >= c_len or e_index >= c_len:
+                for i, token in enumerate(c_token):
+                    if token == answer_token[0]:
+                        s_index = i
+                        if c_token[i + answer_len - 1] == answer_token[-1]:
+                            e_index = i + answer_len - 1
+                            break
+            # define lookup operation in char vocab
+            char_lookup = Lookup(char_vocab, unk_token="<unk>")
+            # generate the char list of the context(after lookup and padding operation)
+            for token in c_token:
+                token_ids = char_lookup(list(token))
+                token_ids = list(token_ids)
+                if isinstance(token_ids, int):
+                    token_list = []
+                    token_list.append(token_ids)
+                    token_ids = token_list
+                Pad_char = transforms.PadEnd(pad_shape=[max_char_len], pad_value=pad_value_char)
+                token_pad = Pad_char(token_ids)
+                token_pad = np.array(token_pad, dtype=np.int32)
+                c_char.append(token_pad)
+            # generate the char list of the question(after lookup and padding operation)
+            for token in q_token:
+                token_ids = char_lookup(list(token))
+                token_ids = list(token_ids)
+                if isinstance(token_ids, int):
+                # if type(token_ids)==int:
+                    token_list = []
+                    token_list.append(token_ids)
+                    token_ids = token_list
+                Pad_char = transforms.PadEnd(pad_shape=[max_char_len], pad_value=pad_value_char)
+                token_pad = Pad_char(token_ids)
+                token_pad = np.array(token_pad, dtype=np.int32)
+                q_char.append(token_pad)
+
+            c_lens.append(c_len)
+            q_lens.append(q_len)
+            s_idx.append(s_index)
+            e_idx.append(e_index)
+            c_char_list.append(c_char)
+            q_char_list.append(q_char)
+
+        data = (c_char_list, q_char_list, c_lens, q_lens, s_idx, e_idx)
+        dataset2 = ds.NumpySlicesDataset(data=data, column_names=["c_char", "q_char", "c_lens",\
+                                         "q_lens", "s_idx", "e_idx"], shuffle=False)
+
+        dataset = dataset.zip(dataset2)
+        dataset = dataset.rename(input_columns="id", output_columns="ids")
+        columns_to_project = ["ids", "context", "question", "c_char", "q_char", "c_lens", "q_lens", "s_idx", "e_idx"]
+        dataset = dataset.project(columns=columns_to_project)
+
+        if word_vocab is None:
+            # The vocab is built from the tokenized columns, so they are tokenized, looked up
+            # and padded in separate steps.
+            dataset = dataset.map(tokenizer, 'context', 'c_word')
+            dataset = dataset.map(tokenizer, 'question', 'q_word')
+            vocab = Vocab.from_dataset(dataset, columns=['c_word', 'q_word'],\
+                                       special_tokens=["<unk>", "<pad>"], special_first=True)
+            lookup_op = Lookup(vocab, unk_token="<unk>")
+            pad_value_word = vocab.lookup_ids('<pad>')
+            dataset = dataset.map(lookup_op, 'c_word')
+            dataset = dataset.map(lookup_op, 'q_word')
+            pad_op_context = transforms.PadEnd([max_context_len], pad_value_word)
+            dataset = dataset.map([pad_op_context], 'c_word')
+            pad_op_question = transforms.PadEnd([max_question_len], pad_value_word)
+            dataset = dataset.map([pad_op_question], 'q_word')
+        else:
+            pad_value_word = word_vocab.lookup_ids('<pad>')
+            dataset = dataset.map(TextToIds(tokenizer, word_vocab, max_length=max_context_len,
+                                            pad_value=pad_value_word), 'context', 'c_word')
+            dataset = dataset.map(TextToIds(tokenizer, word_vocab, max_length=max_question_len,
+                                            pad_value=pad_value_word), 'question', 'q_word')
+
+        type_cast_op = transforms.TypeCast(mindspore.int32)
+        dataset = dataset.map(type_cast_op, 'c_lens')
+        dataset = dataset.map(type_cast_op, 'q_lens')
+        dataset = dataset.map(type_cast_op, 's_idx')
+        dataset = dataset.map(type_cast_op, 'e_idx')
+
+        pad_char_context = transforms.PadEnd([max_context_len, max_char_len], pad_value_word)
+        dataset = dataset.map([pad_char_context], 'c_char')
+        pad_char_question = transforms.PadEnd([max_question_len, max_char_len], pad_value_word)
+        dataset = dataset.map([pad_char_question], 'q_char')
+        return dataset
+
+    dataset = cached_process(_process, dataset, char_vocab, word_vocab, tokenizer, max_context_len,
+                             max_question_len, max_char_len)
     dataset = dataset.batch(batch_size, drop_remainder=drop_remainder)
     return dataset
@@ -18,11 +18,12 @@ SQuAD2 load function
 # pylint: disable=C0103
 
 import os
-import json
 from typing import Tuple, Union
 from mindspore.dataset import GeneratorDataset
 from mindnlp.utils.download import cache_file
 from mindnlp.dataset.register import load_dataset
+from mindnlp.dataset.readers import convert_to_jsonl, iter_json_array
+from mindnlp.dataset.sources import ShardedSource
 from mindnlp.configs import DEFAULT_ROOT
 
 URL = {
@@ -36,52 +37,34 @@ MD5 = {
 }
 
 
-class Squad2:
+class Squad2(ShardedSource):
     """
     SQuAD2 dataset source
     """
 
-    def __init__(self, path):
+    def __init__(self, path, **kwargs):
         self.path = path
-        self._context, self._question = [], []
-        self._anwsers, self._answers_start = [], []
-        self._load()
-
-    def _load(self):
-        with open(self.path, 'r', encoding='utf8') as f:
-            json_data = json.load(f)
-            for i in range(len(json_data["data"])):
-                for j in range(len(json_data["data"][i]["paragraphs"])):
-                    for k in range(len((json_data["data"][i]["paragraphs"][j]["qas"]))):
-                        answers = []
-                        answers_start = []
-                        self._context.append(
-                            json_data["data"][i]["paragraphs"][j]["context"])
-                        self._question.append(
-                            json_data["data"][i]["paragraphs"][j]["qas"][k]["question"])
-                        if json_data["data"][i]["paragraphs"][j]["qas"][k]["is_impossible"] is True:
-                            answers.append([''])
-                            answers_start.append([-1])
-                        else:
-                            for index in range(len(json_data["data"][i]
-                                                   ["paragraphs"][j]["qas"][k]["answers"])):
-                                answers.append(json_data["data"][i]["paragraphs"][j]["qas"][k]
-                                               ["answers"][index]['text'])
-                                answers_start.append(json_data["data"][i]["paragraphs"][j]["qas"][k]
-                                                     ["answers"][index]['answer_start'])
-                        self._anwsers.append(answers)
-                        self._answers_start.append(answers_start)
-
-    def __getitem__(self, index):
-        return self._context[index], self._question[index],\
-            self._anwsers[index], self._answers_start[index]
-
-    def __len__(self):
-        return len(self._question)
+        super().__init__(convert_to_jsonl(path, self._records, path + '.squad2.jsonl'), **kwargs)
+
+    def _records(self):
+        for article in iter_json_array(self.path, 'data'):
+            for paragraph in article['paragraphs']:
+                context = paragraph['context']
+                for qa in paragraph['qas']:
+                    if qa['is_impossible'] is True:
+                        answers, answers_start = [['']], [[-1]]
+                    else:
+                        answers = [ans['text'] for ans in qa['answers']]
+                        answers_start = [ans['answer_start'] for ans in qa['answers']]
+                    yield [context, qa['question'], answers, answers_start]
+
+    def _parse(self, record):
+        return tuple(record)
 
 
 @load_dataset.register
-def SQuAD2(root: str = DEFAULT_ROOT, split: Union[Tuple[str], str] = ('train', 'dev'), proxies=None):
+def SQuAD2(root: str = DEFAULT_ROOT, split: Union[Tuple[str], str] = ('train', 'dev'), proxies=None,
+           num_shards=None, shard_id=None, shuffle=False, seed=0):
     r"""
     Load the SQuAD2 dataset
 
@@ -90,6 +73,11 @@ def SQuAD2(root: str = DEFAULT_ROOT, split: Union[Tuple[str], str] = ('train', '
         split (str|Tuple[str]): Split or splits to be returned.
             Default:('train','dev').
         proxies (dict): a dict to identify proxies,for example: {"https": "https://127.0.0.1:7890"}.
+        num_shards (int): Number of shards the records are divided into, one per rank. Default: None.
+        shard_id (int): The shard loaded by this rank. Default: None.
+        shuffle (bool): Whether to shuffle the records of the shard, in a new order every epoch.
+            Default: False.
+        seed (int): Seed of the shuffle, which gives every rank the same order. Default: 0.
 
     Returns:
         - **datasets_list** (list) -A list of loaded datasets.
@@ -124,7 +112,8 @@ def SQuAD2(root: str = DEFAULT_ROOT, split: Union[Tuple[str], str] = ('train', '
         file_list.append(path)
 
     for _, file in enumerate(file_list):
-        dataset = GeneratorDataset(source=Squad2(file),
+        source = Squad2(file, num_shards=num_shards, shard_id=shard_id, shuffle=shuffle, seed=seed)
+        dataset = GeneratorDataset(source=source,
                                    column_names=[
                                        "context", "question", "answers", "answers_start"],
                                    shuffle=False)
@@ -0,0 +1,274 @@
+# Copyright 2022 Huawei Technologies Co., Ltd
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ============================================================================
+"""
+Random-access readers of dataset files
+"""
+import csv
+import io
+import json
+import mmap
+import os
+import numpy as np
+
+_JSON_DECODER = json.JSONDecoder()
+
+
+def _build_csv_index(path):
+    """
+    Scan a CSV file once and return the byte offsets of record starts, followed by
+    the file size. A newline only ends a record when it is outside of quotes.
+    """
+    offsets = [0]
+    position = 0
+    quoted = False
+    with open(path, 'rb') as file:
+        for line in file:
+            position += len(line)
+            if line.count(b'"') % 2:
+                quoted = not quoted
+            if not quoted:
+                offsets.append(position)
+    if offsets[-1] != position:
+        offsets.append(position)
+    return np.array(offsets, dtype=np.int64)
+
+
+def _build_jsonl_index(path):
+    """
+    Scan a JSON Lines file once and return the byte offsets of non-empty lines, followed
+    by the file size. Blank lines are kept as trailing whitespace of the record before them.
+    """
+    offsets = []
+    position = 0
+    with open(path, 'rb') as file:
+        for line in file:
+            if line.strip():
+                offsets.append(position)
+            position += len(line)
+    offsets.append(position)
+    return np.array(offsets, dtype=np.int64)
+
+
+class _IndexedReader:
+    """Base of random-access readers over records located by a byte-offset index."""
+
+    def __init__(self, path, cache_index=True):
+        self.path = path
+        self._file = None
+        self._mmap = None
+        self.offsets = self._load_index(cache_index)
+
+    def _build_index(self):
+        raise NotImplementedError
+
+    def _load_index(self, cache_index):
+        index_path = self.path + '.idx.npy'
+        file_size = os.path.getsize(self.path)
+        if os.path.exists(index_path):
+            offsets = np.load(index_path, mmap_mode='r')
+            if offsets.size and offsets[-1] == file_size:
+                return offsets
+        offsets = self._build_index()
+        if cache_index:
+            try:
+                np.save(index_path, offsets)
+            except OSError:
+                pass
+        return offsets
+
+    def _open(self):
+        if self._mmap is None:
+            self._file = open(self.path, 'rb') # pylint: disable=consider-using-with
+            if os.path.getsize(self.path) > 0:
+                self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+            else:
+                self._mmap = b''
+        return self._mmap
+
+    def read_bytes(self, index):
+        """Return the raw bytes of a record."""
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError(f'Record index {index} out of range of {len(self)} records.')
+        return self._open()[self.offsets[index]: self.offsets[index + 1]]
+
+    def __len__(self):
+        return len(self.offsets) - 1
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state['_file'] = None
+        state['_mmap'] = None
+        return state
+
+    def __del__(self):
+        if self._mmap is not None and not isinstance(self._mmap, bytes):
+            self._mmap.close()
+        if self._file is not None:
+            self._file.close()
+
+
+class CSVReader(_IndexedReader):
+    r"""
+    Random-access reader over the records of a CSV file.
+
+    A byte-offset index of record starts is built on first load and cached next to the
+    file as `<path>.idx.npy`. Records are parsed one at a time from a memory map of the
+    file, so startup time and memory do not depend on the size of the file.
+
+    Args:
+        path (str): Path of the CSV file.
+        cache_index (bool): Whether to save the index next to the file. Default: True.
+    """
+
+    def _build_index(self):
+        return _build_csv_index(self.path)
+
+    def __getitem__(self, index):
+        """Parse a record into a list of fields."""
+        record = self.read_bytes(index).decode('utf-8')
+        return next(csv.reader(io.StringIO(record)), [])
+
+
+class JSONLReader(_IndexedReader):
+    r"""
+    Random-access reader over the records of a JSON Lines file, with the same
+    byte-offset index as :class:`CSVReader`. Blank lines are skipped.
+
+    Args:
+        path (str): Path of the JSON Lines file.
+        cache_index (bool): Whether to save the index next to the file. Default: True.
+    """
+
+    def _build_index(self):
+        return _build_jsonl_index(self.path)
+
+    def __getitem__(self, index):
+        """Parse a record into a JSON value."""
+        return json.loads(self.read_bytes(index))
+
+
+class _JSONStream:
+    """Incremental tokenizer over the top-level structure of a JSON document."""
+
+    def __init__(self, file, chunk_size):
+        self.file = file
+        self.chunk_size = chunk_size
+        self.buffer = ''
+        self.pos = 0
+
+    def _fill(self, size=None):
+        chunk = self.file.read(size or self.chunk_size)
+        if not chunk:
+            return False
+        self.buffer = self.buffer[self.pos:] + chunk
+        self.pos = 0
+        return True
+
+    def peek(self):
+        """Skip whitespace and return the next character, or '' at the end of the file."""
+        while True:
+            while self.pos < len(self.buffer) and self.buffer[self.pos] in ' \t\r\n':
+                self.pos += 1
+            if self.pos < len(self.buffer):
+                return self.buffer[self.pos]
+            if not self._fill():
+                return ''
+
+    def expect(self, char):
+        """Consume `char`."""
+        found = self.peek()
+        if found != char:
+            raise ValueError(f"Invalid JSON in `{self.file.name}`: expect '{char}', but got '{found}'.")
+        self.pos += 1
+
+    def value(self):
+        """Decode the next complete JSON value."""
+        self.peek()
+        while True:
+            try:
+                obj, end = _JSON_DECODER.raw_decode(self.buffer, self.pos)
+            except json.JSONDecodeError:
+                # Read at least as much as is buffered, so large values take few retries.
+                if not self._fill(max(self.chunk_size, len(self.buffer) - self.pos)):
+                    raise
+                continue
+            # A number may be cut at the end of the buffer.
+            if end == len(self.buffer) and self._fill():
+                continue
+            self.pos = end
+            return obj
+
+
+def iter_json_array(path, key=None, chunk_size=1 << 20):
+    """
+    Yield the elements of a JSON array one at a time without loading the whole document.
+
+    Args:
+        path (str): Path of the JSON file.
+        key (Union[str, None]): If set, the array is the value of `key` in the top-level object,
+            otherwise the document itself is the array. Default: None.
+        chunk_size (int): Number of characters read at a time. Default: 1048576.
+    """
+    with open(path, 'r', encoding='utf-8') as file:
+        stream = _JSONStream(file, chunk_size)
+        if key is not None:
+            stream.expect('{')
+            while True:
+                name = stream.value()
+                stream.expect(':')
+                if name == key:
+                    break
+                stream.value()
+                if stream.peek() != ',':
+                    raise KeyError(f"Key `{key}` is not found in `{path}`.")
+                stream.expect(',')
+        stream.expect('[')
+        if stream.peek() == ']':
+            return
+        while True:
+            yield stream.value()
+            if stream.peek() == ']':
+                return
+            stream.expect(',')
+
+
+def convert_to_jsonl(path, records, jsonl_path=None):
+    """
+    Write `records` to a JSON Lines file once and return a :class:`JSONLReader` over it.
+    The file is rewritten only if it is older than `path`.
+
+    Args:
+        path (str): Path of the source file the records are derived from.
+        records (Callable): Function returning an iterable of JSON-serializable records,
+            called only when the file has to be written.
+        jsonl_path (Union[str, None]): Path of the JSON Lines file. Default: `<path>.jsonl`.
+
+    Returns:
+        - **reader** (JSONLReader) - Random-access reader over the records.
+    """
+    if jsonl_path is None:
+        jsonl_path = path + '.jsonl'
+    if not os.path.exists(jsonl_path) or os.path.getmtime(jsonl_path) < os.path.getmtime(path):
+        tmp_path = f'{jsonl_path}.tmp{os.getpid()}'
+        with open(tmp_path, 'w', encoding='utf-8') as file:
+            for record in records():
+                file.write(json.dumps(record, ensure_ascii=False))
+                file.write('\n')
+        os.replace(tmp_path, jsonl_path)
+        if os.path.exists(jsonl_path + '.idx.npy'):
+            os.remove(jsonl_path + '.idx.npy')
+    return JSONLReader(jsonl_path)
@@ -0,0 +1,131 @@
+# Copyright 2022 Huawei Technologies Co., Ltd
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ============================================================================
+"""
+Base class of sharded dataset sources
+"""
+import numpy as np
+
+
+class ShardedSource:
+    r"""
+    Base of `GeneratorDataset` sources over a random-access reader, such as
+    :class:`mindnlp.dataset.readers.CSVReader`.
+
+    The records are partitioned by shard with a stride, so each shard only holds the
+    indices of its own records and reads them lazily, one at a time. If `shuffle` is True,
+    the records of the shard are permuted with a generator seeded by `seed` and the
+    epoch set by `set_epoch`, so every rank gets the same order for the same epoch.
+    When iterated instead of indexed, the shard is further split by worker.
+
+    Subclasses pass their reader to `__init__` and parse raw records in `_parse`.
+
+    Args:
+        reader (Union[Sequence, None]): Random-access reader of the records.
+        num_shards (int): Number of shards the records are divided into. Default: None, no sharding.
+        shard_id (int): The shard of this source, in `[0, num_shards)`. Default: None.
+        shuffle (bool): Whether to shuffle the records of the shard every epoch. Default: False.
+        seed (int): Seed of the shuffle. Default: 0.
+        num_workers (int): Number of workers iterating the source. Default: 1.
+        worker_id (int): The worker of this source, in `[0, num_workers)`. Default: 0.
+
+    Raises:
+        ValueError: If only one of `num_shards` and `shard_id` is set, or `shard_id` or `worker_id`
+            is out of range.
+    """
+
+    def __init__(self, reader=None, num_shards=None, shard_id=None, shuffle=False, seed=0,
+                 num_workers=1, worker_id=0):
+        if (num_shards is None) != (shard_id is None):
+            raise ValueError("For `ShardedSource`, `num_shards` and `shard_id` should be set together, "
+                             f"but got {num_shards} and {shard_id}.")
+        if num_shards is not None and not 0 <= shard_id < num_shards:
+            raise ValueError(f"For `ShardedSource`, `shard_id` should be in [0, {num_shards}), but got {shard_id}.")
+        if not 0 <= worker_id < num_workers:
+            raise ValueError(f"For `ShardedSource`, `worker_id` should be in [0, {num_workers}), "
+                             f"but got {worker_id}.")
+        self._reader = reader
+        self.num_shards = num_shards or 1
+        self.shard_id = shard_id or 0
+        self.shuffle = shuffle
+        self.seed = seed
+        self.num_workers = num_workers
+        self.worker_id = worker_id
+        self.epoch = 0
+        self._indices = None
+
+    def _num_records(self):
+        """Number of records of all shards."""
+        return len(self._reader)
+
+    def _read(self, index):
+        """Read the record at a global `index`."""
+        return self._reader[index]
+
+    def _parse(self, record):
+        """Convert a raw record into the columns of a row."""
+        return record
+
+    def set_epoch(self, epoch):
+        """Set the epoch, which reseeds the shuffle of the next pass."""
+        if epoch != self.epoch:
+            self.epoch = epoch
+            self._indices = None
+
+    def _shard_indices(self):
+        if self._indices is None:
+            if self.num_shards == 1 and not self.shuffle:
+                return None
+            indices = np.arange(self.shard_id, self._num_records(), self.num_shards, dtype=np.int64)
+            if self.shuffle:
+                np.random.default_rng([self.seed, self.epoch]).shuffle(indices)
+            self._indices = indices
+        return self._indices
+
+    def __getitem__(self, index):
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError(f'Index {index} out of range of {len(self)} records.')
+        indices = self._shard_indices()
+        return self._parse(self._read(index if indices is None else int(indices[index])))
+
+    def __len__(self):
+        total = self._num_records()
+        return max(0, -(-(total - self.shard_id) // self.num_shards))
+
+    def __iter__(self):
+        for index in range(self.worker_id, len(self), self.num_workers):
+            yield self[index]
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state['_indices'] = None
+        return state
+
+
+def set_dataset_epoch(dataset, epoch):
+    """
+    Set the epoch of every source feeding `dataset` that has a `set_epoch` method, such as
+    :class:`ShardedSource`, so that sources shuffled by seed produce a new order for the next pass.
+
+    Args:
+        dataset (Dataset): Dataset pipeline.
+        epoch (int): The epoch about to start.
+    """
+    source = getattr(dataset, 'source', None)
+    if callable(getattr(source, 'set_epoch', None)):
+        source.set_epoch(epoch)
+    for child in dataset.children:
+        set_dataset_epoch(child, epoch)
@@ -16,17 +16,17 @@
 AG_NEWS load function
 """
 # pylint: disable=C0103
-import html
 import os
-import re
-import csv
 from typing import Union, Tuple
 import mindspore
-from mindspore.dataset import GeneratorDataset, text, transforms
-from mindnlp.transforms import Truncate, BasicTokenizer
+from mindspore.dataset import GeneratorDataset, transforms
+from mindnlp.transforms import Truncate, BasicTokenizer, HTMLCleaner
 from mindnlp.utils.download import cache_file
-from mindnlp.dataset.utils import make_bucket
+from mindnlp.dataset.utils import make_bucket, make_length_sorted_batch, make_token_budget_batch
+from mindnlp.dataset.readers import CSVReader
+from mindnlp.dataset.sources import ShardedSource
 from mindnlp.dataset.register import load_dataset, process
+from mindnlp.dataset.process import common_process
 from mindnlp.configs import DEFAULT_ROOT
 
 
@@ -41,40 +41,30 @@ MD5 = {
 }
 
 
-class Agnews:
+class Agnews(ShardedSource):
     """
     AG_NEWS dataset source
     """
 
-    def __init__(self, path):
+    def __init__(self, path, **kwargs):
+        super().__init__(CSVReader(path), **kwargs)
         self.path = path
-        self._label, self._text = [], []
         self.end_string = ['.', '?', '!']
-        self._load()
 
-    def _load(self):
-        csvfile = open(self.path, "r", encoding="utf-8")
-        dict_reader = csv.reader(csvfile)
-        for row in dict_reader:
-            label = int(row[0]) - 1
-            self._label.append(label)
-            src_text1 = row[1]
-            src_text2 = row[2]
-            if src_text2:
-                src_text2 = src_text2.strip()
-            if src_text1 and src_text1[-1] not in self.end_string:
-                src_text1 = src_text1 + '.'
-            self._text.append(f"{src_text1} {src_text2}")
-
-    def __getitem__(self, index):
-        return self._label[index], self._text[index]
-
-    def __len__(self):
-        return len(self._text)
+    def _parse(self, record):
+        label = int(record[0]) - 1
+        src_text1 = record[1]
+        src_text2 = record[2]
+        if src_text2:
+            src_text2 = src_text2.strip()
+        if src_text1 and src_text1[-1] not in self.end_string:
+            src_text1 = src_text1 + '.'
+        return label, f"{src_text1} {src_text2}"
 
 
 @load_dataset.register
-def AG_NEWS(root: str = DEFAULT_ROOT, split: Union[Tuple[str], str] = ("train", "test"), proxies=None, shuffle=False):
+def AG_NEWS(root: str = DEFAULT_ROOT, split: Union[Tuple[str], str] = ("train", "test"), proxies=None, shuffle=False,
+            num_shards=None, shard_id=None, seed=0):
     r"""
     Load the AG_NEWS dataset
 
@@ -84,6 +74,11 @@ def AG_NEWS(root: str = DEFAULT_ROOT, split: Union[Tuple[str], str] = ("train",
         split (str|Tuple[str]): Split or splits to be returned.
             Default:('train', 'test').
         proxies (dict): a dict to identify proxies,for example: {"https": "https://127.0.0.1:7890"}.
+        num_shards (int): Number of shards the records are divided into, one per rank. Default: None.
+        shard_id (int): The shard loaded by this rank. Default: None.
+        shuffle (bool): Whether to shuffle the records of the shard, in a new order every epoch.
+            Default: False.
+        seed (int): Seed of the shuffle, which gives every rank the same order. Default: 0.
 
     Returns:
         - **datasets_list** (list) -A list of loaded datasets.
@@ -114,7 +109,8 @@ def AG_NEWS(root: str = DEFAULT_ROOT, split: Union[Tuple[str], str] = ("train",
             path, _ = cache_file(None, url=URL[s], cache_dir=cache_dir, md5sum=MD5[s], proxies=proxies)
             path_list.append(path)
     for path in path_list:
-        datasets_list.append(GeneratorDataset(source=Agnews(path), column_names=column_names, shuffle=shuffle))
+        source = Agnews(path, num_shards=num_shards, shard_id=shard_id, shuffle=shuffle, seed=seed)
+        datasets_list.append(GeneratorDataset(source=source, column_names=column_names, shuffle=False))
     if len(path_list) == 1:
         return datasets_list[0]
     return datasets_list
@@ -122,7 +118,8 @@ def AG_NEWS(root: str = DEFAULT_ROOT, split: Union[Tuple[str], str] = ("train",
 
 @process.register
 def AG_NEWS_Process(dataset, vocab=None, tokenizer=BasicTokenizer(), bucket_boundaries=None,
-                    batch_size=512, max_len=500, column="text", drop_remainder=False):
+                    batch_size=512, max_len=500, column="text", drop_remainder=False, sort_by_length=False,
+                    clean_html=False, num_parallel_workers=None, max_tokens=None):
     """
     the process of the AG_News dataset
 
@@ -137,6 +134,16 @@ def AG_NEWS_Process(dataset, vocab=None, tokenizer=BasicTokenizer(), bucket_boun
         column (str): the column needed to be transpormed of the agnews dataset.
         drop_remainder (bool): When the last batch of data contains a data entry smaller than batch_size, whether
             to discard the batch and not pass it to the next operation. Default: False.
+        sort_by_length (bool): Evaluation mode. If True, samples are batched in order of length and each
+            batch is padded to its own longest sample, with the original order kept in the `sample_index`
+            column. `bucket_boundaries` and `drop_remainder` are ignored. Default: False.
+        clean_html (bool): Whether to replace backslashes, unescape HTML entities and remove HTML tags of
+            the column with `HTMLCleaner` before tokenizing. Default: False.
+        num_parallel_workers (int): Number of worker processes running `HTMLCleaner` if `clean_html`
+            is True. Default: None, the number of workers in the dataset config.
+        max_tokens (int): If set, samples truncated to `max_len` are batched by a budget of this many
+            tokens per padded batch with `make_token_budget_batch` instead of by `batch_size`.
+            `bucket_boundaries` and `drop_remainder` are ignored. Default: None.
 
     Returns:
         - **dataset** (MapDataset) - dataset after transforms.
@@ -160,36 +167,28 @@ def AG_NEWS_Process(dataset, vocab=None, tokenizer=BasicTokenizer(), bucket_boun
 
     """
 
-    non_str = '\\'
-    text_greater = '>'
-    text_less = '<'
-    str_html = re.compile(r'<[^>]+>')
-
-    for data in dataset:
-        src_data = data[1]
-        src_data = src_data.asnumpy().tolist()
-        if non_str in src_data:
-            src_data = src_data.replace(non_str, ' ')
-        src_data = html.unescape(src_data)
-        if text_less in src_data and text_greater in src_data:
-            src_data = str_html.sub('', src_data)
-
-        bows_token = list(src_data)
-        data[1] = bows_token
-
-    dataset = dataset.map([tokenizer], 'text')
+    if clean_html:
+        dataset = dataset.map(HTMLCleaner(), column, num_parallel_workers=num_parallel_workers,
+                              python_multiprocessing=True)
 
     if vocab is None:
-        vocab = text.Vocab.from_dataset(dataset, columns=column, special_tokens=["<pad>", "<unk>"])
+        dataset, vocab = common_process(dataset, column, tokenizer, vocab)
+    else:
+        dataset = common_process(dataset, column, tokenizer, vocab)
     pad_value = vocab.tokens_to_ids('<pad>')
 
-    lookup_op = text.Lookup(vocab, unknown_token='<unk>')
     type_cast_op = transforms.TypeCast(mindspore.int32)
-
-    dataset = dataset.map([lookup_op], 'text')
     dataset = dataset.map([type_cast_op], 'label')
 
-    if bucket_boundaries is not None:
+    if sort_by_length:
+        trancate_op = Truncate(max_len)
+        dataset = dataset.map([trancate_op], 'text')
+        dataset = make_length_sorted_batch(dataset, 'text', {'text': pad_value}, batch_size)
+    elif max_tokens is not None:
+        trancate_op = Truncate(max_len)
+        dataset = dataset.map([trancate_op], 'text')
+        dataset = make_token_budget_batch(dataset, 'text', {'text': pad_value}, max_tokens)
+    elif bucket_boundaries is not None:
         if not isinstance(bucket_boundaries, list):
             raise ValueError(f"'bucket_boundaries' must be a list of int, but get {type(bucket_boundaries)}")
 
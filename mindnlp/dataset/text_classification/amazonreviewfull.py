@@ -18,12 +18,14 @@ AmazonReviewFull load function
 # pylint: disable=C0103
 
 import os
-import csv
 from typing import Union, Tuple
-from mindspore.dataset import GeneratorDataset, text
-from mindnlp.transforms import BasicTokenizer
+from mindspore.dataset import GeneratorDataset
+from mindnlp.transforms import BasicTokenizer, HTMLCleaner
 from mindnlp.utils.download import cache_file
+from mindnlp.dataset.readers import CSVReader
+from mindnlp.dataset.sources import ShardedSource
 from mindnlp.dataset.register import load_dataset, process
+from mindnlp.dataset.process import common_process
 from mindnlp.configs import DEFAULT_ROOT
 from mindnlp.utils import untar
 
@@ -32,28 +34,17 @@ URL = "https://drive.google.com/uc?export=download&id=0Bz8a_Dbh9QhbZVhsUnRWRDhET
 MD5 = "57d28bd5d930e772930baddf36641c7c"
 
 
-class Amazonreviewfull:
+class Amazonreviewfull(ShardedSource):
     """
     AmazonReviewFull dataset source
     """
 
-    def __init__(self, path) -> None:
+    def __init__(self, path, **kwargs) -> None:
+        super().__init__(CSVReader(path), **kwargs)
         self.path: str = path
-        self._label, self._title_text = [], []
-        self._load()
 
-    def _load(self):
-        csvfile = open(self.path, "r", encoding="utf-8")
-        dict_reader = csv.reader(csvfile)
-        for row in dict_reader:
-            self._label.append(int(row[0]))
-            self._title_text.append(f"{row[1]} {row[2]}")
-
-    def __getitem__(self, index):
-        return self._label[index], self._title_text[index]
-
-    def __len__(self):
-        return len(self._label)
+    def _parse(self, record):
+        return int(record[0]), f"{record[1]} {record[2]}"
 
 
 @load_dataset.register
@@ -61,6 +52,10 @@ def AmazonReviewFull(
     root: str = DEFAULT_ROOT,
     split: Union[Tuple[str], str] = ("train", "test"),
     proxies=None,
+    num_shards=None,
+    shard_id=None,
+    shuffle=False,
+    seed=0,
 ):
     r"""
     Load the AmazonReviewFull dataset
@@ -71,6 +66,11 @@ def AmazonReviewFull(
         split (str|Tuple[str]): Split or splits to be returned.
             Default:('train', 'test').
         proxies (dict): a dict to identify proxies,for example: {"https": "https://127.0.0.1:7890"}.
+        num_shards (int): Number of shards the records are divided into, one per rank. Default: None.
+        shard_id (int): The shard loaded by this rank. Default: None.
+        shuffle (bool): Whether to shuffle the records of the shard, in a new order every epoch.
+            Default: False.
+        seed (int): Seed of the shuffle, which gives every rank the same order. Default: 0.
 
     Returns:
         - **datasets_list** (list) -A list of loaded datasets.
@@ -111,7 +111,9 @@ def AmazonReviewFull(
     for path in path_list:
         datasets_list.append(
             GeneratorDataset(
-                source=Amazonreviewfull(path), column_names=column_names, shuffle=False
+                source=Amazonreviewfull(path, num_shards=num_shards, shard_id=shard_id, shuffle=shuffle, seed=seed),
+                column_names=column_names,
+                shuffle=False,
             )
         )
     if len(path_list) == 1:
@@ -119,7 +121,8 @@ def AmazonReviewFull(
     return datasets_list
 
 @process.register
-def AmazonReviewFull_Process(dataset, column="title_text", tokenizer=BasicTokenizer(), vocab=None):
+def AmazonReviewFull_Process(dataset, column="title_text", tokenizer=BasicTokenizer(), vocab=None, clean_html=False,
+                             num_parallel_workers=None):
     """
     the process of the AmazonReviewFull dataset
 
@@ -128,6 +131,10 @@ def AmazonReviewFull_Process(dataset, column="title_text", tokenizer=BasicTokeni
         column (str): the column needed to be transpormed of the AmazonReviewFull dataset.
         tokenizer (TextTensorOperation): tokenizer you choose to tokenize the text dataset.
         vocab (Vocab): vocabulary object, used to store the mapping of token and index.
+        clean_html (bool): Whether to replace backslashes, unescape HTML entities and remove HTML tags of
+            the column with `HTMLCleaner` before tokenizing. Default: False.
+        num_parallel_workers (int): Number of worker processes running `HTMLCleaner` if `clean_html`
+            is True. Default: None, the number of workers in the dataset config.
 
     Returns:
         - **dataset** (MapDataset) - dataset after transforms.
@@ -151,9 +158,8 @@ def AmazonReviewFull_Process(dataset, column="title_text", tokenizer=BasicTokeni
 
     """
 
-    if vocab is None:
-        dataset = dataset.map(tokenizer,  input_columns=column)
-        vocab = text.Vocab.from_dataset(dataset, columns=column, special_tokens=["<pad>", "<unk>"])
-        return dataset.map(text.Lookup(vocab, unknown_token='<unk>'), input_columns=column), vocab
-    dataset = dataset.map(tokenizer,  input_columns=column)
-    return dataset.map(text.Lookup(vocab, unknown_token='<unk>'), input_columns=column), vocab
+    if clean_html:
+        dataset = dataset.map(HTMLCleaner(), input_columns=column, num_parallel_workers=num_parallel_workers,
+                              python_multiprocessing=True)
+    result = common_process(dataset, column, tokenizer, vocab)
+    return result if vocab is None else (result, vocab)
@@ -23,9 +23,10 @@ from typing import Union, Tuple
 import mindspore as ms
 from mindspore.dataset import IMDBDataset, transforms
 from mindnlp.utils.download import cache_file
-from mindnlp.transforms import Truncate, Lookup, PadTransform
+from mindnlp.transforms import TextToIds, HTMLCleaner
 from mindnlp.dataset.register import load_dataset, process
-from mindnlp.dataset.utils import make_bucket
+from mindnlp.dataset.process_cache import cached_process
+from mindnlp.dataset.utils import make_bucket, make_length_sorted_batch, make_token_budget_batch
 from mindnlp.configs import DEFAULT_ROOT
 
 URL = "http://ai.stanford.edu/~amaas/data/sentiment/aclImdb_v1.tar.gz"
@@ -96,7 +97,8 @@ def IMDB(
 
 @process.register
 def IMDB_Process(dataset, tokenizer, vocab, batch_size=64, max_len=500, \
-                 bucket_boundaries=None, drop_remainder=False):
+                 bucket_boundaries=None, drop_remainder=False, sort_by_length=False, clean_html=False,
+                 num_parallel_workers=None, max_tokens=None):
     """
     the process of the IMDB dataset
 
@@ -108,6 +110,20 @@ def IMDB_Process(dataset, tokenizer, vocab, batch_size=64, max_len=500, \
         max_len (int): max length of the sentence.
         bucket_boundaries (list[int]): A list consisting of the upper boundaries of the buckets.
         drop_remainder (bool): If True, will drop the last batch for each bucket if it is not a full batch
+        sort_by_length (bool): Evaluation mode. If True, samples are batched in order of length and each
+            batch is padded to its own longest sample, with the original order kept in the `sample_index`
+            column. `bucket_boundaries` and `drop_remainder` are ignored. Default: False.
+        clean_html (bool): Whether to replace backslashes, unescape HTML entities and remove HTML tags
+            (e.g. `<br />`) of the text with `HTMLCleaner` before tokenizing. Default: False.
+        num_parallel_workers (int): Number of worker processes running `HTMLCleaner` if `clean_html`
+            is True. Default: None, the number of workers in the dataset config.
+        max_tokens (int): If set, samples truncated to `max_len` are batched by a budget of this many
+            tokens per padded batch with `make_token_budget_batch` instead of by `batch_size`.
+            `bucket_boundaries` and `drop_remainder` are ignored. Default: None.
+
+    Note:
+        If the process cache is enabled by `enable_process_cache`, the token ids are saved on the
+        first call and loaded from the cache when called again with the same inputs.
 
     Returns:
         - **dataset** (MapDataset) - dataset after transforms.
@@ -125,25 +141,32 @@ def IMDB_Process(dataset, tokenizer, vocab, batch_size=64, max_len=500, \
     """
 
     pad_value = vocab('<pad>')
-
-    lookup_op = Lookup(vocab, unk_token='<unk>')
-    type_cast_op = transforms.TypeCast(ms.int32)
-    dataset = dataset.map([tokenizer, lookup_op], 'text')
-    dataset = dataset.map(type_cast_op, 'label')
-
-    if bucket_boundaries is not None:
-        if not isinstance(bucket_boundaries, list):
-            raise ValueError(f"'bucket_boundaries' must be a list of int, but get {type(bucket_boundaries)}")
-        trancate_op = Truncate(max_len)
-        dataset = dataset.map([trancate_op], 'text')
+    # Only the default batching pads the ids to `max_len` before batching.
+    pad_ids = not sort_by_length and max_tokens is None and bucket_boundaries is None
+    if bucket_boundaries is not None and not isinstance(bucket_boundaries, list):
+        raise ValueError(f"'bucket_boundaries' must be a list of int, but get {type(bucket_boundaries)}")
+
+    def _process(dataset):
+        if clean_html:
+            dataset = dataset.map(HTMLCleaner(), 'text', num_parallel_workers=num_parallel_workers,
+                                  python_multiprocessing=True)
+        dataset = dataset.map(transforms.TypeCast(ms.int32), 'label')
+        text_to_ids = TextToIds(tokenizer, vocab, max_length=max_len, pad_value=pad_value if pad_ids else None)
+        return dataset.map(text_to_ids, 'text')
+
+    dataset = cached_process(_process, dataset, tokenizer, vocab, max_len, pad_ids, clean_html)
+
+    if sort_by_length:
+        dataset = make_length_sorted_batch(dataset, 'text', {'text': pad_value}, batch_size)
+    elif max_tokens is not None:
+        dataset = make_token_budget_batch(dataset, 'text', {'text': pad_value}, max_tokens)
+    elif bucket_boundaries is not None:
         if bucket_boundaries[-1] < max_len + 1:
             bucket_boundaries.append(max_len + 1)
         bucket_batch_sizes = [batch_size] * (len(bucket_boundaries) + 1)
         dataset = make_bucket(dataset, 'text', pad_value, \
                               bucket_boundaries, bucket_batch_sizes, drop_remainder)
     else:
-        pad_op = PadTransform(max_len, pad_value)
-        dataset = dataset.map([pad_op], 'text')
         dataset = dataset.batch(batch_size, drop_remainder=drop_remainder)
 
     return dataset
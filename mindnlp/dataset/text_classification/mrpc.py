@@ -19,9 +19,9 @@ MRPC load function
 
 import os
 from typing import Union, Tuple
-from mindspore.dataset import GeneratorDataset, text
+from mindspore.dataset import GeneratorDataset
 from mindnlp.utils.download import cache_file
-from mindnlp.dataset.process import common_process
+from mindnlp.dataset.process import common_process, common_columns_process
 from mindnlp.dataset.register import load_dataset, process
 from mindnlp.transforms import BasicTokenizer
 from mindnlp.configs import DEFAULT_ROOT
@@ -145,16 +145,4 @@ def MRPC_Process(dataset,
 
     if isinstance(column, str):
         return common_process(dataset, column, tokenizer, vocab)
-    if vocab is None:
-        for col in column:
-            dataset = dataset.map(tokenizer, input_columns=col)
-        column = list(column)
-        vocab = text.Vocab.from_dataset(dataset, columns=column, special_tokens=["<pad>", "<unk>"])
-        for col in column:
-            dataset = dataset.map(text.Lookup(vocab, unknown_token='<unk>'), input_columns=col)
-        return dataset, vocab
-    for col in column:
-        dataset = dataset.map(tokenizer, input_columns=col)
-    for col in column:
-        dataset = dataset.map(text.Lookup(vocab, unknown_token='<unk>'), input_columns=col)
-    return dataset, vocab
+    return common_columns_process(dataset, column, tokenizer, vocab)
@@ -22,6 +22,8 @@ import csv
 from typing import Union, Tuple
 from mindspore.dataset import GeneratorDataset
 from mindnlp.utils.download import cache_file
+from mindnlp.dataset.readers import CSVReader
+from mindnlp.dataset.sources import ShardedSource
 from mindnlp.dataset.register import load_dataset
 from mindnlp.configs import DEFAULT_ROOT
 from mindnlp.utils import untar
@@ -33,28 +35,17 @@ URL = "https://drive.google.com/uc?export=download&id=0Bz8a_Dbh9QhbUkVqNEszd0pHa
 MD5 = "0c1700ba70b73f964dd8de569d3fd03e"
 
 
-class Sogounews:
+class Sogounews(ShardedSource):
     """
     SogouNews dataset source
     """
 
-    def __init__(self, path) -> None:
+    def __init__(self, path, **kwargs) -> None:
+        super().__init__(CSVReader(path), **kwargs)
         self.path: str = path
-        self._label, self._text = [], []
-        self._load()
 
-    def _load(self):
-        csvfile = open(self.path, "r", encoding="utf-8")
-        dict_reader = csv.reader(csvfile)
-        for row in dict_reader:
-            self._label.append(int(row[0]))
-            self._text.append(f"{row[1]} {row[2]}")
-
-    def __getitem__(self, index):
-        return self._label[index], self._text[index]
-
-    def __len__(self):
-        return len(self._label)
+    def _parse(self, record):
+        return int(record[0]), f"{record[1]} {record[2]}"
 
 
 @load_dataset.register
@@ -62,6 +53,10 @@ def SogouNews(
     root: str = DEFAULT_ROOT,
     split: Union[Tuple[str], str] = ("train", "test"),
     proxies=None,
+    num_shards=None,
+    shard_id=None,
+    shuffle=False,
+    seed=0,
 ):
     r"""
     Load the SogouNews dataset
@@ -72,6 +67,11 @@ def SogouNews(
         split (str|Tuple[str]): Split or splits to be returned.
             Default:('train', 'test').
         proxies (dict): a dict to identify proxies,for example: {"https": "https://127.0.0.1:7890"}.
+        num_shards (int): Number of shards the records are divided into, one per rank. Default: None.
+        shard_id (int): The shard loaded by this rank. Default: None.
+        shuffle (bool): Whether to shuffle the records of the shard, in a new order every epoch.
+            Default: False.
+        seed (int): Seed of the shuffle, which gives every rank the same order. Default: 0.
 
     Returns:
         - **datasets_list** (list) -A list of loaded datasets.
@@ -112,7 +112,9 @@ def SogouNews(
     for path in path_list:
         datasets_list.append(
             GeneratorDataset(
-                source=Sogounews(path), column_names=column_names, shuffle=False
+                source=Sogounews(path, num_shards=num_shards, shard_id=shard_id, shuffle=shuffle, seed=seed),
+                column_names=column_names,
+                shuffle=False,
             )
         )
     if len(path_list) == 1:
@@ -18,11 +18,12 @@ LCSTS load function
 # pylint: disable=C0103
 
 import os
-import json
 from typing import Union, Tuple
 from mindspore.dataset import GeneratorDataset
 from mindnlp.utils.download import cache_file
 from mindnlp.dataset.register import load_dataset
+from mindnlp.dataset.readers import JSONLReader
+from mindnlp.dataset.sources import ShardedSource
 from mindnlp.configs import DEFAULT_ROOT
 
 URL = {
@@ -36,34 +37,21 @@ MD5 = {
 }
 
 
-class Lcsts:
+class Lcsts(ShardedSource):
     """
     LCSTS dataset source
     """
 
-    def __init__(self, path):
+    def __init__(self, path, **kwargs):
+        super().__init__(JSONLReader(path), **kwargs)
         self.path = path
-        self._source, self._target = [], []
-        self._load()
 
-    def _load(self):
-        with open(self.path, 'r', encoding='utf8') as data:
-            for line in data:
-                line = line.strip()
-                if not line:
-                    continue
-                json_data = json.loads(line)
-                self._source.append(json_data["content"])
-                self._target.append(json_data.get("summary", ''))
-
-    def __getitem__(self, index):
-        return self._source[index], self._target[index]
-
-    def __len__(self):
-        return len(self._source)
+    def _parse(self, record):
+        return record["content"], record.get("summary", '')
 
 @load_dataset.register
-def LCSTS(root: str = DEFAULT_ROOT, split: Union[Tuple[str], str] = ('train', 'dev'), proxies=None):
+def LCSTS(root: str = DEFAULT_ROOT, split: Union[Tuple[str], str] = ('train', 'dev'), proxies=None,
+          num_shards=None, shard_id=None, shuffle=False, seed=0):
     r"""
     Load the LCSTS dataset
 
@@ -72,6 +60,11 @@ def LCSTS(root: str = DEFAULT_ROOT, split: Union[Tuple[str], str] = ('train', 'd
         split (str|Tuple[str]): Split or splits to be returned.
             Default:('train', 'dev').
         proxies (dict): a dict to identify proxies,for example: {"https": "https://127.0.0.1:7890"}.
+        num_shards (int): Number of shards the records are divided into, one per rank. Default: None.
+        shard_id (int): The shard loaded by this rank. Default: None.
+        shuffle (bool): Whether to shuffle the records of the shard, in a new order every epoch.
+            Default: False.
+        seed (int): Seed of the shuffle, which gives every rank the same order. Default: 0.
 
     Returns:
         - **datasets_list** (list) -A list of loaded datasets.
@@ -107,7 +100,9 @@ def LCSTS(root: str = DEFAULT_ROOT, split: Union[Tuple[str], str] = ('train', 'd
         file_list.append(path)
 
     for _, file in enumerate(file_list):
-        dataset = GeneratorDataset(source=Lcsts(file), column_names=["source", "target"],
+        source = Lcsts(file, num_shards=num_shards, shard_id=shard_id, shuffle=shuffle, seed=seed)
+        dataset = GeneratorDataset(source=source,
+                                   column_names=["source", "target"],
                                    shuffle=False)
         datasets_list.append(dataset)
     if len(file_list) == 1:
@@ -15,6 +15,18 @@
 """
 Dataset utils
 """
+import atexit
+import os
+import shutil
+import tempfile
+import numpy as np
+from mindspore import log
+from mindspore.dataset import GeneratorDataset
+from mindnlp.transforms.pad_transform import pad_sequences
+from mindnlp.dataset.process_cache import _CachedSource, _Unfingerprintable, _write_cache
+
+# Column holding the position of each sample in the unsorted dataset.
+SAMPLE_INDEX_COLUMN = 'sample_index'
 
 def make_bucket(dataset, column_name, pad_index, \
                 bucket_boundaries, bucket_batch_sizes, drop_remainder):
@@ -47,3 +59,218 @@ def make_bucket_2cloums(dataset, column_name, pad_value1, pad_value2, \
             drop_remainder=drop_remainder)
 
     return dataset
+
+def _pad_batch(rows, batch_index, column_names, pad_info):
+    """Stack the rows at `batch_index`, padding the columns in `pad_info` to their longest value."""
+    batch = []
+    for idx, column_name in enumerate(column_names):
+        values = [rows[i][idx] for i in batch_index]
+        if column_name in pad_info:
+            batch.append(pad_sequences(values, pad_value=pad_info[column_name], dtype=values[0].dtype)[0])
+        else:
+            batch.append(np.stack(values))
+    return batch
+
+class _LengthSortedBatches:
+    """Padded batches of samples sorted by length, with the original index of each sample."""
+
+    def __init__(self, dataset, column_name, pad_info, batch_size):
+        self.column_names = dataset.get_col_names()
+        self.pad_info = pad_info
+        self.batch_size = batch_size
+        self.rows, lengths = _random_access_rows(dataset, column_name)
+        self.order = np.argsort(lengths, kind='stable')
+
+    def __getitem__(self, index):
+        batch_index = self.order[index * self.batch_size: (index + 1) * self.batch_size]
+        batch = _pad_batch(self.rows, batch_index, self.column_names, self.pad_info)
+        batch.append(batch_index.astype(np.int64))
+        return tuple(batch)
+
+    def __len__(self):
+        return (len(self.rows) + self.batch_size - 1) // self.batch_size
+
+
+def make_length_sorted_batch(dataset, column_name, pad_info, batch_size):
+    """
+    Batch an evaluation dataset in order of length, padding each batch only to its own
+    longest sample instead of a global `max_len`.
+
+    The dataset is iterated once to sort it, and its rows are written to memory-mapped files
+    in a temporary directory, or read in place if it is loaded from the process cache, so
+    only the lengths of the samples are held in memory. It is meant for evaluation and
+    prediction sets. The original position of each sample is kept in the
+    `sample_index` column, which `Evaluator.predict` uses to restore the input order.
+
+    Args:
+        dataset (Dataset): Unbatched dataset.
+        column_name (str): Column whose length is used for sorting.
+        pad_info (dict): Map from the names of variable-length columns to their pad values.
+        batch_size (int): The number of rows each batch is created with.
+
+    Returns:
+        - **dataset** (GeneratorDataset) - Dataset of length-sorted, padded batches.
+    """
+    source = _LengthSortedBatches(dataset, column_name, pad_info, batch_size)
+    return GeneratorDataset(source, column_names=source.column_names + [SAMPLE_INDEX_COLUMN], shuffle=False)
+
+
+class TokenBudgetSampler:
+    r"""
+    Sampler of batches holding at most `max_tokens` tokens, padding included.
+
+    Samples are sorted by length within windows of `sort_window` samples, then packed
+    greedily until one more sample would make `batch size * longest length` exceed
+    `max_tokens`; a sample longer than `max_tokens` is batched alone. Short samples thus
+    share large batches and long samples small ones, and little padding is needed.
+    If `shuffle` is True, the samples are assigned to windows by a permutation seeded by
+    `seed`, samples of the same length are ordered anew and the batches are permuted
+    every epoch set by `set_epoch`. The windows stay the same, so every epoch has the
+    same number of batches.
+
+    Args:
+        lengths (Sequence[int]): Length of each sample.
+        max_tokens (int): Maximum number of tokens of a padded batch.
+        shuffle (bool): Whether to shuffle the samples and batches. Default: True.
+        sort_window (int): Number of samples sorted together. A smaller window keeps more
+            randomness in the batches at the cost of more padding. Default: 10000.
+        seed (int): Seed of the shuffle. Default: 0.
+
+    Raises:
+        ValueError: If `max_tokens` or `sort_window` is not positive.
+
+    Examples:
+        >>> sampler = TokenBudgetSampler([5, 2, 7, 3], max_tokens=8, shuffle=False)
+        >>> [batch.tolist() for batch in sampler]
+        [[1, 3], [0], [2]]
+    """
+
+    def __init__(self, lengths, max_tokens, shuffle=True, sort_window=10000, seed=0):
+        if max_tokens <= 0:
+            raise ValueError(f"For `TokenBudgetSampler`, `max_tokens` should be positive, but got {max_tokens}.")
+        if sort_window <= 0:
+            raise ValueError(f"For `TokenBudgetSampler`, `sort_window` should be positive, but got {sort_window}.")
+        self.lengths = np.asarray(lengths, dtype=np.int64)
+        self.max_tokens = max_tokens
+        self.shuffle = shuffle
+        self.sort_window = sort_window
+        self.seed = seed
+        self.epoch = 0
+        self._num_batches = None
+
+    def set_epoch(self, epoch):
+        """Set the epoch, which reseeds the shuffle of the next pass."""
+        self.epoch = epoch
+
+    def _pack(self, indices):
+        batches = []
+        start, max_len = 0, 0
+        for end, length in enumerate(self.lengths[indices]):
+            max_len = max(max_len, length)
+            if end > start and max_len * (end - start + 1) > self.max_tokens:
+                batches.append(indices[start:end])
+                start, max_len = end, length
+        if len(indices) > start:
+            batches.append(indices[start:])
+        return batches
+
+    def batches(self):
+        """Return the list of batches of sample indices for the current epoch."""
+        indices = np.arange(len(self.lengths))
+        rng = np.random.default_rng([self.seed, self.epoch])
+        if self.shuffle:
+            np.random.default_rng(self.seed).shuffle(indices)
+        batches = []
+        for start in range(0, len(indices), self.sort_window):
+            window = indices[start:start + self.sort_window]
+            if self.shuffle:
+                window = rng.permutation(window)
+            batches.extend(self._pack(window[np.argsort(self.lengths[window], kind='stable')]))
+        if self.shuffle:
+            batches = [batches[i] for i in rng.permutation(len(batches))]
+        return batches
+
+    def __iter__(self):
+        return iter(self.batches())
+
+    def __len__(self):
+        if self._num_batches is None:
+            self._num_batches = len(self.batches())
+        return self._num_batches
+
+
+def _random_access_rows(dataset, column_name):
+    """
+    Return a random-access source of the rows of `dataset`, and the length of `column_name` in
+    each row. The rows are read in place if `dataset` is loaded from the process cache, and are
+    otherwise written once to memory-mapped files, so only the lengths are held in memory.
+    """
+    source = getattr(dataset, 'source', None)
+    if dataset.children or not isinstance(source, _CachedSource):
+        path = tempfile.mkdtemp(prefix='mindnlp_batches_')
+        atexit.register(shutil.rmtree, path, True)
+        try:
+            _write_cache(dataset, path)
+        except _Unfingerprintable as err:
+            shutil.rmtree(path, ignore_errors=True)
+            log.warning(f"The rows are kept in memory, because `{err}` can not be memory-mapped.")
+            rows = list(dataset.create_tuple_iterator(output_numpy=True, num_epochs=1))
+            length_idx = dataset.get_col_names().index(column_name)
+            return rows, np.array([row[length_idx].shape[0] for row in rows], dtype=np.int64)
+        source = _CachedSource(path)
+    offsets = np.load(os.path.join(source.path, f'{source.column_names.index(column_name)}.offsets.npy'))
+    return source, np.diff(offsets)
+
+
+class _TokenBudgetBatches:
+    """Padded batches of the samples drawn by a :class:`TokenBudgetSampler`."""
+
+    def __init__(self, dataset, column_name, pad_info, max_tokens, shuffle, sort_window, seed):
+        self.column_names = dataset.get_col_names()
+        self.pad_info = pad_info
+        self.rows, lengths = _random_access_rows(dataset, column_name)
+        self.sampler = TokenBudgetSampler(lengths, max_tokens, shuffle, sort_window, seed)
+        self._batches = None
+
+    def set_epoch(self, epoch):
+        """Set the epoch of the sampler."""
+        if epoch != self.sampler.epoch:
+            self.sampler.set_epoch(epoch)
+            self._batches = None
+
+    def __getitem__(self, index):
+        if self._batches is None:
+            self._batches = self.sampler.batches()
+        return tuple(_pad_batch(self.rows, self._batches[index], self.column_names, self.pad_info))
+
+    def __len__(self):
+        return len(self.sampler)
+
+
+def make_token_budget_batch(dataset, column_name, pad_info, max_tokens, shuffle=True, sort_window=10000, seed=0):
+    """
+    Batch a dataset by a budget of tokens instead of a fixed number of samples, padding
+    each batch only to its own longest sample. See :class:`TokenBudgetSampler` for how
+    samples are grouped.
+
+    The dataset is iterated once and its rows are written to memory-mapped files in a
+    temporary directory, or read in place if it is loaded from the process cache, so only
+    the lengths of the samples are held in memory. The batches are reshuffled
+    every epoch the `Trainer` runs; elsewhere, call
+    :func:`mindnlp.dataset.set_dataset_epoch` before each pass.
+
+    Args:
+        dataset (Dataset): Unbatched dataset.
+        column_name (str): Column whose length is counted against the budget.
+        pad_info (dict): Map from the names of variable-length columns to their pad values.
+        max_tokens (int): Maximum number of tokens of a padded batch.
+        shuffle (bool): Whether to shuffle the samples and batches. Default: True.
+        sort_window (int): Number of samples sorted together. Default: 10000.
+        seed (int): Seed of the shuffle. Default: 0.
+
+    Returns:
+        - **dataset** (GeneratorDataset) - Dataset of padded batches of variable size. Its number
+          of batches is the same every epoch.
+    """
+    source = _TokenBudgetBatches(dataset, column_name, pad_info, max_tokens, shuffle, sort_window, seed)
+    return GeneratorDataset(source, column_names=source.column_names, shuffle=False)
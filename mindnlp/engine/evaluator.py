@@ -15,12 +15,16 @@
 """
 Evaluator for testing.
 """
+import copy
 from inspect import signature
 from tqdm.autonotebook import tqdm
-from mindspore import log, mutable
+from mindspore import log, mutable, ops, Tensor, dtype as mstype
 from mindnlp import ms_jit
 from mindnlp.abc import Metric
 from mindnlp.engine.callbacks.callback_manager import CallbackManager, RunContext
+from mindnlp.engine.metric_pool import MetricPool, PARALLEL_METRICS
+from mindnlp.engine.prediction import run_prediction
+from mindnlp.utils.compatibility import less_min_pynative_first
 
 
 class Evaluator:
@@ -37,19 +41,40 @@ class Evaluator:
         callbacks (Optional[list[Callback], Callback]): List of callback objects which should be executed
             while training. Default: None.
         jit (bool): Whether use Just-In-Time compile.
+        metric_workers (int): Number of processes used to compute text metrics (`BleuScore`, `RougeN`,
+            `RougeL`, `EmScore` and `Distinct`) in parallel with the forward pass. The results are
+            identical to serial execution. If 0, all metrics are updated serially. Default: 0.
+        amp_level (str): Level of mixed-precision inference, one of 'O0', 'O1', 'O2' and 'O3'. It is
+            applied to a copy of the network sharing its parameters, so the network itself, which may be
+            trained by a `Trainer`, keeps its precision. Floating outputs are cast back to float32 before
+            updating metrics. Default: 'O0'.
+        static_shape (bool): Whether to pad smaller batches to the batch size of the dataset, or to the
+            largest batch seen so far, so that a compiled graph is reused instead of recompiled. Outputs
+            are sliced back to the real batch size, so every output should have the batch as its first
+            axis. Only takes effect when `jit` is True. Default: False.
     """
 
-    def __init__(self, network, eval_dataset=None, metrics=None, callbacks=None, jit=False):
+    def __init__(self, network, eval_dataset=None, metrics=None, callbacks=None, jit=False, metric_workers=0,
+                 amp_level='O0', static_shape=False):
+        self._check_amp_level_arg(amp_level)
         self.network = network
         self.callbacks = callbacks
         self.earlystop = False
+        self.metric_workers = metric_workers
+        self.metric_pool = None
+        self.amp_level = amp_level
+        self.static_shape = static_shape and jit
+        self.static_batch_size = None
 
         self._check_metric_type(metrics)
         self.eval_dataset = eval_dataset
         self.total = eval_dataset.get_dataset_size()
+        if self.static_shape and eval_dataset.get_batch_size() > 1:
+            self.static_batch_size = eval_dataset.get_batch_size()
 
         self.callback_manager = CallbackManager(callbacks=self.callbacks)
-        self.eval_func = self._prepare_eval_func(network, jit)
+        self.eval_network = self._build_boost_network(network, amp_level)
+        self.eval_func = self._prepare_eval_func(self.eval_network, jit)
 
     def _prepare_eval_func(self, network, jit):
         def _run_step(inputs):
@@ -57,8 +82,47 @@ class Evaluator:
             outputs = network(*inputs)
             return outputs
         if jit:
-            return ms_jit(_run_step)
-        return _run_step
+            _run_step = ms_jit(_run_step)
+
+        def _eval_step(inputs):
+            batch_size = None
+            if self.static_shape:
+                inputs, batch_size = self._pad_to_static_batch(inputs)
+            outputs = _run_step(inputs)
+            if batch_size is not None:
+                outputs = self._slice_outputs(outputs, batch_size)
+            if self.amp_level != 'O0':
+                outputs = self._cast_outputs(outputs)
+            return outputs
+        return _eval_step
+
+    def _pad_to_static_batch(self, inputs):
+        """Pad a partial batch to the static batch size, which grows to the largest batch seen."""
+        batch_size = inputs[0].shape[0]
+        if self.static_batch_size is None or batch_size > self.static_batch_size:
+            self.static_batch_size = batch_size
+        pad_size = self.static_batch_size - batch_size
+        if pad_size <= 0:
+            return inputs, None
+        padded = ()
+        for value in inputs:
+            pad = ops.zeros((pad_size,) + tuple(value.shape[1:]), value.dtype)
+            padded += (ops.concat((value, pad)),)
+        return mutable(padded), batch_size
+
+    def _slice_outputs(self, outputs, batch_size):
+        """Drop the rows of padded samples."""
+        if isinstance(outputs, tuple):
+            return tuple(self._slice_outputs(output, batch_size) for output in outputs)
+        return outputs[:batch_size]
+
+    def _cast_outputs(self, outputs):
+        """Cast floating outputs to float32, so that metrics are accumulated in full precision."""
+        if isinstance(outputs, tuple):
+            return tuple(self._cast_outputs(output) for output in outputs)
+        if isinstance(outputs, Tensor) and outputs.dtype in mstype.float_type:
+            return outputs.astype(mstype.float32)
+        return outputs
 
     def _check_metric_type(self, metrics):
         """Check metrics type."""
@@ -77,17 +141,28 @@ class Evaluator:
         else:
             raise TypeError(f"Expect metrics to be list or Metrics. Got {type(metrics)}.")
 
-    def _check_amp_level_arg(self, optimizer, amp_level):
+    def _check_amp_level_arg(self, amp_level):
         """Check mixed-precision argument rules."""
-        raise NotImplementedError
+        if amp_level not in ('O0', 'O1', 'O2', 'O3'):
+            raise ValueError(f"For Evaluator, `amp_level` should be one of 'O0', 'O1', 'O2' and 'O3', "
+                             f"but got {amp_level}.")
 
     def _check_for_graph_cell(self, kwargs):
         """Check network rules of GraphCell."""
         raise NotImplementedError
 
-    def _build_boost_network(self, *kwargs):
+    def _build_boost_network(self, network, amp_level):
         """Build boost network."""
-        raise NotImplementedError
+        if amp_level == 'O0':
+            return network
+        # The parameters are in the memo, so the copy shares them instead of duplicating them.
+        memo = {id(param): param for param in network.get_parameters()}
+        # pylint: disable=import-outside-toplevel
+        if less_min_pynative_first:
+            from mindnlp._legacy.amp import auto_mixed_precision
+        else:
+            from mindspore.amp import auto_mixed_precision
+        return auto_mixed_precision(copy.deepcopy(network, memo), amp_level)
 
     def _check_reuse_dataset(self, dataset):
         """Check if dataset is being used by other models under the data sink mode."""
@@ -116,20 +191,47 @@ class Evaluator:
     def _run(self, tgt_columns=None):
         """Evaluating process for non-data sinking mode. The data would be passed to network directly."""
         self.network.set_train(False)
-        with tqdm(total=self.total) as progress:
-            progress.set_description('Evaluate')
-            for data in self.eval_dataset.create_dict_iterator():
-                inputs, tgts = self._data_process(data, tgt_columns)
-                outputs = self.eval_func(inputs)
-                self._update_metrics(outputs, *tgts)
-                progress.update(1)
-
-        progress.close()
+        self.eval_network.set_train(False)
+        self._start_metric_pool()
+        try:
+            with tqdm(total=self.total) as progress:
+                progress.set_description('Evaluate')
+                for data in self.eval_dataset.create_dict_iterator():
+                    inputs, tgts = self._data_process(data, tgt_columns)
+                    outputs = self.eval_func(inputs)
+                    self._update_metrics(outputs, *tgts)
+                    progress.update(1)
+
+            progress.close()
+            self._close_metric_pool()
+        finally:
+            self._terminate_metric_pool()
         metrics_result, metrics_names, metrics_values = self._get_metrics()
 
         print(f'Evaluate Score: {metrics_result}')
         return metrics_result, metrics_names, metrics_values
 
+    def predict(self, output_dir, predict_dataset=None, top_k=None):
+        """
+        Run inference over a dataset and stream the outputs batch by batch to `.npy` files,
+        so that the host memory used does not grow with the dataset size. If the dataset has
+        a `sample_index` column (e.g. from `make_length_sorted_batch`), the outputs are
+        restored to the original order of the samples.
+
+        Args:
+            output_dir (str): Directory of the spooled outputs.
+            predict_dataset (Dataset): A dataset for predicting. If None, `eval_dataset` is used.
+                Default: None.
+            top_k (Union[int, None]): If set, floating outputs are reduced to their `top_k`
+                largest values and indices on device before being spooled. Default: None.
+
+        Returns:
+            - **reader** (PredictionReader) - A lazy, memory-mapped reader over the outputs.
+        """
+        dataset = predict_dataset if predict_dataset is not None else self.eval_dataset
+        self.eval_network.set_train(False)
+        return run_prediction(self.network, dataset, self.eval_func, output_dir, top_k)
+
     def _run_ds_sink(self):
         """Evaluating process for data sinking mode."""
         raise NotImplementedError
@@ -151,11 +253,38 @@ class Evaluator:
         for metric in self.metrics:
             metric.clear()
 
+    def _start_metric_pool(self):
+        """Offload text metrics to worker processes if `metric_workers` is set."""
+        parallel_metrics = [metric for metric in self.metrics if isinstance(metric, PARALLEL_METRICS)]
+        if self.metric_workers <= 0 or not parallel_metrics:
+            self.metric_pool = None
+            return
+        self.metric_pool = MetricPool(parallel_metrics, self.metric_workers)
+        self.metric_pool.start()
+
+    def _close_metric_pool(self):
+        """Wait for offloaded metrics to finish their updates."""
+        if self.metric_pool is None:
+            return
+        metric_pool, self.metric_pool = self.metric_pool, None
+        metric_pool.close()
+
+    def _terminate_metric_pool(self):
+        """Stop the workers of offloaded metrics left running by an error."""
+        if self.metric_pool is None:
+            return
+        self.metric_pool.terminate()
+        self.metric_pool = None
+
     def _update_metrics(self, outputs, *tgts):
         """Update metrics values."""
         logits = outputs[0] if isinstance(outputs, tuple) else outputs
         for metric in self.metrics:
+            if self.metric_pool is not None and isinstance(metric, PARALLEL_METRICS):
+                continue
             metric.update(logits, *tgts)
+        if self.metric_pool is not None:
+            self.metric_pool.update(logits, *tgts)
         return True
 
     def _data_process(self, data, tgt_columns):
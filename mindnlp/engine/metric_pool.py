@@ -0,0 +1,164 @@
+# Copyright 2022 Huawei Technologies Co., Ltd
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ============================================================================
+"""
+Process pool for offloading metric computation.
+"""
+import multiprocessing
+import pickle
+import queue
+from mindspore import Tensor
+from mindnlp.metrics import BleuScore, RougeN, RougeL, EmScore, Distinct
+
+# Metrics whose `update` is pure-Python CPU work and benefit from being offloaded.
+PARALLEL_METRICS = (BleuScore, RougeN, RougeL, EmScore, Distinct)
+# Seconds between checks that a worker is still alive while waiting for its results.
+RESULT_POLL_SECONDS = 1.0
+
+
+def _to_host(value):
+    """Convert Tensors into picklable host objects."""
+    if isinstance(value, Tensor):
+        return value.asnumpy()
+    if isinstance(value, (tuple, list)) and any(isinstance(v, Tensor) for v in value):
+        return type(value)(_to_host(v) for v in value)
+    return value
+
+
+def _metric_worker(metrics, task_queue, result_queue):
+    """Apply queued updates to `metrics` in order until the stop signal arrives."""
+    error = None
+    while True:
+        payload = task_queue.get()
+        if payload is None:
+            break
+        if error is not None:
+            continue
+        try:
+            for inputs in pickle.loads(payload):
+                for metric in metrics:
+                    metric.update(*inputs)
+        except Exception as err: # pylint: disable=broad-except
+            error = err
+    result_queue.put((metrics, error))
+
+
+class MetricPool:
+    r"""
+    Run `update` of metrics in worker processes, so that metric computation overlaps
+    with the forward pass of the next batch.
+
+    Each metric is owned by exactly one worker and receives its updates in the same
+    order as serial execution, so the final results are identical. Updates are buffered
+    and sent to the workers `ipc_batch_size` steps at a time. Every metric is updated with
+    the same inputs, so a buffer is serialized once and the same bytes are queued to each worker.
+
+    Args:
+        metrics (list[Metric]): Metrics to be offloaded.
+        num_workers (int): Number of worker processes. Default: 1.
+        ipc_batch_size (int): Number of steps buffered before sending to workers. Default: 8.
+    """
+
+    def __init__(self, metrics, num_workers=1, ipc_batch_size=8):
+        if num_workers < 1:
+            raise ValueError(f"For `MetricPool`, `num_workers` should be positive, but got {num_workers}.")
+        if ipc_batch_size < 1:
+            raise ValueError(f"For `MetricPool`, `ipc_batch_size` should be positive, "
+                             f"but got {ipc_batch_size}.")
+        self.metrics = list(metrics)
+        self.num_workers = min(num_workers, len(self.metrics))
+        self.ipc_batch_size = ipc_batch_size
+        self._groups = [list(range(i, len(self.metrics), self.num_workers)) for i in range(self.num_workers)]
+        self._buffer = []
+        self._workers = []
+
+    def start(self):
+        """Start worker processes, each holding its own copy of the assigned metrics."""
+        for group in self._groups:
+            task_queue = multiprocessing.Queue()
+            result_queue = multiprocessing.Queue()
+            worker = multiprocessing.Process(target=_metric_worker,
+                                             args=([self.metrics[i] for i in group], task_queue, result_queue),
+                                             daemon=True)
+            worker.start()
+            self._workers.append((worker, task_queue, result_queue))
+
+    def update(self, *inputs):
+        """Queue one step of metric inputs."""
+        self._buffer.append(tuple(_to_host(value) for value in inputs))
+        if len(self._buffer) >= self.ipc_batch_size:
+            self._flush()
+
+    def _flush(self):
+        if not self._buffer:
+            return
+        payload = pickle.dumps(self._buffer, protocol=pickle.HIGHEST_PROTOCOL)
+        for _, task_queue, _ in self._workers:
+            task_queue.put(payload)
+        self._buffer = []
+
+    def terminate(self):
+        """Stop the workers without waiting for queued updates, dropping their results."""
+        for worker, task_queue, result_queue in self._workers:
+            worker.terminate()
+            worker.join()
+            task_queue.close()
+            result_queue.close()
+        self._workers = []
+        self._buffer = []
+
+    @staticmethod
+    def _result(worker, result_queue):
+        """Wait for the result of `worker`, or return None if it exits without one."""
+        while True:
+            alive = worker.is_alive()
+            try:
+                return result_queue.get(timeout=RESULT_POLL_SECONDS)
+            except queue.Empty:
+                # The liveness is read before waiting, so a result sent just before exiting is not missed.
+                if not alive:
+                    return None
+
+    def close(self):
+        """
+        Wait for all queued updates and copy the states computed by the workers back
+        into the given metric objects.
+
+        Returns:
+            - **metrics** (list[Metric]) - Updated metrics, in the order they were given.
+
+        Raises:
+            Exception: The first exception raised by a metric `update` in the workers.
+            RuntimeError: If a worker exits without returning its metrics, e.g. when it is killed.
+        """
+        self._flush()
+        for _, task_queue, _ in self._workers:
+            task_queue.put(None)
+        error = None
+        for group, (worker, _, result_queue) in zip(self._groups, self._workers):
+            result = self._result(worker, result_queue)
+            if result is None:
+                exitcode = worker.exitcode
+                self.terminate()
+                raise RuntimeError(f"For `MetricPool`, a metric worker exited with code {exitcode} "
+                                   f"without returning its metrics.")
+            metrics, worker_error = result
+            worker.join()
+            for idx, metric in zip(group, metrics):
+                self.metrics[idx].__dict__.update(metric.__dict__)
+            error = error or worker_error
+        self._workers = []
+        if error is not None:
+            raise error
+        return self.metrics
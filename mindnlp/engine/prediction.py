@@ -0,0 +1,263 @@
+# Copyright 2022 Huawei Technologies Co., Ltd
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ============================================================================
+"""
+Spooling of prediction outputs to memory-mapped files.
+"""
+import os
+import struct
+from inspect import signature, Parameter
+import numpy as np
+from tqdm.autonotebook import tqdm
+from mindspore import Tensor, ops, mutable
+import mindspore.common.dtype as mstype
+from mindnlp.dataset.utils import SAMPLE_INDEX_COLUMN
+
+_NPY_MAGIC = b'\x93NUMPY\x01\x00'
+# Fixed header size, so that the final shape can be written in place after streaming.
+_NPY_HEADER_SIZE = 256
+
+
+def _write_npy_header(file, dtype, shape):
+    """Write a `.npy` v1.0 header of fixed size at the start of `file`."""
+    header = repr({'descr': np.lib.format.dtype_to_descr(np.dtype(dtype)),
+                   'fortran_order': False,
+                   'shape': tuple(shape)})
+    header_len = _NPY_HEADER_SIZE - len(_NPY_MAGIC) - 2
+    header = header.ljust(header_len - 1) + '\n'
+    file.seek(0)
+    file.write(_NPY_MAGIC + struct.pack('<H', header_len) + header.encode('latin1'))
+
+
+class _NpySpool:
+    """Append batches along the first axis of a `.npy` file."""
+
+    def __init__(self, path):
+        self.path = path
+        self.file = open(path, 'wb') # pylint: disable=consider-using-with
+        self.dtype = None
+        self.sample_shape = None
+        self.num_samples = 0
+
+    def write(self, array):
+        """Append a batch."""
+        array = np.ascontiguousarray(array)
+        if array.ndim == 0:
+            array = array.reshape((1,))
+        if self.dtype is None:
+            self.dtype = array.dtype
+            self.sample_shape = array.shape[1:]
+            _write_npy_header(self.file, self.dtype, (0,) + self.sample_shape)
+        elif array.dtype != self.dtype or array.shape[1:] != self.sample_shape:
+            raise ValueError(f'All batches spooled to `{self.path}` should have the same dtype and sample '
+                             f'shape, expect {self.dtype} {self.sample_shape}, but got {array.dtype} '
+                             f'{array.shape[1:]}.')
+        self.file.write(array.tobytes())
+        self.num_samples += array.shape[0]
+
+    def close(self):
+        """Write the final shape into the header."""
+        if self.dtype is not None:
+            _write_npy_header(self.file, self.dtype, (self.num_samples,) + self.sample_shape)
+        self.file.close()
+
+    def discard(self):
+        """Close and remove the file."""
+        self.file.close()
+        if os.path.exists(self.path):
+            os.remove(self.path)
+
+
+def _reorder_npy(path, index, chunk_size=4096):
+    """Rewrite a `.npy` file so that row `i` is moved to position `index[i]`, one chunk at a time."""
+    src = np.load(path, mmap_mode='r')
+    dst = np.lib.format.open_memmap(path + '.tmp', mode='w+', dtype=src.dtype, shape=src.shape)
+    for start in range(0, src.shape[0], chunk_size):
+        dst[index[start: start + chunk_size]] = src[start: start + chunk_size]
+    dst.flush()
+    del src, dst
+    os.replace(path + '.tmp', path)
+
+
+class PredictionWriter:
+    r"""
+    Stream network outputs batch by batch to `.npy` files in `output_dir`, so that only
+    one batch is held in host memory at a time.
+
+    Each output of the network is written to `output_{i}.npy`. If `top_k` is set, floating
+    outputs are reduced on device first, and written to `output_{i}_values.npy` and
+    `output_{i}_indices.npy`. If the batches come in a different order than the samples
+    (e.g. length-sorted batches), the original position of each sample can be passed to
+    `write`, and the files are reordered when closing.
+
+    Used as a context manager, the files are closed and removed if an error is raised
+    before `close`.
+
+    Args:
+        output_dir (str): Directory of the spooled files.
+        top_k (Union[int, None]): Number of largest entries of the last axis to keep. Default: None.
+    """
+
+    def __init__(self, output_dir, top_k=None):
+        if top_k is not None and top_k < 1:
+            raise ValueError(f"For `PredictionWriter`, `top_k` should be positive, but got {top_k}.")
+        os.makedirs(output_dir, exist_ok=True)
+        self.output_dir = output_dir
+        self.top_k = top_k
+        self.spools = {}
+        self.indices = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is not None:
+            self.discard()
+
+    def _spool(self, name, array):
+        if name not in self.spools:
+            self.spools[name] = _NpySpool(os.path.join(self.output_dir, name + '.npy'))
+        self.spools[name].write(array)
+
+    def write(self, outputs, indices=None):
+        """
+        Append the outputs of one batch.
+
+        Args:
+            outputs (Union[Tensor, tuple[Tensor]]): Outputs of the network.
+            indices (Union[Tensor, np.ndarray, None]): Original positions of the samples in the batch.
+                Default: None.
+        """
+        if indices is not None:
+            self.indices.append(indices.asnumpy() if isinstance(indices, Tensor) else np.asarray(indices))
+        if not isinstance(outputs, (tuple, list)):
+            outputs = (outputs,)
+        for idx, output in enumerate(outputs):
+            name = f'output_{idx}'
+            if self.top_k is not None and isinstance(output, Tensor) and output.dtype in mstype.float_type \
+                and output.ndim > 0 and output.shape[-1] > self.top_k:
+                values, indices = ops.topk(output, self.top_k)
+                self._spool(name + '_values', values.asnumpy())
+                self._spool(name + '_indices', indices.asnumpy())
+            else:
+                self._spool(name, output.asnumpy() if isinstance(output, Tensor) else np.asarray(output))
+
+    def close(self):
+        """
+        Finish spooling.
+
+        Returns:
+            - **reader** (PredictionReader) - A lazy reader over the spooled outputs.
+        """
+        for spool in self.spools.values():
+            spool.close()
+        if self.indices:
+            index = np.concatenate(self.indices)
+            for spool in self.spools.values():
+                if spool.num_samples != index.shape[0]:
+                    raise ValueError(f'The number of indices {index.shape[0]} does not match the number '
+                                     f'of samples {spool.num_samples} spooled to `{spool.path}`.')
+                _reorder_npy(spool.path, index)
+        return PredictionReader(self.output_dir, sorted(self.spools))
+
+    def discard(self):
+        """Close and remove the files spooled so far."""
+        for spool in self.spools.values():
+            spool.discard()
+        self.spools = {}
+        self.indices = []
+
+
+def predict_inputs(network, data):
+    """
+    Select the columns of `data` passed to `network.construct`, by argument name. Arguments
+    with a default value are skipped if their column is missing.
+
+    Args:
+        network (Cell): The network to predict with.
+        data (dict): A row of columns from `create_dict_iterator`.
+
+    Returns:
+        tuple, the inputs of the network.
+    """
+    inputs = ()
+    for arg, param in signature(network.construct).parameters.items():
+        if arg == 'self' or (arg not in data and param.default is not Parameter.empty):
+            continue
+        inputs = inputs + (data[arg],)
+    return mutable(inputs)
+
+
+def run_prediction(network, dataset, predict_fn, output_dir, top_k=None):
+    """
+    Run `predict_fn` over the batches of `dataset` and spool its outputs with a
+    :class:`PredictionWriter`. If the dataset has a `sample_index` column (e.g. from
+    `make_length_sorted_batch`), the outputs are restored to the original order of the samples.
+    If an error is raised, the files spooled so far are removed.
+
+    Args:
+        network (Cell): The network to predict with, set to evaluation mode.
+        dataset (Dataset): A dataset for predicting.
+        predict_fn (Callable): Function from the inputs given by `predict_inputs` to the outputs.
+        output_dir (str): Directory of the spooled outputs.
+        top_k (Union[int, None]): If set, floating outputs are reduced to their `top_k`
+            largest values and indices on device before being spooled. Default: None.
+
+    Returns:
+        - **reader** (PredictionReader) - A lazy, memory-mapped reader over the outputs.
+    """
+    network.set_train(False)
+    with PredictionWriter(output_dir, top_k) as writer:
+        with tqdm(total=dataset.get_dataset_size()) as progress:
+            progress.set_description('Predict')
+            for data in dataset.create_dict_iterator():
+                writer.write(predict_fn(predict_inputs(network, data)), data.get(SAMPLE_INDEX_COLUMN))
+                progress.update(1)
+        return writer.close()
+
+
+class PredictionReader:
+    r"""
+    Lazy reader over outputs spooled by :class:`PredictionWriter`. Files are opened with
+    `np.load(mmap_mode='r')` on first access, so no data is read until it is indexed.
+
+    Args:
+        output_dir (str): Directory of the spooled files.
+        names (Union[list[str], None]): Names of the outputs to read. If None, all `.npy` files
+            in `output_dir` are read. Default: None.
+    """
+
+    def __init__(self, output_dir, names=None):
+        self.output_dir = output_dir
+        if names is None:
+            names = sorted(file[:-len('.npy')] for file in os.listdir(output_dir) if file.endswith('.npy'))
+        self.names = names
+        self._arrays = {}
+
+    def __getitem__(self, key):
+        """Return the memory-mapped array of an output name, or a dict of all outputs of one sample."""
+        if isinstance(key, str):
+            if key not in self._arrays:
+                self._arrays[key] = np.load(os.path.join(self.output_dir, key + '.npy'), mmap_mode='r')
+            return self._arrays[key]
+        return {name: self[name][key] for name in self.names}
+
+    def __len__(self):
+        if not self.names:
+            return 0
+        return len(self[self.names[0]])
+
+    def __iter__(self):
+        for idx in range(len(self)):
+            yield self[idx]
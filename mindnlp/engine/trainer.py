@@ -17,6 +17,9 @@
 """
 Trainer for training.
 """
+import atexit
+import shutil
+import tempfile
 from typing import Optional, List, Union
 from inspect import signature
 from tqdm.autonotebook import tqdm
@@ -30,6 +33,8 @@ from mindnlp.engine.callbacks.callback_manager import CallbackManager, RunContex
 from mindnlp.engine.callbacks.earlystop_callback import EarlyStopCallback
 from mindnlp.engine.callbacks.best_model_callback import BestModelCallback
 from mindnlp.engine.evaluator import Evaluator
+from mindnlp.engine.prediction import run_prediction
+from mindnlp.dataset.sources import set_dataset_epoch
 from mindnlp._legacy.amp import NoLossScaler
 
 from mindnlp.utils import less_min_pynative_first
@@ -66,6 +71,7 @@ class Trainer:
         callbacks (Optional[list[Callback], Callback]): List of callback objects which should be executed
             while training. Default: None.
         jit (bool): Whether use Just-In-Time compile.
+        metric_workers (int): Number of processes used to compute text metrics while evaluating. Default: 0.
 
     """
 
@@ -83,6 +89,7 @@ class Trainer:
         self.args = args
         epochs = kwargs.pop('epochs', None)
         jit = kwargs.pop('jit', False)
+        metric_workers = kwargs.pop('metric_workers', 0)
         check_gradients = kwargs.pop('check_gradients', False)
 
         self.network = network
@@ -105,7 +112,7 @@ class Trainer:
         self.earlystop = False
         if callbacks:
             callbacks = self._prepare_callbacks(callbacks)
-        self._prepare_eval(eval_dataset, metrics, callbacks, jit)
+        self._prepare_eval(eval_dataset, metrics, callbacks, jit, metric_workers)
 
         self.callback_manager = CallbackManager(callbacks)
         self.train_fn = self._prepare_train_func(network, loss_fn, optimizer, self.loss_scaler, check_gradients, jit)
@@ -175,10 +182,10 @@ class Trainer:
             if isinstance(callback, BestModelCallback):
                 raise ValueError("BestModelCallback is not effective when eval_dataset is None.")
 
-    def _prepare_eval(self, eval_dataset, metrics, callbacks, jit):
+    def _prepare_eval(self, eval_dataset, metrics, callbacks, jit, metric_workers=0):
         if eval_dataset is not None and metrics is not None:
             self.evaluator = Evaluator(network=self.network, eval_dataset=eval_dataset, metrics=metrics,
-                                       callbacks=callbacks, jit=jit)
+                                       callbacks=callbacks, jit=jit, metric_workers=metric_workers)
         elif eval_dataset is None and metrics is None:
             if callbacks:
                 self._check_callbacks_type(callbacks)
@@ -238,6 +245,7 @@ class Trainer:
             run_context.cur_step_nums = 0
             if self.earlystop is True:
                 break
+            set_dataset_epoch(self.train_dataset, epoch)
             self.callback_manager.train_epoch_begin(run_context)
             with tqdm(total=total) as progress:
                 progress.set_description(f'Epoch {epoch}')
@@ -376,11 +384,34 @@ class Trainer:
     def evaluate_loop(self):
         """evaluate loop"""
 
-    def predict(self, test_dataset):
-        """predict"""
+    def predict(self, test_dataset, output_dir=None, top_k=None):
+        """
+        Predict the outputs of `test_dataset` and spool them to `.npy` files in `output_dir`.
+
+        Args:
+            test_dataset (Dataset): A dataset for predicting.
+            output_dir (str): Directory of the spooled outputs. Default: None, a new temporary
+                directory, which is removed when the process exits.
+            top_k (Union[int, None]): If set, floating outputs are reduced to their `top_k`
+                largest values and indices on device before being spooled. Default: None.
+
+        Returns:
+            - **reader** (PredictionReader) - A lazy, memory-mapped reader over the outputs.
+        """
+        if output_dir is None:
+            output_dir = tempfile.mkdtemp(prefix='mindnlp_predict_')
+            atexit.register(shutil.rmtree, output_dir, True)
+        return self.predict_loop(test_dataset, output_dir, top_k)
 
     def predict_step(self, inputs, return_loss_only=False):
         """predict step"""
+        if isinstance(inputs, Tensor):
+            inputs = (inputs,)
+        outputs = self.network(*inputs)
+        if return_loss_only and isinstance(outputs, tuple):
+            return outputs[0]
+        return outputs
 
-    def predict_loop(self):
+    def predict_loop(self, test_dataset, output_dir, top_k=None):
         """predict loop"""
+        return run_prediction(self.network, test_dataset, self.predict_step, output_dir, top_k)
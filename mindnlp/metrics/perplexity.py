@@ -16,12 +16,61 @@
 
 import math
 import numpy as np
-from mindspore import Tensor
+import mindspore
+from mindspore import Tensor, ops
 from mindnlp.abc import Metric
 from .utils import _check_value_type, _convert_data_type, _check_onehot_data
 
 
-def perplexity_fn(preds, labels, ignore_label=None):
+def _logits_nll(logits, labels, ignore_label=None):
+    """
+    Computes the summed negative log-likelihood of `labels` under `logits` and the number
+    of counted tokens. For Tensor inputs the log-softmax and gather run on device, and only
+    the two scalars are transferred to the host.
+
+    Args:
+        logits (Union[Tensor, list, np.ndarray]): Unnormalized scores of shape :math:`(..., C)`.
+        labels (Union[Tensor, list, np.ndarray]): Class indices of shape :math:`(...)`.
+        ignore_label (Union[int, None]): Index of an invalid label to be ignored.
+
+    Returns:
+        - **nll** (float) - Summed negative log-likelihood.
+        - **word_num** (int) - Number of counted tokens.
+    """
+    if isinstance(logits, Tensor):
+        if not isinstance(labels, Tensor):
+            labels = Tensor(_convert_data_type(labels))
+        if labels.size != logits.size / logits.shape[-1]:
+            raise RuntimeError(f'`preds` and `labels` should have the same shape, but got `preds` '
+                               f'shape {logits.shape}, label shape {labels.shape}.')
+        logits = logits.astype(mindspore.float32).reshape((-1, logits.shape[-1]))
+        labels = labels.astype(mindspore.int32).reshape((-1,))
+        if ignore_label is not None:
+            mask = (labels != ignore_label).astype(mindspore.int32)
+        else:
+            mask = ops.ones_like(labels)
+        log_probs = ops.log_softmax(logits, -1)
+        target = ops.gather_elements(log_probs, 1, ops.expand_dims(labels * mask, 1)).squeeze(1)
+        nll = -(target * mask.astype(mindspore.float32)).sum()
+        return float(nll.asnumpy()), int(mask.sum().asnumpy())
+
+    logits = _convert_data_type(logits)
+    labels = _convert_data_type(labels)
+    if labels.size != logits.size / logits.shape[-1]:
+        raise RuntimeError(f'`preds` and `labels` should have the same shape, but got `preds` '
+                           f'shape {logits.shape}, label shape {labels.shape}.')
+    logits = logits.astype(np.float64).reshape((-1, logits.shape[-1]))
+    labels = labels.astype(int).reshape((-1,))
+    mask = labels != ignore_label if ignore_label is not None else np.ones_like(labels, dtype=bool)
+    logits = logits[mask]
+    labels = labels[mask]
+    max_logits = logits.max(axis=-1, keepdims=True)
+    log_norm = np.log(np.exp(logits - max_logits).sum(axis=-1)) + max_logits[:, 0]
+    nll = np.sum(log_norm - logits[np.arange(labels.size), labels])
+    return float(nll), int(labels.size)
+
+
+def perplexity_fn(preds, labels, ignore_label=None, from_logits=False):
     r"""
     Calculates the perplexity. Perplexity is a measure of how well a probabilibity model
     predicts a sample. A low perplexity indicates the model is good at predicting the
@@ -44,6 +93,9 @@ def perplexity_fn(preds, labels, ignore_label=None):
         ignore_label (Union[int, None]): Index of an invalid label to be ignored
             when counting. If set to `None`, it means there's no invalid label.
             Default: None.
+        from_logits (bool): Whether `preds` are unnormalized logits. If True, `labels` must be
+            class indices of shape :math:`(N,)` and the log-softmax is computed on device
+            for Tensor inputs. Default: False.
 
     Returns:
         - **ppl** (float) - The computed result.
@@ -71,6 +123,13 @@ def perplexity_fn(preds, labels, ignore_label=None):
     preds = _check_value_type("preds", preds, [Tensor, list, np.ndarray])
     labels = _check_value_type("labels", labels, [Tensor, list, np.ndarray])
 
+    if from_logits:
+        sum_cross_entropy, sum_word_num = _logits_nll(preds, labels, ignore_label)
+        if sum_word_num == 0:
+            raise RuntimeError(f'Perplexity can not be calculated, because the number of samples is '
+                               f'{0}')
+        return math.exp(sum_cross_entropy / sum_word_num)
+
     y_pred = [_convert_data_type(preds)]
     y_true = [_convert_data_type(labels)]
 
@@ -129,6 +188,10 @@ class Perplexity(Metric):
         ignore_label (Union[int, None]): Index of an invalid label to be ignored when counting.
             If set to `None`, it means there's no invalid label. Default: None.
         name (str): Name of the metric.
+        from_logits (bool): Whether `preds` are unnormalized logits. If True, the log-softmax and
+            label gather are computed on device for Tensor inputs, and only the summed negative
+            log-likelihood and the token count are accumulated, so the :math:`(N, C)` scores are
+            never transferred to the host. `labels` must then be class indices. Default: False.
 
     Examples:
         >>> import numpy as np
@@ -144,9 +207,10 @@ class Perplexity(Metric):
         2.231443166940565
 
     """
-    def __init__(self, ignore_label=None, name='Perplexity'):
+    def __init__(self, ignore_label=None, name='Perplexity', from_logits=False):
         super().__init__()
         self._name = name
+        self.from_logits = _check_value_type("from_logits", from_logits, [bool])
 
         if ignore_label is not None:
             self.ignore_label = _check_value_type("ignore_label", ignore_label, [int])
@@ -169,9 +233,9 @@ class Perplexity(Metric):
             inputs: Input `preds` and `labels`.
 
                 - preds (Union[Tensor, list, np.ndarray]): Predicted value. `preds` is a list
-                  of floating numbers in range :math:`[0, 1]` and the shape of `preds` is
-                  :math:`(N, C)` in most cases (not strictly), where :math:`N` is the
-                  number of cases and :math:`C` is the number of categories.
+                  of floating numbers in range :math:`[0, 1]` (or logits if `from_logits` is True)
+                  and the shape of `preds` is :math:`(N, C)` in most cases (not strictly), where
+                  :math:`N` is the number of cases and :math:`C` is the number of categories.
                 - labels (Union[Tensor, list, np.ndarray]): Ground truth. `labels` must be in
                   one-hot format that shape is :math:`(N, C)`, or can be transformed to
                   one-hot format that shape is :math:`(N,)`.
@@ -192,6 +256,12 @@ class Perplexity(Metric):
         preds = _check_value_type("preds", preds, [Tensor, list, np.ndarray])
         labels = _check_value_type("labels", labels, [Tensor, list, np.ndarray])
 
+        if self.from_logits:
+            cross_entropy, word_num = _logits_nll(preds, labels, self.ignore_label)
+            self.sum_cross_entropy += cross_entropy
+            self.sum_word_num += word_num
+            return
+
         y_pred = [_convert_data_type(preds)]
         y_true = [_convert_data_type(labels)]
 
@@ -22,13 +22,15 @@ from itertools import islice
 import numpy as np
 from mindspore import ops
 from mindspore import Tensor
-from mindnlp.utils import cache_file, unzip
+from mindnlp.utils import cache_file, open_member
 from mindnlp.abc.modules.embedding import TokenEmbedding
+from mindnlp.modules.embeddings.vectors import load_vectors, pretrained_matrix, vocab_matrix
 from mindnlp.configs import DEFAULT_ROOT
 from mindnlp._legacy.nn import Dropout
 
 JSON_FILENAME = 'glove_hyper.json'
-EMBED_FILENAME = 'glove.txt'
+EMBED_FILENAME = 'glove.npy'
+TEXT_EMBED_FILENAME = 'glove.txt'
 logging.getLogger().setLevel(logging.INFO)
 
 
@@ -68,7 +70,8 @@ class Glove(TokenEmbedding):
         self.dropout_p = dropout
 
     @classmethod
-    def from_pretrained(cls, name='6B', dims=300, root=DEFAULT_ROOT, special_first=True, **kwargs):
+    def from_pretrained(cls, name='6B', dims=300, root=DEFAULT_ROOT, special_first=True, ids=None, vocab=None,
+                        **kwargs):
         r"""
         Creates Embedding instance from given pre-trained word vector.
 
@@ -79,6 +82,13 @@ class Glove(TokenEmbedding):
             special_first (bool): Indicates whether special participles from special_tokens will be added to
                 the top of the dictionary. If True, add special_tokens to the beginning of the dictionary,
                 otherwise add them to the end. Default: True.
+            ids (Union[Sequence[int], numpy.ndarray]): If set, only these rows, numbered as by
+                `Vocab.from_pretrained` with the same `special_first`, are copied to the embedding,
+                in this order. Default: None, all rows.
+            vocab (Union[Vocab, mindspore.dataset.text.Vocab]): If set, the embedding only holds the rows
+                of the tokens of this task vocab, row `i` for the token of id `i`, so the vocab looks up
+                the embedding as it is. '<pad>' and '<unk>' get zero rows, and other tokens missing from
+                the pretrained vectors get random rows. `special_first` and `ids` are ignored. Default: None.
             kwargs (dict):
                 - requires_grad (bool): Whether this parameter needs to be gradient to update.
                 - dropout (float): Dropout of the output of Embedding.
@@ -97,26 +107,20 @@ class Glove(TokenEmbedding):
         download_file_name = re.sub(r".+/", "", url)
         glove_file_name = f"glove.{name}.{dims}d.txt"
         path, _ = cache_file(filename=download_file_name, cache_dir=cache_dir, url=url)
-        decompress_path = os.path.join(cache_dir, glove_file_name)
-        if not os.path.exists(decompress_path):
-            unzip(path, cache_dir)
-
         glove_file_path = os.path.join(cache_dir, glove_file_name)
+        source_path = glove_file_path if os.path.exists(glove_file_path) else path
 
-        embeddings = []
-        with open(glove_file_path, encoding='utf-8') as file:
-            for line in file:
-                _, embedding = line.split(maxsplit=1)
-                embeddings.append(np.fromstring(embedding, dtype=np.float32, sep=' '))
+        def open_file():
+            if source_path == glove_file_path:
+                return glove_file_path
+            return open_member(path, glove_file_name, 'r')
 
-        if special_first:
-            embeddings.insert(0, np.random.rand(dims))
-            embeddings.insert(1, np.zeros((dims,), np.float32))
+        # The text vectors are parsed once into a binary cache, which later calls memory-map.
+        vectors_vocab, vectors = load_vectors(os.path.join(cache_dir, glove_file_name), source_path, open_file)
+        if vocab is not None:
+            embeddings = vocab_matrix(vectors_vocab, vectors, vocab)
         else:
-            embeddings.append(np.random.rand(dims))
-            embeddings.append(np.zeros((dims,), np.float32))
-
-        embeddings = np.array(embeddings).astype(np.float32)
+            embeddings = pretrained_matrix(vectors, special_first, ids)
 
         requires_grad = kwargs.get('requires_grad', True)
         dropout = kwargs.get('dropout', 0.0)
@@ -155,11 +159,6 @@ class Glove(TokenEmbedding):
         folder = os.path.join(root, 'embeddings', 'Glove', 'save', foldername)
         os.makedirs(folder, exist_ok=True)
 
-        embed = self.embed
-        embed_list = embed
-        nums = self._embed_len
-        dims = self._embed_dim
-
         kwargs = {}
         kwargs['dropout'] = kwargs.get('dropout', self.dropout_p)
         kwargs['requires_grad'] = kwargs.get('requires_grad', self.requires_grad)
@@ -167,15 +166,7 @@ class Glove(TokenEmbedding):
         with open(os.path.join(folder, JSON_FILENAME), 'w', encoding='utf-8') as file:
             json.dump(kwargs, file, indent=2)
 
-        with open(os.path.join(folder, EMBED_FILENAME), 'w', encoding='utf-8') as file:
-            file.write(f'{" " * 30}\n')
-            for i in range(0, nums):
-                embed_write = list(embed_list[i])
-                vec_write = ' '.join(map(str, embed_write))
-                file.write(f'{vec_write}\n')
-
-            file.seek(0)
-            file.write(f'{nums} {dims}')
+        np.save(os.path.join(folder, EMBED_FILENAME), self.embed.asnumpy())
 
         logging.info('Embedding has been saved to %s', folder)
 
@@ -202,19 +193,25 @@ class Glove(TokenEmbedding):
             return cls(Tensor(load_embed))
 
         folder = os.path.join(root, 'embeddings', 'Glove', 'save', foldername)
-        for name in [JSON_FILENAME, EMBED_FILENAME]:
-            assert os.path.exists(os.path.join(folder, name)), f"{name} not found in {folder}."
+        assert os.path.exists(os.path.join(folder, JSON_FILENAME)), f"{JSON_FILENAME} not found in {folder}."
+        npy_path = os.path.join(folder, EMBED_FILENAME)
+        if not os.path.exists(npy_path):
+            assert os.path.exists(os.path.join(folder, TEXT_EMBED_FILENAME)), \
+                f"{EMBED_FILENAME} not found in {folder}."
 
         with open(os.path.join(folder, JSON_FILENAME), 'r', encoding='utf-8') as file:
             hyper = json.load(file)
 
-        embeddings = []
-        with open(os.path.join(folder, EMBED_FILENAME), encoding='utf-8') as file:
-            for line in islice(file, 1, None):
-                embedding = line.rstrip('\n')
-                embeddings.append(np.fromstring(embedding, dtype=np.float32, sep=' '))
+        if os.path.exists(npy_path):
+            embeddings = np.load(npy_path)
+        else:
+            embeddings = []
+            with open(os.path.join(folder, TEXT_EMBED_FILENAME), encoding='utf-8') as file:
+                for line in islice(file, 1, None):
+                    embedding = line.rstrip('\n')
+                    embeddings.append(np.fromstring(embedding, dtype=np.float32, sep=' '))
 
-        embeddings = np.array(embeddings).astype(np.float32)
+            embeddings = np.array(embeddings).astype(np.float32)
 
         logging.info("Load embedding from %s", folder)
 
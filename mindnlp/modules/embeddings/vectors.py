@@ -0,0 +1,301 @@
+# Copyright 2022 Huawei Technologies Co., Ltd
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ============================================================================
+"""Binary cache of pretrained word vectors"""
+
+import io
+import multiprocessing
+import os
+import shutil
+from itertools import islice
+import numpy as np
+from mindnlp.vocab import Vocab
+
+# Number of lines parsed at once.
+PARSE_CHUNK_LINES = 8192
+# Size of the byte ranges of a file parsed by each process.
+PARALLEL_CHUNK_BYTES = 64 << 20
+
+
+def _parse_lines(lines, dims=None):
+    """
+    Parse lines of `token v1 v2 ...` into tokens and a float32 matrix of `dims` columns, by default
+    the number of values of the first line. The values of a row are its last `dims` fields, so
+    tokens may contain spaces.
+    """
+    tokens = []
+    values = []
+    for line in lines:
+        fields = line.rstrip().split(' ')
+        if dims is None:
+            dims = len(fields) - 1
+        if len(fields) <= dims:
+            raise ValueError(f'Rows of the word vectors should have {dims} values, '
+                             f'but got {len(fields) - 1} in the row {line[:50]!r}.')
+        tokens.append(' '.join(fields[:-dims]))
+        values.extend(fields[-dims:])
+    vectors = np.fromstring(' '.join(values), dtype=np.float32, sep=' ')
+    if vectors.size != len(lines) * dims:
+        raise ValueError('Values of the word vectors should all be numbers separated by single spaces.')
+    return tokens, vectors.reshape(len(lines), dims)
+
+
+def _write_npy(raw_path, npy_path, shape):
+    """Prepend a .npy header of float32 `shape` to the raw rows at `raw_path`."""
+    with open(npy_path, 'wb') as out_file:
+        np.lib.format.write_array_header_1_0(
+            out_file, {'descr': np.lib.format.dtype_to_descr(np.dtype(np.float32)),
+                       'fortran_order': False, 'shape': shape})
+        with open(raw_path, 'rb') as raw_file:
+            shutil.copyfileobj(raw_file, out_file, 1 << 20)
+
+
+def _range_rows(path, start, end, at_eof):
+    """Number of lines in the byte range `[start, end)` of the file at `path`."""
+    count = 0
+    last = b'\n'
+    with open(path, 'rb') as file:
+        file.seek(start)
+        remaining = end - start
+        while remaining > 0:
+            block = file.read(min(remaining, 1 << 20))
+            if not block:
+                break
+            count += block.count(b'\n')
+            last = block[-1:]
+            remaining -= len(block)
+    return count + (at_eof and last != b'\n')
+
+
+def _parse_range(path, start, end, npy_path, row_start, num_rows):
+    """
+    Parse the lines in the byte range `[start, end)` of the file at `path` into rows
+    `[row_start, row_start + num_rows)` of the memory-mapped matrix at `npy_path`.
+
+    Returns the tokens of the lines, or None if the text has line breaks other than `\\n`
+    and `\\r\\n`, which split lines differently from the byte ranges.
+    """
+    with open(path, 'rb') as file:
+        file.seek(start)
+        text = file.read(end - start).decode('utf-8')
+    matrix = np.load(npy_path, mmap_mode='r+')
+    tokens = []
+    lines = io.StringIO(text, newline=None)
+    while True:
+        chunk = list(islice(lines, PARSE_CHUNK_LINES))
+        if not chunk:
+            break
+        if len(tokens) + len(chunk) > num_rows:
+            return None
+        chunk_tokens, vectors = _parse_lines(chunk, matrix.shape[1])
+        matrix[row_start + len(tokens):row_start + len(tokens) + len(chunk_tokens)] = vectors
+        tokens.extend(chunk_tokens)
+    matrix.flush()
+    return tokens if len(tokens) == num_rows else None
+
+
+def _convert_parallel(path, npy_path, skip_header, num_workers):
+    """
+    Parse the text file at `path` into `npy_path` with a pool of `num_workers` processes.
+
+    The file is divided into byte ranges ending at newlines. Lines are counted per range
+    first, then each process parses its range and writes the rows straight into their
+    place in the memory-mapped matrix, so the parts are never copied to be concatenated.
+
+    Returns the tokens, or None if the file should be parsed serially instead.
+    """
+    size = os.path.getsize(path)
+    with open(path, 'rb') as file:
+        if skip_header:
+            file.readline()
+        data_start = file.tell()
+        first_line = file.readline().decode('utf-8')
+        num_chunks = min(num_workers * 4, -(-(size - data_start) // PARALLEL_CHUNK_BYTES))
+        if not first_line.strip() or num_chunks < 2:
+            return None
+        bounds = [data_start]
+        for index in range(1, num_chunks):
+            file.seek(data_start + (size - data_start) * index // num_chunks - 1)
+            file.readline()
+            if bounds[-1] < file.tell() < size:
+                bounds.append(file.tell())
+        bounds.append(size)
+    ranges = list(zip(bounds[:-1], bounds[1:]))
+    dims = _parse_lines([first_line])[1].shape[1]
+
+    with multiprocessing.Pool(min(num_workers, len(ranges))) as pool:
+        counts = pool.starmap(_range_rows, [(path, start, end, end == size) for start, end in ranges])
+        offsets = np.cumsum([0] + counts)
+        np.lib.format.open_memmap(npy_path, mode='w+', dtype=np.float32, shape=(int(offsets[-1]), dims)).flush()
+        parts = pool.starmap(_parse_range, [(path, start, end, npy_path, int(row_start), count)
+                                            for (start, end), row_start, count in zip(ranges, offsets, counts)])
+    if any(part is None for part in parts):
+        os.remove(npy_path)
+        return None
+    return [token for part in parts for token in part]
+
+
+def _convert_serial(file, npy_path, raw_path, skip_header):
+    """Parse the open text file `file` chunk by chunk into `npy_path`, returning the tokens."""
+    tokens = []
+    dims = None
+    with file, open(raw_path, 'wb') as raw_file:
+        if skip_header:
+            file.readline()
+        while True:
+            lines = list(islice(file, PARSE_CHUNK_LINES))
+            if not lines:
+                break
+            chunk_tokens, vectors = _parse_lines(lines, dims)
+            dims = vectors.shape[1]
+            tokens.extend(chunk_tokens)
+            raw_file.write(vectors.tobytes())
+    try:
+        _write_npy(raw_path, npy_path, (len(tokens), dims or 0))
+    finally:
+        os.remove(raw_path)
+    return tokens
+
+
+def convert_vectors(file, cache_path, skip_header=False, num_workers=None):
+    """
+    Parse a text file of word vectors once into the binary cache read by `load_vectors`:
+    a float32 `<cache_path>.npy` and the tokens as a :class:`mindnlp.vocab.Vocab`
+    saved to `<cache_path>.vocab`. Rows are parsed in chunks and streamed to disk,
+    so memory does not grow with the size of the file.
+
+    A file larger than `PARALLEL_CHUNK_BYTES` is parsed by a pool of processes, each parsing
+    a range of lines into its rows of the matrix. The result is identical to parsing it serially.
+    An open file, such as a member of an archive, is first extracted to a temporary file next to
+    the cache, whose byte ranges the processes read.
+
+    Args:
+        file (Union[str, TextIO]): Path or open file of lines of a token followed by its vector.
+        cache_path (str): Path prefix of the cache files.
+        skip_header (bool): Whether the first line is a `count dims` header. Default: False.
+        num_workers (int): Number of processes parsing the file. Default: None, the number of CPUs.
+    """
+    suffix = f'.tmp{os.getpid()}'
+    npy_path = cache_path + '.npy' + suffix
+    num_workers = num_workers or os.cpu_count() or 1
+    text_path = None
+    if not isinstance(file, str) and num_workers > 1:
+        text_path = cache_path + '.txt' + suffix
+        with file, open(text_path, 'w', encoding='utf-8', newline='') as text_file:
+            shutil.copyfileobj(file, text_file, 1 << 20)
+        file = text_path
+    tokens = None
+    try:
+        if isinstance(file, str):
+            if num_workers > 1:
+                tokens = _convert_parallel(file, npy_path, skip_header, num_workers)
+            if tokens is None:
+                file = open(file, encoding='utf-8') # pylint: disable=consider-using-with
+        if tokens is None:
+            tokens = _convert_serial(file, npy_path, cache_path + '.raw' + suffix, skip_header)
+    finally:
+        if text_path is not None:
+            os.remove(text_path)
+    vocab = Vocab.__new__(Vocab)
+    vocab._set_tokens([token.encode('utf-8') for token in tokens]) # pylint: disable=protected-access
+    vocab.save(cache_path + '.vocab' + suffix)
+    if os.path.exists(cache_path + '.vocab'):
+        shutil.rmtree(cache_path + '.vocab')
+    os.replace(cache_path + '.vocab' + suffix, cache_path + '.vocab')
+    # The matrix is moved last, so its presence marks a complete cache.
+    os.replace(npy_path, cache_path + '.npy')
+
+
+def load_vectors(cache_path, source_path, open_file, skip_header=False):
+    """
+    Load word vectors from the binary cache at `cache_path`, converting them from the
+    text file first if the cache is missing or older than `source_path`.
+
+    Args:
+        cache_path (str): Path prefix of the cache files.
+        source_path (str): Path of the downloaded text file or archive.
+        open_file (Callable): Function returning the text file, or its path if it is a plain file,
+            called only to convert it.
+        skip_header (bool): Whether the first line is a `count dims` header. Default: False.
+
+    Returns:
+        - **vocab** (Vocab) - Tokens of the rows.
+        - **vectors** (numpy.memmap) - Read-only float32 matrix of the rows.
+    """
+    npy_path = cache_path + '.npy'
+    if not os.path.exists(npy_path) or os.path.getmtime(npy_path) < os.path.getmtime(source_path):
+        convert_vectors(open_file(), cache_path, skip_header)
+    return Vocab.load(cache_path + '.vocab'), np.load(npy_path, mmap_mode='r')
+
+
+def pretrained_matrix(vectors, special_first=True, ids=None):
+    """
+    Copy pretrained vectors into an embedding matrix with two special rows, a random
+    one and a zero one, before or after them.
+
+    Args:
+        vectors (numpy.ndarray): Pretrained vectors, possibly memory-mapped.
+        special_first (bool): Whether the special rows come first. Default: True.
+        ids (Union[Sequence[int], numpy.ndarray]): If set, only these rows of the full matrix are
+            copied, in this order. Default: None, all rows.
+
+    Returns:
+        numpy.ndarray, the float32 embedding matrix.
+    """
+    num, dims = vectors.shape
+    offset = 2 if special_first else 0
+    special_ids = np.array([0, 1]) if special_first else np.array([num, num + 1])
+    ids = np.arange(num + 2) if ids is None else np.asarray(ids, dtype=np.int64)
+    if ids.size and (ids.min() < 0 or ids.max() >= num + 2):
+        raise ValueError(f'`ids` should be in [0, {num + 2}), but got {ids.min()} to {ids.max()}.')
+    matrix = np.empty((len(ids), dims), dtype=np.float32)
+    rows = ids - offset
+    is_vector = (rows >= 0) & (rows < num)
+    matrix[is_vector] = vectors[rows[is_vector]]
+    matrix[ids == special_ids[0]] = np.random.rand(dims)
+    matrix[ids == special_ids[1]] = 0
+    return matrix
+
+
+def vocab_matrix(vectors_vocab, vectors, vocab, special_tokens=('<pad>', '<unk>')):
+    """
+    Gather the pretrained vectors of the tokens of a task vocab into an embedding matrix whose
+    row `i` belongs to the token of id `i` in `vocab`, reading only their rows. Special tokens
+    get zero rows, as the padding row of `pretrained_matrix`, and other tokens missing from the
+    pretrained vectors get random rows. Ids without a token get zero rows.
+
+    Args:
+        vectors_vocab (Vocab): Tokens of the rows of `vectors`.
+        vectors (numpy.ndarray): Pretrained vectors, possibly memory-mapped.
+        vocab (Union[Vocab, mindspore.dataset.text.Vocab]): Task vocab, such as one built by
+            `Vocab.from_dataset`.
+        special_tokens (Sequence[str]): Tokens given zero rows. Default: ('<pad>', '<unk>').
+
+    Returns:
+        numpy.ndarray, the float32 embedding matrix, with one row per id of `vocab`.
+    """
+    token_dict = vocab.vocab if isinstance(vocab, Vocab) else vocab.vocab()
+    tokens = list(token_dict)
+    ids = np.fromiter(token_dict.values(), dtype=np.int64, count=len(tokens))
+    rows = np.asarray(vectors_vocab.lookup_ids(tokens, unk_id=-1), dtype=np.int64).reshape(-1)
+    is_special = np.array([token in special_tokens for token in tokens], dtype=bool)
+    found = (rows >= 0) & ~is_special
+    matrix = np.zeros((int(ids.max()) + 1 if ids.size else 0, vectors.shape[1]), dtype=np.float32)
+    if found.any():
+        # Rows are read in file order, which keeps reads of a memory-mapped file sequential.
+        order = np.argsort(rows[found], kind='stable')
+        matrix[ids[found][order]] = vectors[rows[found][order]]
+    missing = ids[(rows < 0) & ~is_special]
+    matrix[missing] = np.random.rand(len(missing), vectors.shape[1])
+    return matrix
@@ -29,10 +29,14 @@ else:
 
 from mindnlp.transforms.lookup import Lookup
 from mindnlp.transforms.tokenizers import BasicTokenizer
-from mindnlp.transforms.pad_transform import PadTransform
+from mindnlp.transforms.pad_transform import PadTransform, pad_sequences
+from mindnlp.transforms.html_cleaner import HTMLCleaner
+from mindnlp.transforms.text_to_ids import TextToIds
+from mindnlp.transforms.alignment import char_span_to_token_span, align_word_labels
 
 __all__ = [
-    'Truncate', 'AddToken', 'Lookup', 'PadTransform', 'BasicTokenizer',
+    'Truncate', 'AddToken', 'Lookup', 'PadTransform', 'pad_sequences', 'BasicTokenizer', 'HTMLCleaner',
+    'TextToIds', 'char_span_to_token_span', 'align_word_labels',
 ]
 
 from .tokenizers import *
@@ -0,0 +1,91 @@
+# Copyright 2023 Huawei Technologies Co., Ltd
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ============================================================================
+"""Alignment of tokens to characters and words"""
+
+import numpy as np
+
+
+def char_span_to_token_span(offsets, start_char, end_char):
+    """
+    Find the tokens covering a character span, such as the answer of a question, from the
+    character offsets returned by a tokenizer with `return_offsets`, without tokenizing again.
+
+    The span of a row is from its first to its last token overlapping `[start_char, end_char)`.
+    Tokens with empty offsets, such as special tokens and padding, are never part of a span.
+
+    Args:
+        offsets (numpy.ndarray): Int (start, end) character offsets of the tokens, of shape
+            (..., num tokens, 2), such as the offsets of one text or of a padded batch.
+        start_char (Union[int, numpy.ndarray]): Start of the span of each row, of shape (...).
+        end_char (Union[int, numpy.ndarray]): Exclusive end of the span of each row, of shape (...).
+
+    Returns:
+        - **start** (numpy.ndarray) - Int32 index of the first token of the span, of shape (...),
+          or -1 if no token overlaps the span, e.g. when it was truncated.
+        - **end** (numpy.ndarray) - Int32 index of the last token of the span, of shape (...), or -1.
+
+    Examples:
+        >>> offsets = np.array([[0, 0], [0, 5], [6, 11], [11, 12], [0, 0]])
+        >>> start, end = char_span_to_token_span(offsets, 6, 12)
+        >>> print(start, end)
+        2 3
+    """
+    offsets = np.asarray(offsets)
+    start_char = np.expand_dims(np.asarray(start_char), -1)
+    end_char = np.expand_dims(np.asarray(end_char), -1)
+    starts, ends = offsets[..., 0], offsets[..., 1]
+    hits = (ends > starts) & (starts < end_char) & (ends > start_char)
+    found = hits.any(axis=-1)
+    start = np.where(found, hits.argmax(axis=-1), -1)
+    end = np.where(found, hits.shape[-1] - 1 - hits[..., ::-1].argmax(axis=-1), -1)
+    return start.astype(np.int32), end.astype(np.int32)
+
+
+def align_word_labels(word_ids, labels, ignore_index=-100, first_token_only=True):
+    """
+    Spread labels of words, such as NER tags, to the tokens of the words, from the word ids
+    returned by a tokenizer with `return_word_ids`.
+
+    Args:
+        word_ids (numpy.ndarray): Int word ids of the tokens, -1 for tokens without a word,
+            of shape (..., num tokens).
+        labels (numpy.ndarray): Int labels of the words, of shape (..., num words).
+        ignore_index (int): Label of tokens without a word, and of the following tokens of
+            a word if `first_token_only` is True. Default: -100.
+        first_token_only (bool): Whether only the first token of a word gets its label.
+            Default: True.
+
+    Returns:
+        numpy.ndarray, the labels of the tokens, of the shape of `word_ids`.
+
+    Raises:
+        ValueError: If a word id is not less than the number of labels.
+
+    Examples:
+        >>> word_ids = np.array([-1, 0, 1, 1, -1])
+        >>> print(align_word_labels(word_ids, np.array([3, 5])))
+        [-100    3    5 -100 -100]
+    """
+    word_ids = np.asarray(word_ids)
+    labels = np.asarray(labels)
+    if word_ids.size and word_ids.max() >= labels.shape[-1]:
+        raise ValueError(f"For `align_word_labels`, word ids should be less than the number of labels "
+                         f"{labels.shape[-1]}, but got {word_ids.max()}.")
+    has_word = word_ids >= 0
+    if first_token_only:
+        previous = np.concatenate([np.full_like(word_ids[..., :1], -1), word_ids[..., :-1]], axis=-1)
+        has_word &= word_ids != previous
+    token_labels = np.take_along_axis(labels, np.where(word_ids >= 0, word_ids, 0), axis=-1)
+    return np.where(has_word, token_labels, ignore_index).astype(labels.dtype)
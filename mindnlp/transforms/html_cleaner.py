@@ -0,0 +1,89 @@
+# Copyright 2022 Huawei Technologies Co., Ltd
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ============================================================================
+"""HTMLCleaner transform"""
+import html
+import re
+import numpy as np
+from mindspore.dataset.transforms.transforms import PyTensorOperation
+from mindspore.dataset.text.transforms import Implementation
+
+_HTML_TAG = re.compile(r'<[^>]+>')
+
+
+class HTMLCleaner(PyTensorOperation):
+    """
+    Clean text scraped from web pages: replace backslashes with spaces, unescape HTML entities
+    and remove HTML tags. Entities are unescaped first, so escaped tags like `&lt;br /&gt;` are
+    removed as well.
+
+    The transform is stateless and picklable, so it can run in parallel inside
+    `dataset.map(..., num_parallel_workers=N, python_multiprocessing=True)`.
+
+    Args:
+        replace_backslash (bool): Whether to replace backslashes with spaces. Default: True.
+        remove_tags (bool): Whether to remove HTML tags. Default: True.
+
+    Supported Platforms:
+        ``CPU``
+
+    Examples:
+        >>> from mindspore.dataset import NumpySlicesDataset
+        >>> from mindnlp.transforms import HTMLCleaner
+        >>> dataset = NumpySlicesDataset(data={"text": ["a &amp; b<br />c\\\\d"]})
+        >>> dataset = dataset.map(HTMLCleaner(), 'text')
+        >>> print(next(dataset.create_tuple_iterator(output_numpy=True))[0])
+        a & bc d
+    """
+
+    def __init__(self, replace_backslash: bool = True, remove_tags: bool = True):
+        super().__init__()
+        self.replace_backslash = replace_backslash
+        self.remove_tags = remove_tags
+        self.implementation = Implementation.PY
+
+    def __call__(self, text_input):
+        """
+        Call method for input conversion for eager mode with C++ implementation.
+        """
+        if isinstance(text_input, str):
+            text_input = np.array(text_input)
+        elif not isinstance(text_input, np.ndarray):
+            raise TypeError(
+                f"Input should be a text line in 0-D or 1-D ndarray contains string, got {type(text_input)}.")
+        return super().__call__(text_input)
+
+    def execute_py(self, text_input):
+        """
+        Execute method.
+        """
+        return self._execute_py(text_input)
+
+    def _clean(self, text):
+        if self.replace_backslash and '\\' in text:
+            text = text.replace('\\', ' ')
+        if '&' in text:
+            text = html.unescape(text)
+        if self.remove_tags and '<' in text and '>' in text:
+            text = _HTML_TAG.sub('', text)
+        return text
+
+    def _execute_py(self, text_input):
+        """
+        Execute method.
+        """
+        text_input = np.asarray(text_input)
+        if text_input.ndim == 0:
+            return np.array(self._clean(str(text_input)))
+        return np.array([self._clean(str(text)) for text in text_input.reshape(-1)]).reshape(text_input.shape)
@@ -53,7 +53,7 @@ class Lookup(TextTensorOperation):
     def __init__(self, vocab, unk_token, return_dtype=mstype.int32):
         super().__init__()
         if isinstance(vocab, nlpVocab):
-            self._vocab = cde.Vocab.from_dict(vocab._token_dict)
+            self._vocab = cde.Vocab.from_dict(vocab.vocab)
         elif isinstance(vocab, msVocab):
             self._vocab = vocab.c_vocab
         else:
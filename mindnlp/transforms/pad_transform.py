@@ -12,7 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 # ============================================================================
-"""AddToken transform"""
+"""PadTransform transform"""
 import numpy as np
 from mindspore.dataset.transforms.transforms import PyTensorOperation
 from mindspore.dataset.text.transforms import Implementation
@@ -67,11 +67,74 @@ class PadTransform(PyTensorOperation):
         text_input = text_input[:self.max_length]
         text_length = len(text_input)
 
-        pad_value = np.array([self.pad_value] * (self.max_length - text_length), text_input.dtype)
-        text_output = np.concatenate([text_input, pad_value], 0)
+        text_output = np.full((self.max_length,), self.pad_value, dtype=text_input.dtype)
+        text_output[:text_length] = text_input
 
         if self.return_length:
             length = np.array(text_length)
             return text_output, length
 
         return text_output
+
+    def pad_batch(self, sequences, offsets=None):
+        """
+        Truncate and pad a whole batch at once with `pad_sequences`.
+
+        Args:
+            sequences (Union[Sequence, numpy.ndarray]): Ragged rows, or their concatenated values if
+                `offsets` is set.
+            offsets (numpy.ndarray): Start of each row in `sequences`, followed by their end. Default: None.
+
+        Returns:
+            - **padded** (numpy.ndarray) - Rows of shape (batch size, `max_length`).
+            - **lengths** (numpy.ndarray) - Int32 lengths of the rows before padding,
+              returned if `return_length` is True.
+        """
+        padded, lengths = pad_sequences(sequences, self.max_length, self.pad_value, offsets)
+        if self.return_length:
+            return padded, lengths
+        return padded
+
+
+def pad_sequences(sequences, max_length=None, pad_value=0, offsets=None, dtype=None):
+    """
+    Truncate and pad ragged rows into one preallocated (batch size, length) array, filled
+    in a single vectorized pass instead of padding and stacking row by row.
+
+    Args:
+        sequences (Union[Sequence, numpy.ndarray]): Ragged rows, or their concatenated values if
+            `offsets` is set.
+        max_length (int): If set, rows are truncated and padded to this length, otherwise
+            padded to the longest row. Default: None.
+        pad_value (Union[int, float]): Value to pad the rows with. Default: 0.
+        offsets (numpy.ndarray): Start of each row in `sequences`, followed by their end. Default: None.
+        dtype (numpy.dtype): Data type of the output. Default: None, that of the values.
+
+    Returns:
+        - **padded** (numpy.ndarray) - The padded rows.
+        - **lengths** (numpy.ndarray) - Int32 lengths of the rows after truncation.
+
+    Examples:
+        >>> padded, lengths = pad_sequences([[1, 2, 3], [4]], max_length=2)
+    """
+    if offsets is None:
+        arrays = [np.asarray(seq)[:max_length] for seq in sequences]
+        if dtype is None:
+            dtype = np.result_type(*[array for array in arrays if array.size] or [np.int32])
+        values = np.concatenate(arrays) if arrays else np.empty(0, dtype)
+        lengths = np.array([array.shape[0] for array in arrays], dtype=np.int64)
+        offsets = None
+    else:
+        values = np.asarray(sequences)
+        offsets = np.asarray(offsets, dtype=np.int64)
+        lengths = np.diff(offsets)
+        if max_length is not None and lengths.max(initial=0) > max_length:
+            lengths = np.minimum(lengths, max_length)
+        else:
+            offsets = None
+    width = max_length if max_length is not None else int(lengths.max(initial=0))
+    padded = np.full((len(lengths), width), pad_value, dtype=dtype or values.dtype)
+    mask = np.arange(width) < lengths[:, None]
+    # Without truncation the values are exactly the unpadded cells in row-major order.
+    padded[mask] = values if offsets is None else values[(offsets[:-1, None] + np.arange(width))[mask]]
+    return padded, lengths.astype(np.int32)
@@ -0,0 +1,148 @@
+# Copyright 2023 Huawei Technologies Co., Ltd
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ============================================================================
+# pylint:disable=I1101
+# pylint:disable=W0212
+
+"""TextToIds transform"""
+import numpy as np
+import mindspore._c_dataengine as cde
+from mindspore.dataset import text, transforms
+from mindspore.dataset.transforms.transforms import PyTensorOperation
+from mindspore.dataset.text.transforms import TextTensorOperation, Implementation
+from mindnlp.vocab import Vocab as nlpVocab
+from mindnlp.utils.compatibility import less_min_pynative_first
+from mindnlp.abc import PreTrainedTokenizer
+from mindnlp._legacy.transforms import Truncate as LegacyTruncate
+from mindnlp.transforms.lookup import Lookup
+from mindnlp.transforms.tokenizers.basic_tokenizer import BasicTokenizer, _BasicTokenizer
+
+
+class TextToIds(TextTensorOperation, PyTensorOperation):
+    """
+    Tokenize text, look up the ids of the tokens, and truncate and pad them, in a single
+    transform instead of a chain of `dataset.map` calls.
+
+    With a C++ tokenizer, such as the default :class:`BasicTokenizer`, the steps are fused
+    into one C++ operation. With a Python tokenizer, or if `return_length` is True, the
+    steps run in one Python call, looking up tokens in a dict built once from `vocab`;
+    a :class:`BasicTokenizer` then runs its Python implementation.
+
+    Args:
+        tokenizer (TextTensorOperation): Tokenizer of the text into string tokens. A
+            :class:`PreTrainedTokenizer` should be built with `return_token=True`.
+        vocab (Vocab): A vocabulary object, of mindnlp or of `mindspore.dataset.text`.
+        unk_token (str): Unknown token for OOV, which should be in `vocab`. If None, OOV tokens
+            raise an error. Default: '<unk>'.
+        max_length (int): If set, ids are truncated to this length. Default: None.
+        pad_value (int): If set together with `max_length`, ids are padded with it
+            to `max_length`. Default: None.
+        return_length (bool): Whether to also return the number of ids before padding. Default: False.
+
+    Raises:
+        TypeError: If `tokenizer` is a :class:`PreTrainedTokenizer` returning ids, offsets or word ids.
+        ValueError: If `vocab` is not a supported vocab type.
+        ValueError: If `unk_token` is not None and not in `vocab`.
+        ValueError: If `pad_value` or `return_length` is set without `max_length`.
+
+    Supported Platforms:
+        ``CPU``
+
+    Examples:
+        >>> from mindnlp import Vocab
+        >>> from mindnlp.transforms import BasicTokenizer, TextToIds
+        >>> vocab = Vocab(['<pad>', '<unk>', 'hello', 'world'])
+        >>> text_to_ids = TextToIds(BasicTokenizer(), vocab, max_length=4, pad_value=0)
+        >>> ids = text_to_ids("hello world")
+    """
+
+    def __init__(self, tokenizer, vocab, unk_token='<unk>', max_length=None, pad_value=None,
+                 return_length=False):
+        super().__init__()
+        if not isinstance(vocab, (nlpVocab, text.Vocab)):
+            raise ValueError(f'do not support vocab type {type(vocab)}.')
+        if isinstance(tokenizer, PreTrainedTokenizer) and \
+            (not tokenizer.return_token or tokenizer.return_offsets or tokenizer.return_word_ids):
+            raise TypeError(f"For `TextToIds`, a `{type(tokenizer).__name__}` tokenizer should only return "
+                            f"string tokens, with `return_token` True and `return_offsets` and "
+                            f"`return_word_ids` False.")
+        token_dict = vocab.vocab if isinstance(vocab, nlpVocab) else vocab.vocab()
+        if unk_token is not None and unk_token not in token_dict:
+            raise ValueError(f"For `TextToIds`, `unk_token` should be in `vocab`, but got '{unk_token}'.")
+        if max_length is None and (pad_value is not None or return_length):
+            raise ValueError("For `TextToIds`, `pad_value` and `return_length` need `max_length` to be set.")
+        self.tokenizer = tokenizer
+        self.vocab = vocab
+        self.unk_token = unk_token
+        self.max_length = max_length
+        self.pad_value = pad_value
+        self.return_length = return_length
+        self._token_dict = token_dict
+        self._unk_id = token_dict.get(unk_token)
+        if return_length or getattr(tokenizer, 'implementation', None) != Implementation.C:
+            self.implementation = Implementation.PY
+        else:
+            self.implementation = Implementation.C
+
+    def __call__(self, text_input):
+        """
+        Call method for input conversion for eager mode.
+        """
+        if isinstance(text_input, str):
+            text_input = np.array(text_input)
+        elif not isinstance(text_input, np.ndarray):
+            raise TypeError(
+                f"Input should be a text line in 1-D NumPy format, got {type(text_input)}.")
+        return super().__call__(text_input)
+
+    def parse(self):
+        operations = [self.tokenizer.parse(), Lookup(self.vocab, self.unk_token).parse()]
+        if self.max_length is not None:
+            truncate = LegacyTruncate if less_min_pynative_first else text.Truncate
+            operations.append(truncate(self.max_length).parse())
+            if self.pad_value is not None:
+                operations.append(transforms.PadEnd([self.max_length], self.pad_value).parse())
+        return cde.ComposeOperation(operations)
+
+    def _tokenize(self, text_input):
+        if isinstance(self.tokenizer, BasicTokenizer):
+            tokenizer = self.tokenizer.tokenizer or _BasicTokenizer(self.tokenizer.lower_case)
+            return tokenizer.tokenize(text_input)
+        return self.tokenizer(text_input).tolist()
+
+    def execute_py(self, text_input):
+        """
+        Execute method.
+        """
+        return self._execute_py(text_input)
+
+    def _execute_py(self, text_input):
+        """
+        Execute method.
+        """
+        tokens = self._tokenize(text_input)
+        if self.max_length is not None:
+            tokens = tokens[:self.max_length]
+        if self._unk_id is None:
+            for token in tokens:
+                if token not in self._token_dict:
+                    raise ValueError(f"For `TextToIds`, token '{token}' is not in `vocab` and `unk_token` is None.")
+        ids = np.fromiter((self._token_dict.get(token, self._unk_id) for token in tokens),
+                          dtype=np.int32, count=len(tokens))
+        length = len(ids)
+        if self.pad_value is not None:
+            ids = np.pad(ids, (0, self.max_length - length), constant_values=self.pad_value)
+        if self.return_length:
+            return ids, np.array(length, np.int32)
+        return ids
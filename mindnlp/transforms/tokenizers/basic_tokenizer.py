@@ -24,8 +24,12 @@ from __future__ import absolute_import
 from __future__ import division
 from __future__ import print_function
 
-import unicodedata
+import collections
+import functools
 import platform
+import re
+import sys
+import unicodedata
 import numpy as np
 import mindspore._c_dataengine as cde
 from mindspore.dataset.transforms.transforms import PyTensorOperation
@@ -110,17 +114,78 @@ def _convert_to_unicode(text):
         return str(text)
     raise ValueError(f"Unsupported string type: {type(text)}, {text.dtype}")
 
-def _whitespace_tokenize(text):
-    """Runs basic whitespace cleaning and splitting on a piece of text."""
-    text = text.strip()
-    if not text:
-        return []
-    tokens = text.split()
-    return tokens
+# Flags of the code point classes of `_char_table`.
+_DROP = 1
+_PUNCT = 2
+_MARK = 4
+
+# The CJK Unicode blocks, https://en.wikipedia.org/wiki/CJK_Unified_Ideographs_(Unicode_block).
+# Korean Hangul and Japanese Hiragana and Katakana are different blocks, and are
+# space-separated like all of the other languages.
+_CJK_RANGES = ((0x4E00, 0x9FFF), (0x3400, 0x4DBF), (0x20000, 0x2A6DF), (0x2A700, 0x2B73F),
+               (0x2B740, 0x2B81F), (0x2B820, 0x2CEAF), (0xF900, 0xFAFF), (0x2F800, 0x2FA1F))
+
+
+@functools.lru_cache(maxsize=None)
+def _char_table():
+    """
+    Lookup array of the class flags of every code point, computed once per process:
+    invalid and control characters to drop, punctuation (all non-letter/number ASCII,
+    such as "^", "$" and "`", and the Unicode P* categories), and nonspacing marks.
+    """
+    flags = {'Cc': _DROP, 'Cf': _DROP, 'Mn': _MARK, 'Pc': _PUNCT, 'Pd': _PUNCT, 'Pe': _PUNCT,
+             'Pf': _PUNCT, 'Pi': _PUNCT, 'Po': _PUNCT, 'Ps': _PUNCT}
+    table = np.fromiter((flags.get(unicodedata.category(chr(cp)), 0) for cp in range(sys.maxunicode + 1)),
+                        dtype=np.uint8, count=sys.maxunicode + 1)
+    table[[0, 0xfffd]] = _DROP
+    # \t, \n and \r are technically control characters but are treated as whitespace.
+    table[[ord(char) for char in '\t\n\r']] = 0
+    for start, end in ((33, 47), (58, 64), (91, 96), (123, 126)):
+        table[start:end + 1] = _PUNCT
+    return table
+
+
+def _char_class(codes):
+    """Regex character class of the sorted code points `codes`, without brackets."""
+    breaks = np.flatnonzero(np.diff(codes) != 1)
+    starts = np.concatenate([codes[:1], codes[breaks + 1]])
+    ends = np.concatenate([codes[breaks], codes[-1:]])
+    return ''.join(f'\\U{start:08x}-\\U{end:08x}' for start, end in zip(starts, ends))
+
+
+_CharRules = collections.namedtuple('_CharRules', ['drop', 'cjk', 'strip_map', 'split', 'split_bmp'])
+
+
+@functools.lru_cache(maxsize=None)
+def _char_rules():
+    """Patterns and translation tables of `_BasicTokenizer`, built from `_char_table`."""
+    table = _char_table()
+    cjk = np.concatenate([np.arange(start, end + 1) for start, end in _CJK_RANGES])
+    punct = np.flatnonzero(table & _PUNCT)
+    # Regex classes of code points above the BMP are much slower to match, so texts
+    # without them use the BMP part of the punctuation only.
+    punct_bmp = _char_class(punct[punct <= 0xffff])
+    punct = _char_class(punct)
+    return _CharRules(drop=re.compile(f'[{_char_class(np.flatnonzero(table & _DROP))}]+'),
+                      cjk=re.compile(f'[{_char_class(cjk)}]+'),
+                      strip_map=dict.fromkeys(np.flatnonzero(table & _MARK).tolist()),
+                      split=re.compile(f'[{punct}]|[^{punct}\\s]+'),
+                      split_bmp=re.compile(f'[{punct_bmp}]|[^{punct_bmp}\\s]+'))
+
+
+def _space_chars(match):
+    """Surround each character of `match` with spaces."""
+    return ' ' + ' '.join(match.group()) + ' '
 
 
 class _BasicTokenizer():
-    """Runs basic tokenization (punctuation splitting, lower casing, etc.)."""
+    """
+    Runs basic tokenization (punctuation splitting, lower casing, etc.).
+
+    Characters are classified once per process into a lookup table over all code points,
+    from which each step is built as a precompiled regular expression or a `str.translate`
+    table that runs over the whole text at once.
+    """
 
     def __init__(self, do_lower_case=True):
         """Constructs a BasicTokenizer.
@@ -131,8 +196,11 @@ class _BasicTokenizer():
 
     def tokenize(self, text):
         """Tokenizes a piece of text."""
+        rules = _char_rules()
         text = _convert_to_unicode(text)
-        text = self._clean_text(text)
+        if rules.drop.search(text):
+            text = rules.drop.sub('', text)
+        is_ascii = text.isascii()
 
         # This was added on November 1st, 2018 for the multilingual and Chinese
         # models. This is also applied to the English models now, but it doesn't
@@ -140,136 +208,17 @@ class _BasicTokenizer():
         # and generally don't have any Chinese data in them (there are Chinese
         # characters in the vocabulary because Wikipedia does have some Chinese
         # words in the English Wikipedia.).
-        text = self._tokenize_chinese_chars(text)
-
-        orig_tokens = _whitespace_tokenize(text)
-        split_tokens = []
-        for token in orig_tokens:
-            if self.do_lower_case:
-                token = token.lower()
-                token = self._run_strip_accents(token)
-            split_tokens.extend(self._run_split_on_punc(token))
-
-        output_tokens = _whitespace_tokenize(" ".join(split_tokens))
-        return output_tokens
-
-    def _run_strip_accents(self, text):
-        """Strips accents from a piece of text."""
-        text = unicodedata.normalize("NFD", text)
-        output = []
-        for char in text:
-            cat = unicodedata.category(char)
-            if cat == "Mn":
-                continue
-            output.append(char)
-        return "".join(output)
-
-    def _run_split_on_punc(self, text):
-        """Splits punctuation on a piece of text."""
-        chars = list(text)
-        i = 0
-        start_new_word = True
-        output = []
-        while i < len(chars):
-            char = chars[i]
-            if _is_punctuation(char):
-                output.append([char])
-                start_new_word = True
-            else:
-                if start_new_word:
-                    output.append([])
-                start_new_word = False
-                output[-1].append(char)
-            i += 1
-
-        return ["".join(x) for x in output]
-
-    def _tokenize_chinese_chars(self, text):
-        """Adds whitespace around any CJK character."""
-        output = []
-        for char in text:
-            cp = ord(char)
-            if self._is_chinese_char(cp):
-                output.append(" ")
-                output.append(char)
-                output.append(" ")
-            else:
-                output.append(char)
-        return "".join(output)
-
-    def _is_chinese_char(self, cp):
-        """Checks whether CP is the codepoint of a CJK character."""
-        # This defines a "chinese character" as anything in the CJK Unicode block:
-        #   https://en.wikipedia.org/wiki/CJK_Unified_Ideographs_(Unicode_block)
-        #
-        # Note that the CJK Unicode block is NOT all Japanese and Korean characters,
-        # despite its name. The modern Korean Hangul alphabet is a different block,
-        # as is Japanese Hiragana and Katakana. Those alphabets are used to write
-        # space-separated words, so they are not treated specially and handled
-        # like the all of the other languages.
-        if ((0x4E00 <= cp <= 0x9FFF) or
-                (0x3400 <= cp <= 0x4DBF) or
-                (0x20000 <= cp <= 0x2A6DF) or
-                (0x2A700 <= cp <= 0x2B73F) or
-                (0x2B740 <= cp <= 0x2B81F) or
-                (0x2B820 <= cp <= 0x2CEAF) or
-                (0xF900 <= cp <= 0xFAFF) or
-                (0x2F800 <= cp <= 0x2FA1F)):
-            return True
-
-        return False
-
-    def _clean_text(self, text):
-        """Performs invalid character removal and whitespace cleanup on text."""
-        output = []
-        for char in text:
-            cp = ord(char)
-            if cp == 0 or cp == 0xfffd or _is_control(char):
-                continue
-            if _is_whitespace(char):
-                output.append(" ")
-            else:
-                output.append(char)
-        return "".join(output)
-
-
-def _is_whitespace(char):
-    """Checks whether `chars` is a whitespace character."""
-    # \t, \n, and \r are technically contorl characters but we treat them
-    # as whitespace since they are generally considered as such.
-    if char in (" ", "\t", "\n", "\r"):
-        return True
-    cat = unicodedata.category(char)
-    if cat == "Zs":
-        return True
-    return False
-
-
-def _is_control(char):
-    """Checks whether `chars` is a control character."""
-    # These are technically control characters but we count them as whitespace
-    # characters.
-    if char in ("\t", "\n", "\r"):
-        return False
-    cat = unicodedata.category(char)
-    if cat in ("Cc", "Cf"):
-        return True
-    return False
-
-
-def _is_punctuation(char):
-    """Checks whether `chars` is a punctuation character."""
-    cp = ord(char)
-    # We treat all non-letter/number ASCII as punctuation.
-    # Characters such as "^", "$", and "`" are not in the Unicode
-    # Punctuation class but we treat them as punctuation anyways, for
-    # consistency.
-    if ((33 <= cp <= 47) or
-            (58 <= cp <= 64) or
-            (91 <= cp <= 96) or
-            (123 <= cp <= 126)):
-        return True
-    cat = unicodedata.category(char)
-    if cat.startswith("P"):
-        return True
-    return False
+        if not is_ascii:
+            text = rules.cjk.sub(_space_chars, text)
+
+        if self.do_lower_case:
+            # Neither lower casing nor NFD crosses whitespace, so the whole text
+            # is processed at once instead of token by token.
+            text = text.lower()
+            if not is_ascii:
+                text = unicodedata.normalize('NFD', text).translate(rules.strip_map)
+
+        # Tokens are runs of characters other than whitespace and punctuation,
+        # and single punctuation characters.
+        split = rules.split_bmp if is_ascii or max(text, default='') <= '\uffff' else rules.split
+        return split.findall(text)
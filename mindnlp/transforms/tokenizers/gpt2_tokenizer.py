@@ -27,6 +27,10 @@ class GPT2Tokenizer(PreTrainedTokenizer):
         Args:
             vocab (Vocab): Vocabulary used to look up words.
             return_token (bool): Whether to return token. If True: return tokens. False: return ids. Default: True.
+            return_offsets (bool): Whether to also return the (start, end) character offsets of the tokens
+                in the text, as an int32 array of shape (num tokens, 2). Default: False.
+            return_word_ids (bool): Whether to also return the index of the word of each token, as an
+                int32 array with -1 for special tokens. Default: False.
 
         """
 
@@ -81,10 +85,8 @@ class GPT2Tokenizer(PreTrainedTokenizer):
         Execute method.
         """
         text_input = self._convert_to_unicode(text_input)
-        tokens = self._tokenizer.encode(text_input)
-        if self.return_token is True:
-            return np.array(tokens.tokens)
-        return np.array(tokens.ids)
+        tokens = self.encode(text_input)
+        return self._encoding_outputs(tokens)
 
     def _convert_to_unicode(self, text_input):
         """Converts `text` to Unicode (if it's not already), assuming utf-8 input."""
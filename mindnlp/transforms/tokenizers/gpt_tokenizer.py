@@ -39,6 +39,10 @@ class GPTTokenizer(PreTrainedTokenizer):
     Args:
         vocab (Vocab): Vocabulary used to look up words.
         return_token (bool): Whether to return token. If True: return tokens. False: return ids. Default: True.
+        return_offsets (bool): Whether to also return the (start, end) character offsets of the tokens
+            in the text, as an int32 array of shape (num tokens, 2). Default: False.
+        return_word_ids (bool): Whether to also return the index of the word of each token, as an
+            int32 array with -1 for special tokens. Default: False.
 
     """
 
@@ -85,10 +89,8 @@ class GPTTokenizer(PreTrainedTokenizer):
         Execute method.
         """
         text = self._convert_to_unicode(text_input)
-        output = self._tokenizer.encode(text)
-        if self.return_token is True:
-            return np.array(output.tokens)
-        return np.array(output.ids)
+        output = self.encode(text)
+        return self._encoding_outputs(output)
 
     def _convert_to_unicode(self, text_input):
         """Converts `text` to Unicode (if it's not already), assuming utf-8 input."""
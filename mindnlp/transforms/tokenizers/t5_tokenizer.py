@@ -41,6 +41,10 @@ class T5Tokenizer(PreTrainedTokenizer):
         Args:
             vocab (Vocab): Vocabulary used to look up words.
             return_token (bool): Whether to return token. If True: return tokens. False: return ids. Default: True.
+            return_offsets (bool): Whether to also return the (start, end) character offsets of the tokens
+                in the text, as an int32 array of shape (num tokens, 2). Default: False.
+            return_word_ids (bool): Whether to also return the index of the word of each token, as an
+                int32 array with -1 for special tokens. Default: False.
         Examples:
             >>> from mindspore.dataset import text
             >>> from mindnlp.transforms import T5Tokenizer
@@ -53,11 +57,11 @@ class T5Tokenizer(PreTrainedTokenizer):
     pretrained_vocab_map = PRETRAINED_VOCAB_MAP
 
     def __init__(self, vocab: str, **kwargs):
-        super().__init__()
         return_token = kwargs.pop('return_token', False)
+        super().__init__(**kwargs)
 
         if isinstance(vocab, str):
-            self.tokenizer = Tokenizer.from_file(vocab)
+            self._tokenizer = Tokenizer.from_file(vocab)
         else:
             raise ValueError(f'only support string, but got {vocab}')
         self.return_token = return_token
@@ -85,10 +89,8 @@ class T5Tokenizer(PreTrainedTokenizer):
         Execute method.
         """
         text_input = self._convert_to_unicode(text_input)
-        tokens = self.tokenizer.encode(text_input)
-        if self.return_token is True:
-            return np.array(tokens.tokens)
-        return np.array(tokens.ids)
+        tokens = self.encode(text_input)
+        return self._encoding_outputs(tokens)
 
     def _convert_to_unicode(self, text_input):
         """Converts `text` to Unicode (if it's not already), assuming utf-8 input."""
@@ -16,6 +16,6 @@
 """
 Common utils
 """
-from .decompress import unzip, untar, ungz
-from .download import cache_file
+from .decompress import unzip, untar, ungz, open_member, list_members
+from .download import cache_file, prefetch
 from .compatibility import *
@@ -16,10 +16,18 @@
 Decompress functions
 """
 
+import io
 import os
+import shutil
+import subprocess
 import tarfile
+import tempfile
 import zipfile
 import gzip
+from mindnlp.utils.store import FileLock
+
+CHUNK_SIZE = 1 << 20
+
 
 def untar(file_path: str, untar_path: str):
     r"""
@@ -29,6 +37,9 @@ def untar(file_path: str, untar_path: str):
         file_path (str): The path where the tgz file is located.
         multiple (str): The directory where the files were unzipped.
 
+    Members that are already extracted are skipped. Concurrent calls on the same file are
+    serialized by a lock file next to it.
+
     Returns:
         - **names** (list) -All filenames in the tar.gz file.
 
@@ -44,13 +55,12 @@ def untar(file_path: str, untar_path: str):
         '2016-01'
 
     """
-    tar = tarfile.open(file_path)
-    names = tar.getnames()
-    for name in names:
-        if os.path.exists(os.path.join(untar_path, name)):
-            continue
-        tar.extract(name, untar_path)
-    tar.close()
+    with FileLock(f'{file_path}.lock'), tarfile.open(file_path) as tar:
+        names = tar.getnames()
+        for name in names:
+            if os.path.exists(os.path.join(untar_path, name)):
+                continue
+            tar.extract(name, untar_path)
     return names
 
 
@@ -62,6 +72,9 @@ def unzip(file_path: str, unzip_path: str):
         file_path (str): The path where the .zip file is located.
         unzip_path (str): The directory where the files were unzipped.
 
+    Members that are already extracted with the same size are skipped. Concurrent calls on
+    the same file are serialized by a lock file next to it.
+
     Returns:
         - **names** (list) -All filenames in the .zip file.
 
@@ -70,19 +83,22 @@ def unzip(file_path: str, unzip_path: str):
         TypeError: If `untar_path` is not a string.
 
     """
-    zipf = zipfile.ZipFile(file_path, "r")
-    for name in zipf.namelist():
-        zipf.extract(name, unzip_path)
-    zipf.close()
-    return zipf.namelist()
+    with FileLock(f'{file_path}.lock'), zipfile.ZipFile(file_path, "r") as zipf:
+        for info in zipf.infolist():
+            target = os.path.join(unzip_path, info.filename)
+            if os.path.exists(target) and (info.is_dir() or os.path.getsize(target) == info.file_size):
+                continue
+            zipf.extract(info, unzip_path)
+        return zipf.namelist()
 
-def ungz(file_path: str, unzip_path: str = None):
+def ungz(file_path: str, unzip_path: str = None, parallel: bool = False):
     r"""
     Untar .gz file
 
     Args:
         file_path (str): The path where the .gz file is located.
         unzip_path (str): The directory where the files were unzipped.
+        parallel (bool): Whether to decompress with `pigz` in parallel if it is installed. Default: False.
 
     Returns:
         - **unzip_path** (str): The directory where the files were unzipped.
@@ -95,7 +111,151 @@ def ungz(file_path: str, unzip_path: str = None):
     if not isinstance(unzip_path,str):
         unzip_path = str(file_path)[:-3]
     with open(unzip_path,'wb') as file:
-        gz_file = gzip.open(file_path, mode = 'rb')
-        file.write(gz_file.read())
-        gz_file.close()
+        with open_member(file_path, parallel=parallel) as gz_file:
+            shutil.copyfileobj(gz_file, file, CHUNK_SIZE)
     return unzip_path
+
+
+class _ArchiveMember(io.RawIOBase):
+    """Raw stream over an archive member, closing the archive with it."""
+
+    def __init__(self, fileobj, *owners):
+        super().__init__()
+        self._fileobj = fileobj
+        self._owners = owners
+
+    def readable(self):
+        return True
+
+    def readinto(self, buffer):
+        data = self._fileobj.read(len(buffer))
+        buffer[:len(data)] = data
+        return len(data)
+
+    def close(self):
+        if not self.closed:
+            self._fileobj.close()
+            for owner in self._owners:
+                owner.close()
+        super().close()
+
+
+class _ProcessMember(_ArchiveMember):
+    """Raw stream over the output of a decompressing process, checking its exit status at the end."""
+
+    def __init__(self, process, stderr):
+        super().__init__(process.stdout)
+        self._process = process
+        self._stderr = stderr
+
+    def readinto(self, buffer):
+        size = super().readinto(buffer)
+        if size == 0 and len(buffer) and self._process.wait() != 0:
+            self._stderr.seek(0)
+            message = self._stderr.read().decode('utf-8', 'replace').strip()
+            raise OSError(f"For `open_member`, `{self._process.args[0]}` failed to decompress "
+                          f"`{self._process.args[-1]}` with exit status {self._process.returncode}: {message}")
+        return size
+
+    def close(self):
+        if not self.closed:
+            if self._process.poll() is None:
+                self._process.kill()
+            self._process.stdout.close()
+            self._process.wait()
+            self._stderr.close()
+        super().close()
+
+
+def _open_gz(file_path, parallel):
+    pigz = shutil.which('pigz') if parallel else None
+    if pigz is None:
+        return _ArchiveMember(gzip.open(file_path, 'rb'))
+    stderr = tempfile.TemporaryFile() # pylint: disable=consider-using-with
+    process = subprocess.Popen([pigz, '-dc', str(file_path)], # pylint: disable=consider-using-with
+                               stdout=subprocess.PIPE, stderr=stderr)
+    return _ProcessMember(process, stderr)
+
+
+def list_members(file_path: str):
+    r"""
+    List the files in a .tar(.gz), .zip or .gz archive without extracting it.
+
+    Args:
+        file_path (str): The path where the archive is located.
+
+    Returns:
+        - **names** (list) -The names of the files. A .gz file has one member, named without `.gz`.
+
+    Examples:
+        >>> names = list_members("./glove.6B.zip")
+        >>> print(names[0])
+        'glove.6B.50d.txt'
+    """
+    file_path = str(file_path)
+    if zipfile.is_zipfile(file_path):
+        with zipfile.ZipFile(file_path) as zipf:
+            return [info.filename for info in zipf.infolist() if not info.is_dir()]
+    if tarfile.is_tarfile(file_path):
+        with tarfile.open(file_path) as tar:
+            return [member.name for member in tar.getmembers() if member.isfile()]
+    if file_path.endswith('.gz'):
+        return [os.path.basename(file_path)[:-3]]
+    raise ValueError(f"For `list_members`, `{file_path}` is not a .tar, .zip or .gz archive.")
+
+
+def open_member(file_path: str, member: str = None, mode: str = 'rb', encoding: str = 'utf-8',
+                parallel: bool = False):
+    r"""
+    Open a file in a .tar(.gz), .zip or .gz archive as a stream, without extracting it to disk.
+
+    Args:
+        file_path (str): The path where the archive is located.
+        member (str): The name of the file in the archive. It can be None for a .gz file. Default: None.
+        mode (str): 'rb' for a binary stream, or 'r' for a text stream. Default: 'rb'.
+        encoding (str): The encoding of the text stream. Default: 'utf-8'.
+        parallel (bool): Whether to decompress a .gz file with `pigz` in parallel if it is installed.
+            Default: False.
+
+    Returns:
+        - **file** (Union[io.BufferedReader, io.TextIOWrapper]) - The stream, which closes the archive
+          when closed.
+
+    Raises:
+        ValueError: If `mode` is not 'rb' or 'r', or the file is not a supported archive.
+        KeyError: If `member` is not in the archive.
+        OSError: If `pigz` fails, when the end of the stream is read.
+
+    Examples:
+        >>> with open_member("./glove.6B.zip", "glove.6B.50d.txt", 'r') as file:
+        ...     line = file.readline()
+    """
+    if mode not in ('rb', 'r'):
+        raise ValueError(f"For `open_member`, `mode` should be 'rb' or 'r', but got '{mode}'.")
+    file_path = str(file_path)
+    if zipfile.is_zipfile(file_path):
+        zipf = zipfile.ZipFile(file_path) # pylint: disable=consider-using-with
+        try:
+            raw = _ArchiveMember(zipf.open(member), zipf)
+        except KeyError:
+            zipf.close()
+            raise
+    elif tarfile.is_tarfile(file_path):
+        tar = tarfile.open(file_path) # pylint: disable=consider-using-with
+        try:
+            fileobj = tar.extractfile(member)
+        except KeyError:
+            tar.close()
+            raise
+        if fileobj is None:
+            tar.close()
+            raise KeyError(f"`{member}` is not a file in `{file_path}`.")
+        raw = _ArchiveMember(fileobj, tar)
+    elif file_path.endswith('.gz'):
+        raw = _open_gz(file_path, parallel)
+    else:
+        raise ValueError(f"For `open_member`, `{file_path}` is not a .tar, .zip or .gz archive.")
+    stream = io.BufferedReader(raw, CHUNK_SIZE)
+    if mode == 'r':
+        return io.TextIOWrapper(stream, encoding=encoding)
+    return stream
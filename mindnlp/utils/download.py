@@ -17,14 +17,20 @@ Download functions
 """
 
 import os
+import glob
 import shutil
 import hashlib
 import re
+import time
+import inspect
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from urllib.parse import urlparse
 import requests
 from tqdm.autonotebook import tqdm
+from mindspore import log as logger
 from mindnlp.configs import DEFAULT_ROOT
+from mindnlp.utils.store import ArtifactStore
 
 def get_cache_path():
     r"""
@@ -53,10 +59,161 @@ def get_cache_path():
     return cache_dir
 
 
-def http_get(url, path=None, md5sum=None, download_file_name=None, proxies=None):
+_STORES = {}
+
+
+def get_store():
+    r"""
+    Get the artifact store of the current cache path. A read-only shared store is used if the
+    environment 'MINDNLP_SHARED_CACHE' is set, and the size of the store is bounded by the
+    environment 'MINDNLP_CACHE_MAX_SIZE' in bytes if set.
+
+    Returns:
+        ArtifactStore, the store under `{cache_path}\.store`.
+
+    Examples:
+        >>> store = get_store()
+    """
+    root = os.path.join(get_cache_path(), ".store")
+    shared_root = os.environ.get("MINDNLP_SHARED_CACHE")
+    max_size = os.environ.get("MINDNLP_CACHE_MAX_SIZE")
+    key = (root, shared_root, max_size)
+    if key not in _STORES:
+        _STORES[key] = ArtifactStore(root, shared_root, int(max_size) if max_size else None)
+    return _STORES[key]
+
+
+DOWNLOAD_CHUNK_SIZE = 1 << 20
+PARALLEL_DOWNLOAD_SIZE = 64 << 20
+PARALLEL_DOWNLOAD_WORKERS = 4
+_RETRY_STATUS = (408, 429, 500, 502, 503, 504)
+
+
+def _probe(url, proxies=None):
+    """Return the size of `url` and whether the server accepts byte ranges."""
+    try:
+        req = requests.head(url, allow_redirects=True, timeout=10, proxies=proxies)
+    except requests.RequestException:
+        return None, False
+    if req.status_code != 200:
+        return None, False
+    total_size = req.headers.get("content-length")
+    accept_ranges = req.headers.get("accept-ranges", "").lower() == "bytes"
+    return (int(total_size) if total_size else None), accept_ranges
+
+
+def _fetch(url, file, md5, pbar, start=0, end=None, proxies=None, chunk_size=DOWNLOAD_CHUNK_SIZE):
+    """
+    Append `url` from byte `start` (to byte `end` inclusive) to `file`, updating `md5` if given.
+    Return False if the server ignored the range and sent the whole content. A range past the end
+    of the content (416) is taken as complete, and left to the md5 check. Transient statuses raise
+    `requests.HTTPError` to be retried, other failures raise RuntimeError.
+    """
+    headers = {}
+    if start or end is not None:
+        headers["Range"] = f"bytes={start}-{'' if end is None else end}"
+    with requests.get(url, stream=True, timeout=10, proxies=proxies, headers=headers) as req:
+        if headers and req.status_code == 200:
+            return False
+        if headers and req.status_code == 416:
+            return True
+        if req.status_code in _RETRY_STATUS:
+            raise requests.HTTPError(
+                f"Downloading from {url} failed with code {req.status_code}!", response=req
+            )
+        if req.status_code not in (200, 206):
+            raise RuntimeError(
+                f"Downloading from {url} failed with code {req.status_code}!"
+            )
+        for chunk in req.iter_content(chunk_size=chunk_size):
+            if chunk:
+                file.write(chunk)
+                if md5 is not None:
+                    md5.update(chunk)
+                if pbar is not None:
+                    pbar.update(len(chunk))
+    return True
+
+
+def _hash_file(filename, md5, chunk_size=DOWNLOAD_CHUNK_SIZE):
+    with open(filename, "rb") as file:
+        for chunk in iter(lambda: file.read(chunk_size), b""):
+            md5.update(chunk)
+
+
+def _download_stream(url, tmp_filename, total_size, accept_ranges, proxies, chunk_size):
+    """Download into `tmp_filename` with one request, resuming a partial file if possible."""
+    md5 = hashlib.md5()
+    start = 0
+    if accept_ranges and os.path.exists(tmp_filename):
+        start = os.path.getsize(tmp_filename)
+        if total_size is not None and start > total_size:
+            start = 0
+    if start:
+        _hash_file(tmp_filename, md5, chunk_size)
+    with tqdm(total=total_size, initial=start, unit="B", unit_scale=True, unit_divisor=1024) as pbar:
+        if total_size is not None and start == total_size:
+            return md5.hexdigest()
+        with open(tmp_filename, "ab" if start else "wb") as file:
+            if _fetch(url, file, md5, pbar, start, proxies=proxies, chunk_size=chunk_size):
+                return md5.hexdigest()
+        # The server ignored the range, start over.
+        md5 = hashlib.md5()
+        pbar.reset()
+        with open(tmp_filename, "wb") as file:
+            _fetch(url, file, md5, pbar, proxies=proxies, chunk_size=chunk_size)
+    return md5.hexdigest()
+
+
+def _download_parts(url, tmp_filename, total_size, num_workers, proxies, chunk_size):
+    """
+    Download byte ranges of `url` into part files concurrently, resuming partial parts,
+    then join them into `tmp_filename` while computing the md5.
+    """
+    part_size = -(-total_size // num_workers)
+    ranges = [(start, min(start + part_size, total_size) - 1) for start in range(0, total_size, part_size)]
+    part_names = [f"{tmp_filename}.part{idx}" for idx in range(len(ranges))]
+    done = sum(min(os.path.getsize(name), end - start + 1) for name, (start, end) in zip(part_names, ranges)
+               if os.path.exists(name))
+
+    def fetch_part(name, start, end):
+        size = os.path.getsize(name) if os.path.exists(name) else 0
+        if size > end - start + 1:
+            size = 0
+        if start + size > end:
+            return
+        with open(name, "ab" if size else "wb") as file:
+            if not _fetch(url, file, None, pbar, start + size, end, proxies, chunk_size):
+                raise RuntimeError(f"Downloading from {url} failed, the server does not support ranges.")
+
+    with tqdm(total=total_size, initial=done, unit="B", unit_scale=True, unit_divisor=1024) as pbar:
+        with ThreadPoolExecutor(max_workers=num_workers) as executor:
+            futures = [executor.submit(fetch_part, name, start, end)
+                       for name, (start, end) in zip(part_names, ranges)]
+            for future in futures:
+                future.result()
+
+    md5 = hashlib.md5()
+    with open(tmp_filename, "wb") as file:
+        for name in part_names:
+            with open(name, "rb") as part:
+                for chunk in iter(lambda: part.read(chunk_size), b""): # pylint: disable=cell-var-from-loop
+                    file.write(chunk)
+                    md5.update(chunk)
+    for name in part_names:
+        os.remove(name)
+    return md5.hexdigest()
+
+
+def http_get(url, path=None, md5sum=None, download_file_name=None, proxies=None,
+             num_workers=PARALLEL_DOWNLOAD_WORKERS, chunk_size=DOWNLOAD_CHUNK_SIZE):
     r"""
     Download from given url, save to path.
 
+    A partial download left in `{filename}_tmp` by a failed transfer is resumed with an HTTP
+    Range request. Files larger than 64MB are fetched as `num_workers` concurrent ranges if the
+    server supports them. The md5 is computed while writing, so the file is not read again.
+
     Args:
         url (str): download url
         path (str): download to given path (default value: '{home}\.text')
@@ -64,6 +221,8 @@ def http_get(url, path=None, md5sum=None, download_file_name=None, proxies=None)
         download_file_name(str): The name of the downloaded file.\
             (This para meter is required if the end of the link is not the downloaded file name.)
         proxies (dict): a dict to identify proxies,for example: {"https": "https://127.0.0.1:7890"}.
+        num_workers (int): The number of concurrent range requests for large files. Default: 4.
+        chunk_size (int): The size in bytes of each chunk read from the response. Default: 1MB.
 
     Returns:
         str, the path of default or the environment 'cache_path'.
@@ -71,6 +230,7 @@ def http_get(url, path=None, md5sum=None, download_file_name=None, proxies=None)
     Raises:
         TypeError: If `url` is not a String.
         RuntimeError: If `url` is None.
+        RuntimeError: If the server answers with an error that is not transient, or the retry limit is reached.
 
     Examples:
         >>> url = 'https://mindspore-website.obs.myhuaweicloud.com/notebook/datasets/aclImdb_v1.tar.gz'
@@ -79,13 +239,17 @@ def http_get(url, path=None, md5sum=None, download_file_name=None, proxies=None)
         ('{home}\.text', '{home}\aclImdb_v1.tar.gz')
 
     """
+    return _http_get(url, path, md5sum, download_file_name, proxies, num_workers, chunk_size)[:2]
+
+
+def _http_get(url, path, md5sum, download_file_name, proxies, num_workers, chunk_size):
+    """Download as `http_get`, also returning the md5 of the file, or None if it was not computed."""
     if path is None:
         path = get_cache_path()
 
     if not os.path.exists(path):
         os.makedirs(path)
 
-    retry_cnt = 0
     retry_limit = 3
     name = ""
     if download_file_name is None:
@@ -94,37 +258,32 @@ def http_get(url, path=None, md5sum=None, download_file_name=None, proxies=None)
         name = download_file_name
 
     filename = os.path.join(path, name)
-
-    while not (os.path.exists(filename) and check_md5(filename, md5sum)):
-        if retry_cnt < retry_limit:
-            retry_cnt += 1
-        else:
-            raise RuntimeError(
-                f"Download from {url} failed. " "Retry limit reached")
-
-        req = requests.get(url, stream=True, timeout=10, proxies=proxies)
-        if req.status_code != 200:
-            raise RuntimeError(
-                f"Downloading from {url} failed with code {req.status_code}!"
-            )
-
-        tmp_filename = filename + "_tmp"
-        total_size = req.headers.get("content-length")
-        with open(tmp_filename, "wb") as file:
-            if total_size:
-                with tqdm(
-                    total=int(total_size), unit="B", unit_scale=True, unit_divisor=1024
-                ) as pbar:
-                    for chunk in req.iter_content(chunk_size=1024):
-                        file.write(chunk)
-                        pbar.update(len(chunk))
+    if os.path.exists(filename) and check_md5(filename, md5sum):
+        return Path(path), filename, md5sum
+
+    tmp_filename = filename + "_tmp"
+    for _ in range(retry_limit):
+        total_size, accept_ranges = _probe(url, proxies)
+        try:
+            if accept_ranges and total_size and total_size >= PARALLEL_DOWNLOAD_SIZE and num_workers > 1:
+                md5hex = _download_parts(url, tmp_filename, total_size, num_workers, proxies, chunk_size)
             else:
-                for chunk in req.iter_content(chunk_size=1024):
-                    if chunk:
-                        file.write(chunk)
-        shutil.move(tmp_filename, filename)
+                md5hex = _download_stream(url, tmp_filename, total_size, accept_ranges, proxies, chunk_size)
+        except requests.RequestException:
+            # Keep the partial file, the next attempt resumes from it.
+            continue
+        except RuntimeError:
+            for partial in [tmp_filename] + glob.glob(f"{glob.escape(tmp_filename)}.part*"):
+                if os.path.exists(partial):
+                    os.remove(partial)
+            raise
+        if md5sum is None or md5hex == md5sum:
+            shutil.move(tmp_filename, filename)
+            return Path(path), filename, md5hex
+        os.remove(tmp_filename)
 
-    return Path(path), filename
+    raise RuntimeError(
+        f"Download from {url} failed. " "Retry limit reached")
 
 
 def check_md5(filename: str, md5sum=None):
@@ -392,13 +551,158 @@ def get_from_cache(
     else:
         filename = download_file_name
 
-    match_dir_name = match_file(filename, cache_dir)
-    dir_name = filename
-    if match_dir_name:
-        dir_name = match_dir_name
-    cache_path = cache_dir / dir_name
-    if cache_path.exists() and check_md5(cache_path, md5sum):
-        return get_filepath(cache_path), filename
-    path = http_get(url, cache_dir, md5sum,
-                    download_file_name=download_file_name, proxies=proxies)[1]
+    store = get_store()
+    with store.lock(url):
+        blob, _ = store.lookup(url, md5sum)
+        if blob is not None:
+            cache_path = cache_dir / filename
+            if not (cache_path.exists() and os.path.samefile(cache_path, blob)):
+                store.materialize(blob, cache_path)
+            store.touch(url)
+            return get_filepath(cache_path), filename
+
+        match_dir_name = match_file(filename, cache_dir)
+        dir_name = filename
+        if match_dir_name:
+            dir_name = match_dir_name
+        cache_path = cache_dir / dir_name
+        if cache_path.exists() and check_md5(cache_path, md5sum):
+            if cache_path.is_file():
+                store.add(url, str(cache_path), md5sum)
+            return get_filepath(cache_path), filename
+        # The md5 computed while downloading is passed on, so the store does not read the file again.
+        _, path, md5hex = _http_get(url, cache_dir, md5sum, download_file_name, proxies,
+                                    PARALLEL_DOWNLOAD_WORKERS, DOWNLOAD_CHUNK_SIZE)
+        store.add(url, path, md5hex)
     return Path(path), filename
+
+
+PREFETCH_KINDS = ('config', 'model', 'tokenizer', 'dataset')
+
+
+def _subclasses(cls):
+    """Yield all subclasses of `cls` recursively."""
+    for sub in cls.__subclasses__():
+        yield sub
+        yield from _subclasses(sub)
+
+
+def _archive_maps(kind):
+    """Return the archive maps of all registered classes of `kind`."""
+    # pylint: disable=import-outside-toplevel, unused-import
+    import mindnlp.models
+    import mindnlp.transforms
+    from mindnlp.abc import PreTrainedConfig, PreTrainedModel, PreTrainedTokenizer
+    base, attr = {
+        'config': (PreTrainedConfig, 'pretrained_config_archive_map'),
+        'model': (PreTrainedModel, 'pretrained_model_archive_map'),
+        'tokenizer': (PreTrainedTokenizer, 'pretrained_vocab_map'),
+    }[kind]
+    return [getattr(cls, attr) for cls in _subclasses(base) if getattr(cls, attr, None)]
+
+
+def _dataset_splits(loader):
+    """Return the default splits of a dataset loader, or `[None]` if it has no `split` argument."""
+    param = inspect.signature(loader).parameters.get('split')
+    if param is None or param.default is inspect.Parameter.empty:
+        return [None]
+    if isinstance(param.default, str):
+        return [param.default]
+    return list(param.default)
+
+
+def _resolve(names, kinds):
+    """
+    Expand `names` and `kinds` into download tasks `(name, kind, url)`. Datasets get one task
+    per split, with the split in place of the url.
+    """
+    tasks = []
+    for name in names:
+        found = False
+        for kind in kinds:
+            if kind == 'dataset':
+                from mindnlp.dataset.register import load_dataset # pylint: disable=import-outside-toplevel
+                if name.lower() in load_dataset.mem_dict:
+                    splits = _dataset_splits(load_dataset.mem_dict[name.lower()])
+                    tasks.extend((name, kind, split) for split in splits)
+                    found = True
+                continue
+            urls = []
+            for archive_map in _archive_maps(kind):
+                url = archive_map.get(name)
+                if url is not None and url not in urls:
+                    urls.append(url)
+            tasks.extend((name, kind, url) for url in urls)
+            found = found or bool(urls)
+        if not found:
+            raise ValueError(f"For `prefetch`, no artifact of kinds {tuple(kinds)} is found for '{name}'.")
+    return tasks
+
+
+def prefetch(names, kinds=('config', 'model', 'tokenizer'), cache_dir=None, proxies=None, num_workers=8):
+    r"""
+    Resolve and download all artifacts of pretrained models or datasets concurrently, through the
+    same cache as `from_pretrained` and `load_dataset`, so later calls find them locally.
+
+    Args:
+        names (Union[str, list[str]]): Names of pretrained models, e.g. 'bert-base-uncased', or of datasets,
+            e.g. 'ag_news'.
+        kinds (Union[str, tuple[str]]): Kinds of artifacts to fetch, in 'config', 'model', 'tokenizer' and
+            'dataset'. Default: ('config', 'model', 'tokenizer').
+        cache_dir (str): The cache directory. Default: None, the default cache path, and the
+            default root of the dataset loaders.
+        proxies (dict): a dict to identify proxies,for example: {"https": "https://127.0.0.1:7890"}.
+        num_workers (int): The number of concurrent downloads. Default: 8.
+
+    Returns:
+        dict, the list of local paths of each `(name, kind)`, one per file when several model
+        classes register different files for the name. Datasets are mapped to their cache
+        directory, and their splits are fetched concurrently.
+
+    Raises:
+        ValueError: If a kind is not supported, or no artifact is found for a name.
+        RuntimeError: If any download fails, after the others are finished.
+
+    Examples:
+        >>> from mindnlp.utils.download import prefetch
+        >>> paths = prefetch(['bert-base-uncased', 'gpt2'], kinds=('config', 'model'))
+    """
+    if isinstance(names, str):
+        names = [names]
+    if isinstance(kinds, str):
+        kinds = [kinds]
+    for kind in kinds:
+        if kind not in PREFETCH_KINDS:
+            raise ValueError(f"For `prefetch`, `kinds` should be in {PREFETCH_KINDS}, but got '{kind}'.")
+    def fetch(task):
+        name, kind, url = task
+        if kind == 'dataset':
+            from mindnlp.dataset.register import load_dataset # pylint: disable=import-outside-toplevel
+            kwargs = {} if url is None else {'split': url}
+            if cache_dir is not None:
+                kwargs['root'] = cache_dir
+            load_dataset(name, proxies=proxies, **kwargs)
+            return os.path.join(DEFAULT_ROOT if cache_dir is None else cache_dir, 'datasets')
+        return str(cached_path(url, cache_dir=cache_dir, proxies=proxies, folder_name=name)[0])
+
+    tasks = _resolve(names, kinds)
+    start = time.time()
+    results, errors = {}, []
+    with ThreadPoolExecutor(max_workers=num_workers) as executor:
+        futures = [(task, executor.submit(fetch, task)) for task in tasks]
+        for (name, kind, url), future in futures:
+            try:
+                path = future.result()
+            except Exception as err: # pylint: disable=broad-except
+                errors.append(f"{name} ({kind}, {url}): {err}")
+                continue
+            paths = results.setdefault((name, kind), [])
+            if path not in paths:
+                paths.append(path)
+
+    size = sum(os.path.getsize(path) for paths in results.values() for path in paths if os.path.isfile(path))
+    logger.info(f"Prefetched {len(tasks) - len(errors)}/{len(tasks)} artifacts "
+                f"({size / (1 << 20):.1f}MB of files) in {time.time() - start:.1f}s.")
+    if errors:
+        raise RuntimeError("For `prefetch`, failed to fetch:\n" + "\n".join(errors))
+    return results
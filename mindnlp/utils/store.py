@@ -0,0 +1,313 @@
+# Copyright 2022 Huawei Technologies Co., Ltd
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ============================================================================
+"""
+Content-addressed store of downloaded artifacts
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import time
+
+try:
+    import fcntl
+except ImportError: # pragma: no cover
+    fcntl = None
+try:
+    import msvcrt
+except ImportError:
+    msvcrt = None
+
+
+class FileLock:
+    r"""
+    Inter-process exclusive lock held on a lock file.
+
+    Args:
+        path (str): Path of the lock file.
+        poll_interval (float): Seconds between attempts where blocking locks are not available. Default: 0.1.
+
+    Examples:
+        >>> with FileLock('/tmp/test.lock'):
+        ...     pass
+    """
+
+    def __init__(self, path, poll_interval=0.1):
+        self.path = path
+        self.poll_interval = poll_interval
+        self._file = None
+
+    def acquire(self):
+        """Block until the lock is held."""
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        self._file = open(self.path, 'a+') # pylint: disable=consider-using-with, unspecified-encoding
+        if fcntl is not None:
+            fcntl.flock(self._file.fileno(), fcntl.LOCK_EX)
+            return
+        # 'a+' opens at the end, lock and unlock the same first byte.
+        self._file.seek(0)
+        while True:
+            try:
+                msvcrt.locking(self._file.fileno(), msvcrt.LK_NBLCK, 1)
+                return
+            except OSError:
+                time.sleep(self.poll_interval)
+
+    def release(self):
+        """Release the lock."""
+        if self._file is None:
+            return
+        if fcntl is not None:
+            fcntl.flock(self._file.fileno(), fcntl.LOCK_UN)
+        else:
+            self._file.seek(0)
+            msvcrt.locking(self._file.fileno(), msvcrt.LK_UNLCK, 1)
+        self._file.close()
+        self._file = None
+
+    def __enter__(self):
+        self.acquire()
+        return self
+
+    def __exit__(self, *args):
+        self.release()
+
+
+def _md5_file(path, chunk_size=1 << 20):
+    md5 = hashlib.md5()
+    with open(path, 'rb') as file:
+        for chunk in iter(lambda: file.read(chunk_size), b''):
+            md5.update(chunk)
+    return md5.hexdigest()
+
+
+def _link_or_copy(src, dst):
+    """Hard link `src` to `dst`, copying if they are on different file systems."""
+    tmp = f'{dst}.tmp{os.getpid()}'
+    try:
+        os.link(src, tmp)
+    except OSError:
+        shutil.copyfile(src, tmp)
+    os.replace(tmp, dst)
+
+
+class ArtifactStore:
+    r"""
+    Content-addressed store of downloaded files.
+
+    Files are kept once as `blobs/<md5>` under `root`, and `index.json` maps each key
+    (the download url) to the md5, size and last access time of its blob, so lookups
+    do not list or match directory entries. Blobs are hard linked to the paths where
+    callers expect them, and the index records these paths so that evicting a blob
+    also removes its links and frees the space. A read-only `shared_root` with the same layout, e.g. on a
+    cluster file system, is searched after `root`. Writers of the index, and downloads
+    of the same key, are serialized with :class:`FileLock` across processes.
+
+    Args:
+        root (str): Directory of the store.
+        shared_root (Union[str, None]): Directory of a read-only shared store. Default: None.
+        max_size (Union[int, None]): Maximum total size in bytes of the blobs. If set, least
+            recently used blobs are evicted when it is exceeded. Default: None.
+    """
+
+    def __init__(self, root, shared_root=None, max_size=None):
+        self.root = root
+        self.shared_root = shared_root
+        self.max_size = max_size
+        self._index = {}
+        self._index_mtime = None
+        self._shared_index = None
+
+    @property
+    def index_path(self):
+        """Path of the index file."""
+        return os.path.join(self.root, 'index.json')
+
+    def blob_path(self, digest, root=None):
+        """Path of the blob with md5 `digest`."""
+        return os.path.join(root or self.root, 'blobs', digest)
+
+    def lock(self, key):
+        """Return a :class:`FileLock` serializing work on `key` across processes."""
+        name = hashlib.sha1(key.encode('utf-8')).hexdigest()
+        return FileLock(os.path.join(self.root, 'locks', name + '.lock'))
+
+    @staticmethod
+    def _read_index(path):
+        try:
+            with open(path, 'r', encoding='utf-8') as file:
+                return json.load(file)
+        except (OSError, ValueError):
+            return {}
+
+    def _load_index(self):
+        """Reload the index if another process has written it."""
+        try:
+            mtime = os.stat(self.index_path).st_mtime_ns
+        except OSError:
+            return self._index
+        if mtime != self._index_mtime:
+            self._index = self._read_index(self.index_path)
+            self._index_mtime = mtime
+        return self._index
+
+    def _update_index(self, update):
+        """Apply `update` to the index under the index lock and write it atomically."""
+        with FileLock(self.index_path + '.lock'):
+            self._index_mtime = None
+            index = self._load_index()
+            update(index)
+            tmp = f'{self.index_path}.tmp{os.getpid()}'
+            with open(tmp, 'w', encoding='utf-8') as file:
+                json.dump(index, file)
+            os.replace(tmp, self.index_path)
+            self._index = index
+            self._index_mtime = os.stat(self.index_path).st_mtime_ns
+
+    def lookup(self, key, md5sum=None):
+        """
+        Find the blob of `key`.
+
+        Args:
+            key (str): Key of the artifact.
+            md5sum (Union[str, None]): Expected md5 of the artifact. Default: None.
+
+        Returns:
+            - **path** (Union[str, None]) - Path of the blob, or None if it is not stored.
+            - **digest** (Union[str, None]) - Md5 of the blob.
+        """
+        entry = self._load_index().get(key)
+        if entry is not None and md5sum in (None, entry['md5']):
+            path = self.blob_path(entry['md5'])
+            if os.path.exists(path):
+                return path, entry['md5']
+        if self.shared_root is not None:
+            if self._shared_index is None:
+                self._shared_index = self._read_index(os.path.join(self.shared_root, 'index.json'))
+            entry = self._shared_index.get(key)
+            if entry is not None and md5sum in (None, entry['md5']):
+                path = self.blob_path(entry['md5'], self.shared_root)
+                if os.path.exists(path):
+                    return path, entry['md5']
+        return None, None
+
+    def add(self, key, path, md5sum=None):
+        """
+        Store the file at `path` as the artifact of `key`.
+
+        Args:
+            key (str): Key of the artifact.
+            path (str): Path of the file, which stays in place and is linked to the blob.
+            md5sum (Union[str, None]): Md5 of the file if known. Default: None.
+
+        Returns:
+            str, the md5 of the file.
+
+        Note:
+            If `max_size` is set, other blobs are evicted to make room, but never the one just added,
+            so the store may exceed `max_size` when that blob alone does.
+        """
+        digest = md5sum or _md5_file(path)
+        blob = self.blob_path(digest)
+        if not os.path.exists(blob):
+            os.makedirs(os.path.dirname(blob), exist_ok=True)
+            _link_or_copy(path, blob)
+        size = os.path.getsize(blob)
+        link = os.path.abspath(path)
+
+        def update(index):
+            entry = index.get(key, {})
+            paths = entry.get('paths', []) if entry.get('md5') == digest else []
+            if link not in paths and os.path.samefile(link, blob):
+                paths.append(link)
+            index[key] = {'md5': digest, 'size': size, 'atime': time.time(), 'paths': paths}
+        self._update_index(update)
+        if self.max_size is not None:
+            self.evict(self.max_size, keep=(key,))
+        return digest
+
+    def touch(self, key):
+        """Mark `key` as recently used."""
+        def update(index):
+            if key in index:
+                index[key]['atime'] = time.time()
+        self._update_index(update)
+
+    def materialize(self, blob, path):
+        """Make the blob available at `path`. Blobs of the shared store are symlinked, not copied."""
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        if self.shared_root is not None and \
+            os.path.abspath(blob).startswith(os.path.abspath(self.shared_root) + os.sep):
+            tmp = f'{path}.tmp{os.getpid()}'
+            os.symlink(os.path.abspath(blob), tmp)
+            os.replace(tmp, path)
+        else:
+            _link_or_copy(blob, path)
+            self._add_link(os.path.basename(blob), os.path.abspath(path))
+
+    def _add_link(self, digest, link):
+        """Record `link` as a hard link of the blob `digest`."""
+        def update(index):
+            for entry in index.values():
+                if entry['md5'] == digest and link not in entry.setdefault('paths', []):
+                    entry['paths'].append(link)
+        if os.path.samefile(link, self.blob_path(digest)):
+            self._update_index(update)
+
+    def evict(self, max_size, keep=()):
+        """
+        Remove least recently used blobs, and the paths linked to them, until the total size
+        of the blobs is at most `max_size` bytes.
+
+        Args:
+            max_size (int): Maximum total size in bytes.
+            keep (Sequence[str]): Keys whose blobs are never evicted. Default: ().
+
+        Returns:
+            list[str], the evicted keys.
+        """
+        evicted = []
+
+        def update(index):
+            digests = {}
+            for key, entry in index.items():
+                atime = digests.get(entry['md5'], (0, 0))[1]
+                digests[entry['md5']] = (entry['size'], max(atime, entry['atime']))
+            total = sum(size for size, _ in digests.values())
+            kept = {index[key]['md5'] for key in keep if key in index}
+            for digest, (size, _) in sorted(digests.items(), key=lambda item: item[1][1]):
+                if total <= max_size:
+                    break
+                if digest in kept:
+                    continue
+                blob = self.blob_path(digest)
+                keys = [key for key, entry in index.items() if entry['md5'] == digest]
+                for path in {path for key in keys for path in index[key].get('paths', [])}:
+                    try:
+                        if os.path.samefile(path, blob):
+                            os.remove(path)
+                    except OSError:
+                        pass
+                try:
+                    os.remove(blob)
+                except OSError:
+                    pass
+                total -= size
+                for key in keys:
+                    evicted.append(key)
+                    del index[key]
+        self._update_index(update)
+        return evicted
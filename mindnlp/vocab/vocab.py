@@ -19,51 +19,157 @@
 
 import os
 import re
+import shutil
 import warnings
+import zlib
 from typing import Union
+import numpy as np
 from mindspore.dataset import TextBaseDataset
 from mindnlp.configs import DEFAULT_ROOT
 from mindnlp.utils import cache_file
 
+_ARRAY_NAMES = ('blob', 'offsets', 'hashes', 'table')
+
+
+def _hash_tokens(encoded):
+    """crc32 of each encoded token, which, unlike `hash`, is stable across processes."""
+    return np.fromiter((zlib.crc32(token) for token in encoded), dtype=np.uint32, count=len(encoded))
+
+
+def _build_table(hashes, ids):
+    """
+    Build an open-addressing hash table, with linear probing, of `ids` keyed by their
+    `hashes`. Every round places the ids whose probed slot is free, one per slot, and
+    moves the others to their next slot.
+    """
+    size = 1 << max(int(2 * len(ids)).bit_length(), 3)
+    table = np.full(size, -1, dtype=np.int64)
+    pending = np.asarray(ids, dtype=np.int64)
+    slots = hashes[pending].astype(np.int64) & (size - 1)
+    while pending.size:
+        free = np.flatnonzero(table[slots] == -1)
+        placed_slots, first = np.unique(slots[free], return_index=True)
+        placed = free[first]
+        table[placed_slots] = pending[placed]
+        keep = np.ones(pending.size, dtype=bool)
+        keep[placed] = False
+        pending = pending[keep]
+        slots = (slots[keep] + 1) & (size - 1)
+    return table
+
+
 class Vocab:
     r"""
     Creates a vocab object which maps tokens to indices.
+
+    Tokens are stored compactly: a UTF-8 blob of all tokens in id order with an offsets
+    array for id-to-token lookups, and a hash table of ids keyed by crc32 for
+    token-to-id lookups, instead of a pair of Python dicts. A vocab saved with `save`
+    is memory-mapped by `load`.
     """
 
     def __init__(self, list_or_dict: Union[list, dict],
                  special_tokens: Union[list, tuple] = None,
                  special_first: bool = True):
-
-        self._token_dict = {}
+        self._blob = None
+        self._offsets = None
+        self._hashes = None
+        self._table = None
+        self._present = None
+        self._size = 0
+        self._extra_tokens = {}
+        self._extra_ids = {}
+        self._token_dict = None
+
+        token_dict = {}
 
         sp_len = len(special_tokens) if special_tokens is not None and special_first else 0
 
         if isinstance(list_or_dict, list):
             for index, value in enumerate(list_or_dict):
-                self._token_dict[value] = index + sp_len
+                token_dict[value] = index + sp_len
         elif isinstance(list_or_dict, dict):
             for key, value in list_or_dict.items():
                 if not isinstance(key, str):
                     raise ValueError(f'keys in dict must be str, but got {type(key)}')
                 if not isinstance(value, int):
                     raise ValueError(f'values in dict must be int, but got {type(key)}')
-                self._token_dict[key] = value + sp_len
+                token_dict[key] = value + sp_len
         else:
             raise ValueError(f'Vocab only support list or dict, but get {type(list_or_dict)}')
 
         if special_tokens is not None:
-            offset = 0 if special_first else len(self._token_dict)
+            offset = 0 if special_first else len(token_dict)
             for idx, tok in enumerate(special_tokens):
-                self._token_dict[tok] = idx + offset
-
-        self._index_dict = {v: k for k, v in self._token_dict.items()}
+                token_dict[tok] = idx + offset
+
+        index_dict = {v: k for k, v in token_dict.items()}
+        size = max(index_dict) + 1 if index_dict else 0
+        tokens = [index_dict.get(index, '') for index in range(size)]
+        present = None
+        if len(index_dict) < size:
+            present = np.zeros(size, dtype=bool)
+            present[list(index_dict)] = True
+        self._set_tokens([token.encode('utf-8') for token in tokens], present)
+
+    def _set_tokens(self, encoded, present=None):
+        """Build the arrays from the encoded tokens of ids `0..len(encoded)-1`, skipping ids not `present`."""
+        offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+        np.cumsum([len(token) for token in encoded], out=offsets[1:])
+        hashes = _hash_tokens(encoded)
+        ids = np.arange(len(encoded)) if present is None else np.flatnonzero(present)
+        self._set_arrays(np.frombuffer(b''.join(encoded), dtype=np.uint8), offsets, hashes,
+                         _build_table(hashes, ids), present)
+
+    def _set_arrays(self, blob, offsets, hashes, table, present=None):
+        self._blob = blob
+        self._offsets = offsets
+        self._hashes = hashes
+        self._table = table
+        self._present = present
+        self._size = len(offsets) - 1 if present is None else int(present.sum())
+        self._extra_tokens = {}
+        self._extra_ids = {}
+        self._token_dict = None
+
+    def __getstate__(self):
+        # The token dict is derived from the arrays, so it is neither pickled nor fingerprinted.
+        state = self.__dict__.copy()
+        state['_token_dict'] = None
+        return state
+
+    def _token_bytes(self, index):
+        return self._blob[self._offsets[index]:self._offsets[index + 1]].tobytes()
+
+    def _find(self, token):
+        """Return the id of `token`, or None."""
+        extra = self._extra_tokens.get(token)
+        if extra is not None:
+            return extra
+        encoded = token.encode('utf-8')
+        token_hash = zlib.crc32(encoded)
+        mask = len(self._table) - 1
+        slot = token_hash & mask
+        while True:
+            index = int(self._table[slot])
+            if index < 0:
+                return None
+            if self._hashes[index] == token_hash and self._token_bytes(index) == encoded:
+                return index
+            slot = (slot + 1) & mask
+
+    def _token(self, index):
+        """Return the token of id `index`, or None."""
+        if 0 <= index < len(self._offsets) - 1 and (self._present is None or self._present[index]):
+            return self._token_bytes(index).decode('utf-8')
+        return self._extra_ids.get(index)
 
     def __len__(self) -> int:
         r"""
         Returns:
             - int, The length of the vocab.
         """
-        return len(self._token_dict)
+        return self._size + len(self._extra_tokens)
 
     def __contains__(self, token: str) -> bool:
         r"""
@@ -73,7 +179,7 @@ class Vocab:
         Returns:
             - bool, Whether the token is member of vocab or not.
         """
-        return token in self._token_dict
+        return isinstance(token, str) and self._find(token) is not None
 
     def __getitem__(self, token: str) -> int:
         r"""
@@ -84,43 +190,57 @@ class Vocab:
             - int, The index corresponding to the associated token.
         """
 
-        return self._token_dict.get(token, None)
+        return self._find(token)
 
 
     def __call__(self, token_or_id):
         if isinstance(token_or_id, str):
-            return self._token_dict.get(token_or_id, None)
+            return self._find(token_or_id)
         if isinstance(token_or_id, int):
-            return self._index_dict.get(token_or_id, None)
+            return self._token(token_or_id)
 
         raise ValueError(f'not support token type {type(token_or_id)}')
 
-    def lookup_ids(self, token_or_list):
+    def lookup_ids(self, token_or_list, unk_id=None):
         """
         Converts a token string or a sequence of tokens in a single integer id or a sequence of ids.
+        A NumPy array of tokens is converted at once into an array of ids of the same shape,
+        looking up each distinct token once.
 
         Args:
-            token_or_list (Union[str, list[str]]): One or several token(s) to convert to token id(s).
+            token_or_list (Union[str, list[str], numpy.ndarray]): One or several token(s) to convert to token id(s).
+            unk_id (int): Id of tokens not in the vocab. Default: None, raise an error for them.
 
         Returns:
             - list[int], The token id or list of token ids.
               if only one token used to lookup,
               return one id instead of a list of ids.
 
+        Raises:
+            ValueError: If `unk_id` is None and a token of a list or array is not in the vocab.
+
         Examples:
             >>> import mindspore.dataset.text as text
             >>> vocab = text.Vocab.from_list(["w1", "w2", "w3"], special_tokens=["<unk>"], special_first=True)
             >>> ids = vocab.lookup_ids(["w1", "w3"])
         """
         if isinstance(token_or_list, str):
-            return self._token_dict.get(token_or_list)
+            return self._find(token_or_list)
+
+        if isinstance(token_or_list, np.ndarray):
+            uniques, inverse = np.unique(token_or_list, return_inverse=True)
+            ids = np.array(self.lookup_ids([str(token) for token in uniques], unk_id), dtype=np.int64)
+            return ids[inverse].reshape(token_or_list.shape)
 
         if isinstance(token_or_list, list):
             return_list = []
             for token in token_or_list:
-                if token not in self._token_dict:
-                    raise ValueError(f"{token} is not in vocab.")
-                return_list.append(self._token_dict[token])
+                index = self._find(token)
+                if index is None:
+                    if unk_id is None:
+                        raise ValueError(f"{token} is not in vocab.")
+                    index = unk_id
+                return_list.append(index)
             return return_list
 
         raise ValueError(f'lookup only support str and list, but got {type(token_or_list)}.')
@@ -128,10 +248,11 @@ class Vocab:
     def lookup_tokens(self, index_or_list):
         """
         Converts a single index or a sequence of indices in a token or a sequence of tokens.
-        If id does not exist, return empty string.
+        If id does not exist, return empty string. A NumPy array of ids is converted at once
+        into an array of tokens of the same shape, decoding each distinct id once.
 
         Args:
-            index_or_list (Union[int, list[int]]): The token id (or token ids) to convert to tokens.
+            index_or_list (Union[int, list[int], numpy.ndarray]): The token id (or token ids) to convert to tokens.
 
         Returns:
             - List<str>, The decoded token(s).
@@ -146,15 +267,21 @@ class Vocab:
             >>> vocab = text.Vocab.from_list(["w1", "w2", "w3"], special_tokens=["<unk>"], special_first=True)
             >>> token = vocab.lookup_tokens(0)
         """
-        if isinstance(index_or_list, int):
-            return self._index_dict.get(index_or_list, None)
+        if isinstance(index_or_list, (int, np.integer)):
+            return self._token(int(index_or_list))
+
+        if isinstance(index_or_list, np.ndarray):
+            uniques, inverse = np.unique(index_or_list, return_inverse=True)
+            tokens = np.array(self.lookup_tokens(uniques.tolist()) or [], dtype=str)
+            return tokens[inverse].reshape(index_or_list.shape)
 
         if isinstance(index_or_list, list):
             return_list = []
             for idx in index_or_list:
-                if idx not in self._index_dict:
+                token = self._token(idx)
+                if token is None:
                     raise ValueError(f"{idx} is not in vocab.")
-                return_list.append(self._index_dict[idx])
+                return_list.append(token)
             return return_list
 
         raise ValueError(f'lookup only support int and list, but got {type(index_or_list)}.')
@@ -169,15 +296,70 @@ class Vocab:
 
         """
         if isinstance(token, str):
-            if token in self._token_dict:
+            if token in self:
                 warnings.warn(f"{token} already exists in the vocab.")
             else:
-                append_id = len(self._token_dict)
-                self._token_dict[token] = append_id
-                self._index_dict[append_id] = token
+                append_id = len(self._offsets) - 1 + len(self._extra_tokens)
+                self._extra_tokens[token] = append_id
+                self._extra_ids[append_id] = token
+                self._token_dict = None
         else:
             raise TypeError(f"{token} is not str.")
 
+    def _merge_appended(self):
+        """Move the appended tokens into the arrays."""
+        if not self._extra_tokens:
+            return
+        size = max(len(self._offsets) - 1, max(self._extra_ids) + 1)
+        tokens = [b''] * size
+        present = np.zeros(size, dtype=bool)
+        for index in range(len(self._offsets) - 1):
+            if self._present is None or self._present[index]:
+                tokens[index] = self._token_bytes(index)
+                present[index] = True
+        for index, token in self._extra_ids.items():
+            tokens[index] = token.encode('utf-8')
+            present[index] = True
+        self._set_tokens(tokens, None if present.all() else present)
+
+    def save(self, path):
+        """
+        Save the vocab in a binary format that `load` memory-maps.
+
+        Args:
+            path (str): Directory the arrays of the vocab are saved to.
+        """
+        self._merge_appended()
+        tmp_path = f'{path}.tmp{os.getpid()}'
+        os.makedirs(tmp_path, exist_ok=True)
+        for name in _ARRAY_NAMES:
+            np.save(os.path.join(tmp_path, name + '.npy'), getattr(self, '_' + name))
+        if self._present is not None:
+            np.save(os.path.join(tmp_path, 'present.npy'), self._present)
+        if os.path.exists(path):
+            shutil.rmtree(path)
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path, mmap=True):
+        """
+        Load a vocab saved by `save`.
+
+        Args:
+            path (str): Directory of the saved vocab.
+            mmap (bool): Whether to memory-map the arrays instead of reading them. Default: True.
+
+        Returns:
+            - Vocab, the loaded vocab.
+        """
+        mmap_mode = 'r' if mmap else None
+        arrays = [np.load(os.path.join(path, name + '.npy'), mmap_mode=mmap_mode) for name in _ARRAY_NAMES]
+        present_path = os.path.join(path, 'present.npy')
+        present = np.load(present_path) if os.path.exists(present_path) else None
+        vocab = cls.__new__(cls)
+        vocab._set_arrays(*arrays, present)
+        return vocab
+
     @classmethod
     def from_dataset(cls, dataset, columns=None, freq_range=None, top_k=None, special_tokens=None, special_first=True):
         """
@@ -244,27 +426,46 @@ class Vocab:
             - Vocab, Returns a vocab generated from the url download.
         """
 
-        tokens = []
         url = pretrained_aliases[name]
 
         cache_dir = os.path.join(root, "vocabs")
         download_file_name = re.sub(r".+/", "", url)
         path, _ = cache_file(filename=download_file_name, cache_dir=cache_dir, url=url)
 
-        with open(path, 'r', encoding='utf-8') as file:
+        with open(path, 'rb') as file:
             file.readline()
-            for line in file:
-                tokens.append(line.rstrip("\n"))
-
-        vocab = Vocab(tokens, list(special_tokens), special_first)
+            tokens = [line.rstrip(b'\r\n') for line in file]
+
+        specials = [token.encode('utf-8') for token in special_tokens]
+        start = 0 if special_first else len(tokens)
+        encoded = specials + tokens if special_first else tokens + specials
+        # As in a dict, a repeated token of the file keeps its last id, and tokens of the file
+        # equal to a special token are superseded by it.
+        last = {token: index for index, token in enumerate(encoded)}
+        for index in range(start, start + len(specials)):
+            last[encoded[index]] = index
+        present = None
+        if len(last) < len(encoded):
+            present = np.zeros(len(encoded), dtype=bool)
+            present[list(last.values())] = True
+        vocab = cls.__new__(cls)
+        vocab._set_tokens(encoded, present)
 
         return vocab
 
     @property
     def vocab(self):
-        """return vocab dict."""
+        """return vocab dict. It is built on the first access and shared by later ones, so it should not be modified."""
+        if self._token_dict is None:
+            token_dict = {}
+            for index in range(len(self._offsets) - 1):
+                if self._present is None or self._present[index]:
+                    token_dict[self._token_bytes(index).decode('utf-8')] = index
+            token_dict.update(self._extra_tokens)
+            self._token_dict = token_dict
         return self._token_dict
 
+
 pretrained_aliases = {
     "glove.6B.50d": "https://download.mindspore.cn/toolkits/mindnlp/vocab/Glove/glove.6B.50d.txt",
     "glove.6B.100d": "https://download.mindspore.cn/toolkits/mindnlp/vocab/Glove/glove.6B.100d.txt",
@@ -29,7 +29,6 @@ from mindnlp._legacy.functional import argmax
 from mindnlp.workflow.work import Work
 from mindnlp.workflow.downstream import BertForSentimentAnalysis
 from mindnlp.models import BertConfig
-from mindnlp.transforms import PadTransform
 from mindnlp.transforms.tokenizers import BertTokenizer
 
 usage = r"""
@@ -112,34 +111,17 @@ class SentimentAnalysisWork(Work):
         # Get the config from the kwargs
         batch_size = self.kwargs["batch_size"] if "batch_size" in self.kwargs else 1
 
-        examples = []
-        filter_inputs = []
-        for input_data in inputs:
-            if not (isinstance(input_data, str) and len(input_data) > 0):
-                continue
-            filter_inputs.append(input_data)
-            ids = self._tokenizer.execute_py(input_data)
-            lens = len(ids)
-            examples.append((ids, lens))
-
-        batches = [examples[idx: idx + batch_size]
-                   for idx in range(0, len(examples), batch_size)]
+        filter_inputs = [input_data for input_data in inputs
+                         if isinstance(input_data, str) and len(input_data) > 0]
+        batches = [self._tokenizer.encode_batch(filter_inputs[idx: idx + batch_size],
+                                                pad_id=self.kwargs["pad_token_id"])[0]
+                   for idx in range(0, len(filter_inputs), batch_size)]
         outputs = {}
         outputs["text"] = filter_inputs
         outputs["data_loader"] = batches
 
         return outputs
 
-    def _batchify_fn(self, samples):
-        seq_list = [sample[1] for sample in samples]
-        max_length = max(seq_list)
-        outputs = []
-        pader = PadTransform(max_length=max_length,
-                             pad_value=self.kwargs["pad_token_id"])
-        for sample in samples:
-            outputs.append(pader(sample[0]))
-        return Tensor(outputs)
-
     def _run_model(self, inputs):
         """
         Run the model.
@@ -147,7 +129,7 @@ class SentimentAnalysisWork(Work):
         results = []
         scores = []
         for batch in inputs["data_loader"]:
-            ids = self._batchify_fn(batch)
+            ids = Tensor(batch)
             outputs = self._model(ids)
             probs = F.softmax(outputs, axis=-1)
             idx = argmax(probs, dim=-1).asnumpy().tolist()
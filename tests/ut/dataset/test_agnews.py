@@ -82,3 +82,13 @@ class TestAGNEWS(unittest.TestCase):
 
         test_dataset = test_dataset.create_tuple_iterator()
         assert (next(test_dataset)[1]).dtype == ms.int32
+
+    @pytest.mark.download
+    def test_agnews_process_sort_by_length(self):
+        """test agnews process with length-sorted batches"""
+        test_dataset = AG_NEWS(split='test')
+        test_dataset = AG_NEWS_Process(test_dataset, batch_size=64, sort_by_length=True)
+
+        lengths = [data['text'].shape[1] for data in test_dataset.create_dict_iterator()]
+        assert lengths == sorted(lengths)
+        assert lengths[-1] <= 500
@@ -0,0 +1,130 @@
+# Copyright 2022 Huawei Technologies Co., Ltd
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ============================================================================
+"""
+Test process cache
+"""
+import csv
+import os
+import shutil
+import tempfile
+import unittest
+from mindspore.dataset import GeneratorDataset, text
+from mindnlp.dataset import enable_process_cache, disable_process_cache
+from mindnlp.dataset.process import common_process, common_columns_process
+from mindnlp.dataset.text_classification.imdb import IMDB_Process
+from mindnlp.vocab import Vocab
+from mindnlp.dataset.text_classification.agnews import Agnews
+
+
+class TestProcessCache(unittest.TestCase):
+    r"""
+    Test process cache
+    """
+
+    def setUp(self):
+        self.root = tempfile.mkdtemp()
+        self.cache_dir = os.path.join(self.root, "cache")
+        self.path = os.path.join(self.root, "train.csv")
+        with open(self.path, "w", encoding="utf-8", newline="") as file:
+            csv.writer(file).writerows([["1", "title", "a b c"],
+                                        ["2", "title", "b c"],
+                                        ["3", "title", "c d e f"]])
+        enable_process_cache(self.cache_dir)
+
+    def tearDown(self):
+        disable_process_cache()
+        shutil.rmtree(self.root)
+
+    def _dataset(self):
+        return GeneratorDataset(Agnews(self.path), column_names=["label", "text"], shuffle=False)
+
+    def _run(self, vocab=None):
+        result = common_process(self._dataset(), "text", text.WhitespaceTokenizer(), vocab)
+        dataset, vocab = result if isinstance(result, tuple) else (result, vocab)
+        rows = [(str(label), ids.tolist()) for label, ids in
+                dataset.create_tuple_iterator(output_numpy=True, num_epochs=1)]
+        return rows, vocab
+
+    def test_common_process_cached(self):
+        """test the cached result matches the uncached one"""
+        disable_process_cache()
+        expected_rows, expected_vocab = self._run()
+        enable_process_cache(self.cache_dir)
+
+        rows, vocab = self._run()
+        assert rows == expected_rows
+        assert vocab.vocab() == expected_vocab.vocab()
+        assert len(os.listdir(self.cache_dir)) == 1
+
+        rows, vocab = self._run()
+        assert rows == expected_rows
+        assert vocab.vocab() == expected_vocab.vocab()
+        assert len(os.listdir(self.cache_dir)) == 1
+
+    def test_common_process_key(self):
+        """test a different vocab or source file gives a new cache entry"""
+        _, vocab = self._run()
+        self._run(vocab)
+        assert len(os.listdir(self.cache_dir)) == 2
+
+        with open(self.path, "a", encoding="utf-8", newline="") as file:
+            csv.writer(file).writerow(["4", "title", "g"])
+        rows, _ = self._run()
+        assert len(rows) == 4
+        assert len(os.listdir(self.cache_dir)) == 3
+
+    def test_common_process_unfingerprintable(self):
+        """test sources without a file run uncached"""
+        dataset = GeneratorDataset([("a b",), ("c",)], column_names=["text"], shuffle=False)
+        _, vocab = common_process(dataset, "text", text.WhitespaceTokenizer(), None)
+        assert "a" in vocab.vocab()
+        assert not os.path.exists(self.cache_dir)
+
+    def test_imdb_process_cached(self):
+        """test IMDB_Process batches the same ids with and without the cache"""
+        vocab = Vocab(["<pad>", "<unk>", "a", "b", "c"])
+
+        def _batches():
+            dataset = IMDB_Process(self._dataset(), text.WhitespaceTokenizer(), vocab, batch_size=2, max_len=3)
+            return [[column.tolist() for column in batch]
+                    for batch in dataset.create_tuple_iterator(output_numpy=True, num_epochs=1)]
+
+        disable_process_cache()
+        expected = _batches()
+        enable_process_cache(self.cache_dir)
+        assert _batches() == expected
+        assert _batches() == expected
+        assert len(os.listdir(self.cache_dir)) == 1
+        assert expected[0][1] == [[1, 2, 3], [1, 3, 4]]
+
+    def test_common_columns_process_cached(self):
+        """test several columns are processed with one shared vocab, through the cache"""
+        def _label_to_str(label):
+            # `str` itself is a class, which `map` does not take as an operation.
+            return str(label)
+
+        def _run():
+            dataset = self._dataset().map(_label_to_str, "label")
+            dataset, vocab = common_columns_process(dataset, ["label", "text"], text.WhitespaceTokenizer(), None)
+            rows = [[column.tolist() for column in row]
+                    for row in dataset.create_tuple_iterator(output_numpy=True, num_epochs=1)]
+            return rows, vocab.vocab()
+
+        disable_process_cache()
+        expected = _run()
+        enable_process_cache(self.cache_dir)
+        assert _run() == expected
+        assert _run() == expected
+        assert len(os.listdir(self.cache_dir)) == 1
@@ -0,0 +1,198 @@
+# Copyright 2022 Huawei Technologies Co., Ltd
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ============================================================================
+"""
+Test dataset readers
+"""
+import csv
+import json
+import os
+import pickle
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+from mindspore.dataset import GeneratorDataset
+from mindnlp.dataset.readers import CSVReader, JSONLReader, iter_json_array
+from mindnlp.dataset.sources import set_dataset_epoch
+from mindnlp.dataset.text_classification import agnews
+from mindnlp.dataset.text_classification.agnews import Agnews, AG_NEWS
+from mindnlp.dataset.question_answer.squad1 import Squad1
+from mindnlp.dataset.question_answer.squad2 import Squad2
+
+
+class TestCSVReader(unittest.TestCase):
+    r"""
+    Test CSVReader
+    """
+
+    def setUp(self):
+        self.root = tempfile.mkdtemp()
+        self.path = os.path.join(self.root, "test.csv")
+        self.rows = [["1", "title one", "plain text"],
+                     ["2", "title, with comma", "text with \"\"quotes\"\""],
+                     ["3", "multi\nline title", "text\nwith\nnewlines"],
+                     ["4", "last", ""]]
+        with open(self.path, "w", encoding="utf-8", newline="") as file:
+            csv.writer(file).writerows(self.rows)
+
+    def tearDown(self):
+        shutil.rmtree(self.root)
+
+    def test_csv_reader(self):
+        """test records are parsed as csv.reader does"""
+        with open(self.path, "r", encoding="utf-8", newline="") as file:
+            expected = list(csv.reader(file))
+        reader = CSVReader(self.path)
+        assert len(reader) == len(expected)
+        assert [reader[i] for i in range(len(reader))] == expected
+        assert reader[-1] == expected[-1]
+        with self.assertRaises(IndexError):
+            _ = reader[len(reader)]
+
+    def test_csv_reader_index_cache(self):
+        """test the index is cached and reused"""
+        reader = CSVReader(self.path)
+        assert os.path.exists(self.path + ".idx.npy")
+        reader = pickle.loads(pickle.dumps(reader))
+        assert CSVReader(self.path).offsets.tolist() == reader.offsets.tolist()
+        assert reader[2][1] == "multi\nline title"
+
+    def test_csv_source(self):
+        """test dataset source backed by CSVReader"""
+        dataset = GeneratorDataset(Agnews(self.path), ["label", "text"], shuffle=False)
+        assert dataset.get_dataset_size() == 4
+        labels = [data["label"].asnumpy().item() for data in dataset.create_dict_iterator()]
+        assert labels == [0, 1, 2, 3]
+
+
+class TestJSONReaders(unittest.TestCase):
+    r"""
+    Test JSONLReader and iter_json_array
+    """
+
+    def setUp(self):
+        self.root = tempfile.mkdtemp()
+        self.squad = {"version": "v2.0", "data": [
+            {"title": "t1", "paragraphs": [
+                {"context": "a b c", "qas": [
+                    {"id": "q1", "question": "what a?", "is_impossible": False,
+                     "answers": [{"text": "a", "answer_start": 0}, {"text": "a b", "answer_start": 0}]},
+                    {"id": "q2", "question": "what z?", "is_impossible": True, "answers": []}]}]},
+            {"title": "t2", "paragraphs": [
+                {"context": "\u4e2d\u6587 [x]", "qas": [
+                    {"id": "q3", "question": "which?", "is_impossible": False,
+                     "answers": [{"text": "[x]", "answer_start": 3}]}]}]}]}
+        self.squad_path = os.path.join(self.root, "squad.json")
+        with open(self.squad_path, "w", encoding="utf-8") as file:
+            json.dump(self.squad, file, ensure_ascii=False, indent=1)
+
+    def tearDown(self):
+        shutil.rmtree(self.root)
+
+    def test_jsonl_reader(self):
+        """test blank lines are skipped"""
+        path = os.path.join(self.root, "test.jsonl")
+        with open(path, "w", encoding="utf-8") as file:
+            file.write('\n{"content": "a"}\n\n{"content": "b", "summary": "c"}\n\n')
+        reader = JSONLReader(path)
+        assert len(reader) == 2
+        assert reader[0] == {"content": "a"}
+        assert reader[-1] == {"content": "b", "summary": "c"}
+
+    def test_iter_json_array(self):
+        """test streaming an array with chunks smaller than its elements"""
+        for chunk_size in (1, 7, 1 << 20):
+            articles = list(iter_json_array(self.squad_path, "data", chunk_size))
+            assert articles == self.squad["data"]
+        with self.assertRaises(KeyError):
+            list(iter_json_array(self.squad_path, "missing"))
+
+    def test_squad_sources(self):
+        """test SQuAD sources converted to JSON Lines"""
+        squad1 = Squad1(self.squad_path)
+        assert len(squad1) == 2
+        assert squad1[0] == ("q1", "a b c", "what a?", "a", 0)
+        assert squad1[1] == ("q3", "\u4e2d\u6587 [x]", "which?", "[x]", 3)
+        assert os.path.exists(self.squad_path + ".squad1.jsonl")
+
+        squad2 = pickle.loads(pickle.dumps(Squad2(self.squad_path)))
+        assert len(squad2) == 3
+        assert squad2[0] == ("a b c", "what a?", ["a", "a b"], [0, 0])
+        assert squad2[1] == ("a b c", "what z?", [[""]], [[-1]])
+
+
+class TestShardedSource(unittest.TestCase):
+    r"""
+    Test ShardedSource
+    """
+
+    def setUp(self):
+        self.root = tempfile.mkdtemp()
+        self.path = os.path.join(self.root, "test.csv")
+        with open(self.path, "w", encoding="utf-8", newline="") as file:
+            csv.writer(file).writerows([[str(i % 4 + 1), f"t{i}", "text"] for i in range(11)])
+
+    def tearDown(self):
+        shutil.rmtree(self.root)
+
+    def test_shards(self):
+        """test shards are disjoint, balanced and cover all records"""
+        texts = []
+        for shard_id in range(3):
+            source = Agnews(self.path, num_shards=3, shard_id=shard_id)
+            assert len(source) in (3, 4)
+            texts.extend(source[i][1] for i in range(len(source)))
+        assert sorted(texts) == sorted(Agnews(self.path)[i][1] for i in range(11))
+        with self.assertRaises(ValueError):
+            Agnews(self.path, num_shards=3, shard_id=3)
+        with self.assertRaises(ValueError):
+            Agnews(self.path, num_shards=3)
+
+    def test_shuffle(self):
+        """test the shuffle is deterministic for a seed and epoch, and stays within the shard"""
+        source = Agnews(self.path, num_shards=2, shard_id=0, shuffle=True, seed=1)
+        other = pickle.loads(pickle.dumps(Agnews(self.path, num_shards=2, shard_id=0, shuffle=True, seed=1)))
+        orders = []
+        for epoch in range(3):
+            source.set_epoch(epoch)
+            other.set_epoch(epoch)
+            order = [source[i][1] for i in range(len(source))]
+            assert order == [other[i][1] for i in range(len(other))]
+            assert sorted(order) == sorted(f"t{i}. text" for i in range(0, 11, 2))
+            orders.append(order)
+        assert orders[0] != orders[1] or orders[1] != orders[2]
+
+    def test_loader_shuffle(self):
+        """test the loader shuffles by seed in the source instead of the GeneratorDataset"""
+        with mock.patch.object(agnews, "cache_file", return_value=(self.path, None)):
+            dataset = AG_NEWS(split="train", shuffle=True, seed=1, num_shards=2, shard_id=0)
+        source = Agnews(self.path, num_shards=2, shard_id=0, shuffle=True, seed=1)
+        texts = [str(row[1]) for row in dataset.create_tuple_iterator(output_numpy=True, num_epochs=1)]
+        assert texts == [source[i][1] for i in range(len(source))]
+
+    def test_workers(self):
+        """test iteration splits the shard among workers"""
+        texts = []
+        for worker_id in range(2):
+            source = Agnews(self.path, num_shards=2, shard_id=1, num_workers=2, worker_id=worker_id)
+            texts.extend(row[1] for row in source)
+        assert sorted(texts) == sorted(f"t{i}. text" for i in range(1, 11, 2))
+
+    def test_set_dataset_epoch(self):
+        """test the epoch reaches the source of a pipeline"""
+        source = Agnews(self.path, shuffle=True)
+        dataset = GeneratorDataset(source, ["label", "text"], shuffle=False).batch(2)
+        set_dataset_epoch(dataset, 5)
+        assert source.epoch == 5
@@ -0,0 +1,130 @@
+# Copyright 2022 Huawei Technologies Co., Ltd
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ============================================================================
+"""
+Test dataset utils
+"""
+import shutil
+import tempfile
+import unittest
+import numpy as np
+from mindspore.dataset import GeneratorDataset
+from mindnlp.dataset.process_cache import _CachedSource, _write_cache
+from mindnlp.dataset.sources import set_dataset_epoch
+from mindnlp.dataset.utils import make_length_sorted_batch, make_token_budget_batch, TokenBudgetSampler
+
+
+class TestLengthSortedBatch(unittest.TestCase):
+    r"""
+    Test make_length_sorted_batch
+    """
+
+    def setUp(self):
+        self.lengths = [5, 2, 7, 3, 3, 1, 9]
+        self.data = [(np.arange(1, n + 1, dtype=np.int32), np.int32(n)) for n in self.lengths]
+
+    def test_make_length_sorted_batch(self):
+        """test batches are sorted by length and padded to their own max length"""
+        dataset = GeneratorDataset(self.data, ["text", "label"], shuffle=False)
+        dataset = make_length_sorted_batch(dataset, "text", {"text": 0}, 3)
+
+        batches = list(dataset.create_dict_iterator(output_numpy=True))
+        assert len(batches) == 3
+        assert [batch["text"].shape[1] for batch in batches] == [3, 7, 9]
+        assert np.array_equal(batches[0]["text"], [[1, 0, 0], [1, 2, 0], [1, 2, 3]])
+
+        index = np.concatenate([batch["sample_index"] for batch in batches])
+        labels = np.concatenate([batch["label"] for batch in batches])
+        assert sorted(index.tolist()) == list(range(len(self.lengths)))
+        assert np.array_equal(labels, np.array(self.lengths)[index])
+        assert isinstance(dataset.source.rows, _CachedSource)
+
+
+class TestTokenBudgetBatch(unittest.TestCase):
+    r"""
+    Test TokenBudgetSampler and make_token_budget_batch
+    """
+
+    def setUp(self):
+        self.lengths = [5, 2, 7, 3, 3, 1, 9, 4, 2, 6]
+        self.data = [(np.arange(1, n + 1, dtype=np.int32), np.int32(n)) for n in self.lengths]
+
+    def test_sampler(self):
+        """test batches fit the budget and cover every sample once"""
+        sampler = TokenBudgetSampler(self.lengths, max_tokens=8, shuffle=False)
+        batches = [batch.tolist() for batch in sampler]
+        assert batches[:2] == [[5, 1, 8], [3, 4]]
+        assert sorted(sum(batches, [])) == list(range(len(self.lengths)))
+        for batch in batches:
+            assert len(batch) == 1 or max(self.lengths[i] for i in batch) * len(batch) <= 8
+
+    def test_sampler_shuffle(self):
+        """test the shuffle depends only on the seed and epoch"""
+        sampler = TokenBudgetSampler(self.lengths, max_tokens=10, sort_window=4, seed=2)
+        other = TokenBudgetSampler(self.lengths, max_tokens=10, sort_window=4, seed=2)
+        orders = []
+        for epoch in range(3):
+            sampler.set_epoch(epoch)
+            other.set_epoch(epoch)
+            order = [batch.tolist() for batch in sampler]
+            assert order == [batch.tolist() for batch in other]
+            assert sorted(sum(order, [])) == list(range(len(self.lengths)))
+            orders.append(order)
+        assert orders[0] != orders[1] or orders[1] != orders[2]
+        with self.assertRaises(ValueError):
+            TokenBudgetSampler(self.lengths, max_tokens=0)
+
+    def test_make_token_budget_batch(self):
+        """test batches are padded to their own max length within the budget"""
+        dataset = GeneratorDataset(self.data, ["text", "label"], shuffle=False)
+        dataset = make_token_budget_batch(dataset, "text", {"text": 0}, 12)
+
+        for epoch in range(2):
+            set_dataset_epoch(dataset, epoch)
+            batches = list(dataset.create_dict_iterator(output_numpy=True))
+            labels = np.concatenate([batch["label"] for batch in batches])
+            assert sorted(labels.tolist()) == sorted(self.lengths)
+            for batch in batches:
+                assert batch["text"].shape[1] == batch["label"].max()
+                assert batch["text"].shape[0] == 1 or batch["text"].size <= 12
+                assert np.array_equal((batch["text"] != 0).sum(axis=1), batch["label"])
+
+    def test_token_budget_batch_size(self):
+        """test the number of batches is known without a pass and is the same every epoch"""
+        sampler = TokenBudgetSampler(self.lengths, max_tokens=10, sort_window=4, seed=2)
+        sizes = set()
+        for epoch in range(5):
+            sampler.set_epoch(epoch)
+            sizes.add(len(sampler.batches()))
+        assert sizes == {len(sampler)}
+
+        dataset = GeneratorDataset(self.data, ["text", "label"], shuffle=False)
+        dataset = make_token_budget_batch(dataset, "text", {"text": 0}, 12, sort_window=4)
+        assert isinstance(dataset.source.rows, _CachedSource)
+        for epoch in range(3):
+            set_dataset_epoch(dataset, epoch)
+            assert len(list(dataset.create_tuple_iterator(num_epochs=1))) == dataset.get_dataset_size()
+
+    def test_token_budget_batch_cached_rows(self):
+        """test rows loaded from the process cache are read in place"""
+        root = tempfile.mkdtemp()
+        try:
+            _write_cache(GeneratorDataset(self.data, ["text", "label"], shuffle=False), root)
+            dataset = GeneratorDataset(_CachedSource(root), ["text", "label"], shuffle=False)
+            dataset = make_token_budget_batch(dataset, "text", {"text": 0}, 12, shuffle=False)
+            assert dataset.source.rows.path == root
+            labels = np.concatenate([batch["label"] for batch in dataset.create_dict_iterator(output_numpy=True)])
+            assert sorted(labels.tolist()) == sorted(self.lengths)
+        finally:
+            shutil.rmtree(root)
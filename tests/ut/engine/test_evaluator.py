@@ -16,6 +16,8 @@
 # pylint: disable=C0103
 # pylint: disable=W0621
 
+import multiprocessing
+import tempfile
 import unittest
 import numpy as np
 from ddt import ddt, data
@@ -23,7 +25,7 @@ from mindspore import nn
 import mindspore.dataset as ds
 
 from mindnlp.engine.evaluator import Evaluator
-from mindnlp.metrics import Accuracy
+from mindnlp.metrics import Accuracy, Distinct
 from mindnlp.engine.callbacks.timer_callback import TimerCallback
 
 
@@ -67,3 +69,59 @@ class TestEvaluatorRun(unittest.TestCase):
         evaluator = Evaluator(network=self.net, eval_dataset=self.eval_dataset, metrics=self.metric,
                               callbacks=self.callbacks, jit=jit)
         evaluator.run(tgt_columns='label')
+
+    def test_evaluator_predict(self):
+        """test evaluator predict"""
+        evaluator = Evaluator(network=self.net, eval_dataset=self.eval_dataset, metrics=self.metric)
+        reader = evaluator.predict(tempfile.mkdtemp(), top_k=1)
+        assert len(reader) == 100
+        assert reader['output_0_indices'].shape == (100, 1)
+
+    @data('O1', 'O3')
+    def test_evaluator_run_amp(self, amp_level):
+        """test evaluator run with mixed precision"""
+        evaluator = Evaluator(network=self.net, eval_dataset=self.eval_dataset, metrics=self.metric,
+                              amp_level=amp_level)
+        evaluator.run(tgt_columns='label')
+
+    def test_evaluator_static_shape(self):
+        """test evaluator pads the last partial batch"""
+        dataset = ds.GeneratorDataset(MyDataset(), ["data", "label"], shuffle=False).batch(30)
+        evaluator = Evaluator(network=self.net, eval_dataset=dataset, metrics=self.metric,
+                              jit=True, static_shape=True)
+        reader = evaluator.predict(tempfile.mkdtemp())
+        assert len(reader) == 100
+        assert evaluator.static_batch_size == 30
+
+    def test_evaluator_static_shape_metrics(self):
+        """test padding the last partial batch does not change the metric values"""
+        results = []
+        for static_shape in (False, True):
+            dataset = ds.GeneratorDataset(MyDataset(), ["data", "label"], shuffle=False).batch(30)
+            evaluator = Evaluator(network=self.net, eval_dataset=dataset, metrics=Accuracy(),
+                                  jit=True, static_shape=static_shape)
+            evaluator.run(tgt_columns='label')
+            results.append(evaluator.metrics[0].eval())
+        assert results[0] == results[1]
+
+    def test_evaluator_amp_keeps_network(self):
+        """test mixed precision does not change the network being trained"""
+        evaluator = Evaluator(network=self.net, eval_dataset=self.eval_dataset, metrics=self.metric,
+                              amp_level='O2')
+        evaluator.run(tgt_columns='label')
+        assert evaluator.eval_network is not self.net
+        assert not getattr(self.net.fc, 'fp16', False)
+        assert [id(param) for param in evaluator.eval_network.get_parameters()] == \
+            [id(param) for param in self.net.get_parameters()]
+
+    def test_evaluator_metric_pool_error(self):
+        """test metric workers are stopped when the forward pass raises"""
+        evaluator = Evaluator(network=self.net, eval_dataset=self.eval_dataset, metrics=[self.metric, Distinct()],
+                              metric_workers=1)
+        def _raise(_):
+            raise RuntimeError('forward failed')
+        evaluator.eval_func = _raise
+        with self.assertRaises(RuntimeError):
+            evaluator.run(tgt_columns='label')
+        assert evaluator.metric_pool is None
+        assert not multiprocessing.active_children()
@@ -0,0 +1,75 @@
+# Copyright 2022 Huawei Technologies Co., Ltd
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ============================================================================
+"""Test MetricPool"""
+
+import unittest
+import numpy as np
+
+from mindnlp.engine.metric_pool import MetricPool
+from mindnlp.metrics import BleuScore, EmScore
+
+
+class TestMetricPool(unittest.TestCase):
+    r"""
+    Test MetricPool
+    """
+    def setUp(self):
+        rng = np.random.RandomState(1)
+        words = ["the", "cat", "is", "on", "mat", "there", "a"]
+        self.cands = [[list(rng.choice(words, 7)) for _ in range(4)] for _ in range(20)]
+        self.refs = [[[list(rng.choice(words, 6)) for _ in range(2)] for _ in range(4)] for _ in range(20)]
+
+    def test_identical_to_serial(self):
+        """test parallel results are identical to serial results"""
+        serial = [BleuScore(), BleuScore(n_size=2)]
+        for cand, ref in zip(self.cands, self.refs):
+            for metric in serial:
+                metric.update(cand, ref)
+
+        metrics = [BleuScore(), BleuScore(n_size=2)]
+        pool = MetricPool(metrics, num_workers=2, ipc_batch_size=3)
+        pool.start()
+        for cand, ref in zip(self.cands, self.refs):
+            pool.update(cand, ref)
+        pool.close()
+
+        for metric, serial_metric in zip(metrics, serial):
+            assert metric.eval() == serial_metric.eval()
+
+    def test_worker_error(self):
+        """test errors raised in workers are re-raised"""
+        pool = MetricPool([EmScore()])
+        pool.start()
+        pool.update(1, 2)
+        with self.assertRaises(TypeError):
+            pool.close()
+
+    def test_terminate(self):
+        """test workers are stopped without waiting for queued updates"""
+        pool = MetricPool([BleuScore(), EmScore()], num_workers=2)
+        pool.start()
+        workers = [worker for worker, _, _ in pool._workers] # pylint: disable=protected-access
+        pool.update(self.cands[0], self.refs[0])
+        pool.terminate()
+        assert not any(worker.is_alive() for worker in workers)
+
+    def test_worker_died(self):
+        """test a worker exiting without results raises instead of waiting forever"""
+        pool = MetricPool([BleuScore(), EmScore()], num_workers=2)
+        pool.start()
+        pool._workers[0][0].terminate() # pylint: disable=protected-access
+        with self.assertRaises(RuntimeError):
+            pool.close()
+        assert not pool._workers # pylint: disable=protected-access
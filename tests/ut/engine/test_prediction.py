@@ -0,0 +1,84 @@
+# Copyright 2022 Huawei Technologies Co., Ltd
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ============================================================================
+"""Test PredictionWriter and PredictionReader"""
+
+import os
+import tempfile
+import unittest
+import numpy as np
+from mindspore import Tensor
+
+from mindnlp.engine.prediction import PredictionWriter, PredictionReader
+
+
+class TestPrediction(unittest.TestCase):
+    r"""
+    Test prediction spooling
+    """
+    def setUp(self):
+        self.output_dir = tempfile.mkdtemp()
+        self.batches = [np.random.randn(batch_size, 5).astype(np.float32) for batch_size in (4, 4, 3)]
+
+    def test_spool(self):
+        """test outputs are spooled in order"""
+        writer = PredictionWriter(self.output_dir)
+        for batch in self.batches:
+            writer.write((Tensor(batch), Tensor(batch.argmax(-1))))
+        reader = writer.close()
+
+        assert len(reader) == 11
+        assert np.allclose(reader['output_0'], np.concatenate(self.batches))
+        assert np.array_equal(PredictionReader(self.output_dir)['output_1'],
+                              np.concatenate(self.batches).argmax(-1))
+
+    def test_spool_top_k(self):
+        """test outputs are reduced to top k before spooling"""
+        writer = PredictionWriter(self.output_dir, top_k=2)
+        for batch in self.batches:
+            writer.write(Tensor(batch))
+        reader = writer.close()
+
+        expected = -np.sort(-np.concatenate(self.batches), axis=-1)[:, :2]
+        assert reader.names == ['output_0_indices', 'output_0_values']
+        assert np.allclose(reader['output_0_values'], expected)
+        assert reader[0]['output_0_indices'].shape == (2,)
+
+    def test_spool_shape_mismatch(self):
+        """test batches of different sample shape are rejected"""
+        writer = PredictionWriter(self.output_dir)
+        writer.write(Tensor(self.batches[0]))
+        with self.assertRaises(ValueError):
+            writer.write(Tensor(self.batches[0][:, :3]))
+
+    def test_spool_restore_order(self):
+        """test outputs are restored to the original order of the samples"""
+        outputs = np.concatenate(self.batches)
+        order = np.random.permutation(outputs.shape[0])
+        writer = PredictionWriter(self.output_dir)
+        for start in range(0, outputs.shape[0], 4):
+            writer.write(Tensor(outputs[order[start:start + 4]]), order[start:start + 4])
+        reader = writer.close()
+
+        assert np.allclose(reader['output_0'], outputs)
+
+    def test_spool_discard_on_error(self):
+        """test spooled files are closed and removed if an error is raised"""
+        with self.assertRaises(RuntimeError):
+            with PredictionWriter(self.output_dir) as writer:
+                writer.write(Tensor(self.batches[0]))
+                spool = writer.spools['output_0']
+                raise RuntimeError('forward failed')
+        assert spool.file.closed
+        assert not os.listdir(self.output_dir)
@@ -117,6 +117,29 @@ class TestClassPerplexity(unittest.TestCase):
 
         assert np.allclose(ppl, 2.23144, 1e-5, 1e-5)
 
+    def test_class_perplexity_from_logits(self):
+        """
+        Test class Perplexity
+
+        preds (Tensor): shape (2, 3, 2), logits
+        labels (Tensor): shape (2, 3), with ignored label
+        """
+        probs = np.array([[[0.2, 0.8], [0.3, 0.7], [0.9, 0.1]],
+                          [[0.6, 0.4], [0.5, 0.5], [0.1, 0.9]]])
+        labels = np.array([[1, 0, -100], [0, 1, 1]])
+
+        metric = Perplexity(ignore_label=-100)
+        metric.update(probs.reshape(-1, 2)[labels.reshape(-1) != -100],
+                      labels.reshape(-1)[labels.reshape(-1) != -100])
+        expected = metric.eval()
+
+        metric = Perplexity(ignore_label=-100, from_logits=True)
+        metric.update(Tensor(np.log(probs) + 3.0, mindspore.float32), Tensor(labels, mindspore.int32))
+        metric.update(np.log(probs) - 1.0, labels)
+        ppl = metric.eval()
+
+        assert np.allclose(ppl, expected, 1e-5, 1e-5)
+
 
 class TestClassBleuScore(unittest.TestCase):
     r"""
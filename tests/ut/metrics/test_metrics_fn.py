@@ -72,6 +72,19 @@ class TestPerplexity(unittest.TestCase):
 
         assert np.allclose(ppl, 5.37284, 1e-5, 1e-5)
 
+    def test_perplexity_from_logits(self):
+        """
+        Test perplexity
+        """
+        preds = np.array([[0.6, 0.3, 0.1], [0.3, 0.6, 0.1], [0.1, 0.6, 0.3], [0.1, 0.2, 0.7]])
+        labels = np.array([2, 1, 0, 1])
+        expected = perplexity_fn(preds, labels, ignore_label=None)
+        ppl = perplexity_fn(Tensor(np.log(preds), mindspore.float32), Tensor(labels, mindspore.int32),
+                            ignore_label=None, from_logits=True)
+
+        assert np.allclose(ppl, expected, 1e-5, 1e-5)
+
+
 class TestBleu(unittest.TestCase):
     r"""
     Test bleu
@@ -14,9 +14,17 @@
 # ============================================================================
 """Test Glove_embedding"""
 
+import os
+import shutil
+import tempfile
 import unittest
+import zipfile
+from unittest import mock
+import numpy as np
 from mindspore import Tensor
+from mindspore.dataset import text
 from mindnlp.modules.embeddings.glove_embedding import Glove
+from mindnlp.vocab import Vocab
 
 
 class TestGlove(unittest.TestCase):
@@ -42,3 +50,82 @@ class TestGlove(unittest.TestCase):
         g_res = embed(wordlist_input)
 
         assert g_res.shape == (2, 3)
+
+    def test_glove_from_pretrained_archive(self):
+        r"""
+        Unit test for glove embedding read from the archive without extracting.
+        """
+        root = tempfile.mkdtemp()
+        cache_dir = os.path.join(root, "embeddings", "Glove")
+        os.makedirs(cache_dir)
+        with zipfile.ZipFile(os.path.join(cache_dir, "glove.6B.zip"), "w") as zipf:
+            zipf.writestr("glove.6B.300d.txt", "".join(
+                f"word{i} " + " ".join([str(i)] * 300) + "\n" for i in range(3)))
+        try:
+            with mock.patch.dict(os.environ, {"CACHE_DIR": root}):
+                embed = Glove.from_pretrained(root=root)
+            assert embed.embed.shape == (5, 300)
+            assert embed.embed.asnumpy()[4, 0] == 2
+            assert not os.path.exists(os.path.join(cache_dir, "glove.6B.300d.txt"))
+        finally:
+            shutil.rmtree(root)
+
+    def test_glove_from_pretrained_cache(self):
+        r"""
+        Unit test for glove embedding read from the binary cache of the vectors.
+        """
+        root = tempfile.mkdtemp()
+        cache_dir = os.path.join(root, "embeddings", "Glove")
+        os.makedirs(cache_dir)
+        with zipfile.ZipFile(os.path.join(cache_dir, "glove.6B.zip"), "w") as zipf:
+            zipf.writestr("glove.6B.300d.txt", "".join(
+                f"word{i} " + " ".join([str(i)] * 300) + "\n" for i in range(3)))
+        try:
+            with mock.patch.dict(os.environ, {"CACHE_DIR": root}):
+                Glove.from_pretrained(root=root)
+                cache_path = os.path.join(cache_dir, "glove.6B.300d.txt")
+                assert os.path.exists(cache_path + ".npy")
+                assert os.path.exists(cache_path + ".vocab")
+                with mock.patch("mindnlp.modules.embeddings.vectors.convert_vectors") as convert:
+                    embed = Glove.from_pretrained(root=root, special_first=False, ids=[2, 4, 0])
+                convert.assert_not_called()
+            embed = embed.embed.asnumpy()
+            assert embed.shape == (3, 300)
+            assert (embed[:, 0] == [2, 0, 0]).all()
+
+            glove = Glove(init_embed=Tensor(np.arange(6, dtype=np.float32).reshape(2, 3)))
+            glove.save("test", root=root)
+            loaded = Glove.load("test", root=root)
+            assert (loaded.embed.asnumpy() == np.arange(6).reshape(2, 3)).all()
+        finally:
+            shutil.rmtree(root)
+
+    def test_glove_from_pretrained_vocab(self):
+        r"""
+        Unit test for glove embedding restricted to the tokens of a task vocab.
+        """
+        root = tempfile.mkdtemp()
+        cache_dir = os.path.join(root, "embeddings", "Glove")
+        os.makedirs(cache_dir)
+        with zipfile.ZipFile(os.path.join(cache_dir, "glove.6B.zip"), "w") as zipf:
+            zipf.writestr("glove.6B.300d.txt", "".join(
+                f"word{i} " + " ".join([str(i + 1)] * 300) + "\n" for i in range(5)))
+        try:
+            task_vocab = Vocab({"word3": 0, "other": 1, "word1": 2}, special_tokens=["<pad>"], special_first=False)
+            with mock.patch.dict(os.environ, {"CACHE_DIR": root}):
+                embed = Glove.from_pretrained(root=root, vocab=task_vocab)
+            embed = embed.embed.asnumpy()
+            assert embed.shape == (4, 300)
+            assert (embed[[0, 2], 0] == [4, 2]).all()
+            assert ((embed[1] >= 0) & (embed[1] < 1)).all()
+            assert (embed[3] == 0).all()
+
+            ms_vocab = text.Vocab.from_dict({"word3": 0, "<unk>": 1, "word4": 3})
+            with mock.patch.dict(os.environ, {"CACHE_DIR": root}):
+                embed = Glove.from_pretrained(root=root, vocab=ms_vocab)
+            embed = embed.embed.asnumpy()
+            assert embed.shape == (4, 300)
+            assert (embed[[0, 3], 0] == [4, 5]).all()
+            assert (embed[[1, 2]] == 0).all()
+        finally:
+            shutil.rmtree(root)
@@ -0,0 +1,100 @@
+# Copyright 2022 Huawei Technologies Co., Ltd
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ============================================================================
+"""Test the binary cache of pretrained word vectors"""
+
+import multiprocessing
+import os
+import shutil
+import tempfile
+import unittest
+import zipfile
+from unittest import mock
+import numpy as np
+from mindnlp.modules.embeddings import vectors
+from mindnlp.modules.embeddings.vectors import convert_vectors, load_vectors
+from mindnlp.utils import open_member
+
+
+class TestVectors(unittest.TestCase):
+    r"""
+    Test converting text word vectors
+    """
+
+    def setUp(self):
+        self.root = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.root)
+
+    def _check_parallel(self, text, skip_header=False):
+        path = os.path.join(self.root, "vectors.txt")
+        with open(path, "w", encoding="utf-8", newline="") as file:
+            file.write(text)
+        serial = os.path.join(self.root, "serial")
+        parallel = os.path.join(self.root, "parallel")
+        convert_vectors(open(path, encoding="utf-8"), serial, skip_header) # pylint: disable=consider-using-with
+        with mock.patch.object(vectors, "PARALLEL_CHUNK_BYTES", 64):
+            convert_vectors(path, parallel, skip_header, num_workers=2)
+        serial_vocab, serial_vectors = load_vectors(serial, path, None)
+        parallel_vocab, parallel_vectors = load_vectors(parallel, path, None)
+        assert parallel_vocab.vocab == serial_vocab.vocab
+        np.testing.assert_array_equal(parallel_vectors, serial_vectors)
+        return parallel_vocab, parallel_vectors
+
+    def test_convert_parallel(self):
+        """test parsing byte ranges in processes gives the serial result"""
+        lines = [f"wé{i} " + " ".join(str(i + j / 4) for j in range(5)) for i in range(40)]
+        vocab, matrix = self._check_parallel("40 5\r\n" + "\r\n".join(lines), skip_header=True)
+        assert len(vocab) == 40
+        assert vocab["wé3"] == 3
+        assert matrix[3].tolist() == [3, 3.25, 3.5, 3.75, 4]
+
+    def test_convert_parallel_fallback(self):
+        """test lone carriage returns fall back to the serial parser"""
+        lines = [f"w{i} " + " ".join([str(i)] * 5) for i in range(40)]
+        _, matrix = self._check_parallel("\n".join(lines[:20]) + "\r" + "\n".join(lines[20:]) + "\n")
+        assert matrix.shape == (40, 5)
+
+    def test_convert_parallel_archive(self):
+        """test a member of an archive is extracted once and parsed in processes"""
+        lines = [f"w{i} " + " ".join([str(i)] * 5) for i in range(40)]
+        path = os.path.join(self.root, "vectors.zip")
+        with zipfile.ZipFile(path, "w") as zipf:
+            zipf.writestr("vectors.txt", "\n".join(lines) + "\n")
+        cache_path = os.path.join(self.root, "archive")
+        with mock.patch.object(vectors, "PARALLEL_CHUNK_BYTES", 64), \
+                mock.patch.object(multiprocessing, "Pool", wraps=multiprocessing.Pool) as pool:
+            convert_vectors(open_member(path, "vectors.txt", "r"), cache_path, num_workers=2)
+        assert pool.call_count == 1
+        vocab, matrix = load_vectors(cache_path, path, None)
+        assert vocab["w7"] == 7
+        assert matrix[7].tolist() == [7] * 5
+        assert sorted(os.listdir(self.root)) == ["archive.npy", "archive.vocab", "vectors.zip"]
+
+    def test_convert_row_values(self):
+        """test tokens with spaces keep their row, and rows with missing values are rejected"""
+        cache_path = os.path.join(self.root, "rows")
+        with open(os.path.join(self.root, "rows.txt"), "w", encoding="utf-8") as file:
+            file.write("a 1 2\n. . . 3 4\nb 5 6\n")
+        convert_vectors(os.path.join(self.root, "rows.txt"), cache_path, num_workers=1)
+        vocab, matrix = load_vectors(cache_path, os.path.join(self.root, "rows.txt"), None)
+        assert vocab[". . ."] == 1
+        assert matrix.tolist() == [[1, 2], [3, 4], [5, 6]]
+
+        for text in ("a 1 2\nb 3\nc 4 5\n", "a 1 2\nb 3 x\n"):
+            with open(os.path.join(self.root, "rows.txt"), "w", encoding="utf-8") as file:
+                file.write(text)
+            with self.assertRaises(ValueError):
+                convert_vectors(os.path.join(self.root, "rows.txt"), cache_path, num_workers=1)
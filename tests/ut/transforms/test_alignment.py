@@ -0,0 +1,44 @@
+# Copyright 2023 Huawei Technologies Co., Ltd
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ============================================================================
+"""Test the alignment of tokens to characters and words"""
+
+import numpy as np
+import pytest
+from mindnlp.transforms import char_span_to_token_span, align_word_labels
+
+
+def test_char_span_to_token_span():
+    """test spans of one text and of a padded batch"""
+    offsets = np.array([[0, 0], [0, 5], [6, 11], [11, 12], [0, 0]])
+    assert [int(i) for i in char_span_to_token_span(offsets, 6, 12)] == [2, 3]
+    assert [int(i) for i in char_span_to_token_span(offsets, 7, 8)] == [2, 2]
+    assert [int(i) for i in char_span_to_token_span(offsets, 20, 25)] == [-1, -1]
+
+    batch = np.stack([offsets, np.array([[0, 0], [0, 3], [4, 7], [0, 0], [0, 0]])])
+    start, end = char_span_to_token_span(batch, np.array([0, 4]), np.array([5, 7]))
+    assert start.tolist() == [1, 2] and end.tolist() == [1, 2]
+    assert start.dtype == np.int32
+
+
+def test_align_word_labels():
+    """test labels spread to the first or all tokens of a word"""
+    word_ids = np.array([[-1, 0, 1, 1, -1], [-1, 0, 0, -1, -1]])
+    labels = np.array([[3, 5], [7, 0]])
+    assert align_word_labels(word_ids, labels).tolist() == [[-100, 3, 5, -100, -100],
+                                                            [-100, 7, -100, -100, -100]]
+    assert align_word_labels(word_ids, labels, -1, False).tolist() == [[-1, 3, 5, 5, -1],
+                                                                       [-1, 7, 7, -1, -1]]
+    with pytest.raises(ValueError):
+        align_word_labels(np.array([0, 2]), np.array([1, 2]))
@@ -0,0 +1,28 @@
+# Copyright 2022 Huawei Technologies Co., Ltd
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ============================================================================
+"""Test the BasicTokenizer"""
+
+from mindnlp.transforms import BasicTokenizer
+
+def test_basic_tokenizer_py():
+    """test the python implementation of BasicTokenizer"""
+    text = "Héllo,\tWORLD!\x00 你好 a^b`c ΟΔΟΣ; \ufeffx\ufffd \U0001d15e\U00020000z  end"
+    tokenizer = BasicTokenizer(py_transform=True)
+    assert tokenizer(text).tolist() == ["Héllo", ",", "WORLD", "!", "你", "好", "a", "^", "b", "`", "c",
+                                        "ΟΔΟΣ", ";", "x", "\U0001d15e", "\U00020000", "z", "end"]
+    tokenizer = BasicTokenizer(lower_case=True, py_transform=True)
+    assert tokenizer(text).tolist() == ["hello", ",", "world", "!", "你", "好", "a", "^", "b", "`", "c",
+                                        "οδος", ";", "x", "\U0001d157\U0001d165", "\U00020000", "z", "end"]
+    assert tokenizer("  \t").tolist() == []
@@ -14,6 +14,7 @@
 # ============================================================================
 """Test the BertTokenizer"""
 
+import numpy as np
 import mindspore as ms
 from mindspore.dataset import GeneratorDataset
 from mindspore.dataset.text import Vocab as msVocab
@@ -73,3 +74,91 @@ def test_bert_tokenizer_add_special_tokens():
     cls_id = bert_tokenizer.token_to_id("[CLS]")
 
     assert cls_id is not None
+
+
+def test_bert_tokenizer_encode_batch():
+    """test encoding a batch into padded ids and attention mask"""
+    texts = ['i make a small mistake', '床前明月光', 'i']
+    vocab_list = ["床", "前", "明", "月", "光", "i", "make", "small", "mistake",
+                  "[CLS]", "[SEP]", "[UNK]", "[PAD]", "[MASK]"]
+    bert_tokenizer = BertTokenizer(vocab=Vocab(vocab_list), lower_case=True)
+    input_ids, attention_mask = bert_tokenizer.encode_batch(texts)
+
+    expected = [bert_tokenizer.encode(text).ids for text in texts]
+    assert input_ids.shape == (3, max(len(ids) for ids in expected))
+    for row, ids in enumerate(expected):
+        assert input_ids[row, :len(ids)].tolist() == ids
+        assert (input_ids[row, len(ids):] == bert_tokenizer.pad_token_id).all()
+        assert attention_mask[row].sum() == len(ids)
+
+    test_dataset = GeneratorDataset(texts, 'text', shuffle=False)
+    test_dataset = test_dataset.batch(2, per_batch_map=bert_tokenizer.per_batch_map, input_columns=['text'],
+                                      output_columns=['input_ids', 'attention_mask'])
+    batches = list(test_dataset.create_dict_iterator(output_numpy=True))
+    assert batches[0]['input_ids'].tolist() == input_ids[:2, :batches[0]['input_ids'].shape[1]].tolist()
+    assert batches[1]['attention_mask'].tolist() == [[1, 1, 1]]
+
+
+def test_bert_tokenizer_cache():
+    """test the LRU cache of encodings"""
+    vocab_list = ["i", "make", "small", "mistake", "[CLS]", "[SEP]", "[UNK]", "[PAD]", "[MASK]"]
+    bert_tokenizer = BertTokenizer(vocab=Vocab(vocab_list), lower_case=True)
+    assert bert_tokenizer.cache_info() is None
+    expected = bert_tokenizer('i make small mistake').tolist()
+
+    bert_tokenizer.enable_cache(max_entries=2)
+    for _ in range(3):
+        assert bert_tokenizer('i make small mistake').tolist() == expected
+    assert bert_tokenizer.cache_info() == {'hits': 2, 'misses': 1, 'entries': 1, 'bytes': 20 + 6 * 64}
+
+    bert_tokenizer.encode('i')
+    bert_tokenizer.encode('small')
+    bert_tokenizer.encode('i make small mistake')
+    info = bert_tokenizer.cache_info()
+    assert info['entries'] == 2 and info['misses'] == 4
+
+    bert_tokenizer.enable_cache(max_bytes=200)
+    bert_tokenizer.encode('i')
+    bert_tokenizer.encode('i make small mistake')
+    assert bert_tokenizer.cache_info()['entries'] == 1
+
+    bert_tokenizer.add_tokens(['work'])
+    assert bert_tokenizer.cache_info()['entries'] == 0
+    bert_tokenizer.disable_cache()
+    assert bert_tokenizer.cache_info() is None
+
+
+def test_bert_tokenizer_offsets_word_ids():
+    """test offsets and word ids returned with the ids"""
+    texts = ['i make small mistakes', '床前明月光']
+    vocab_list = ["床", "前", "明", "月", "光", "i", "make", "small", "mistake", "##s",
+                  "[CLS]", "[SEP]", "[UNK]", "[PAD]", "[MASK]"]
+    bert_tokenizer = BertTokenizer(vocab=Vocab(vocab_list), lower_case=True,
+                                   return_offsets=True, return_word_ids=True)
+    ids, offsets, word_ids = bert_tokenizer(texts[0])
+    encoding = bert_tokenizer.encode(texts[0])
+    assert ids.tolist() == encoding.ids
+    assert offsets.dtype == np.int32 and offsets.tolist() == [list(offset) for offset in encoding.offsets]
+    assert word_ids.tolist() == [-1, 0, 1, 2, 3, 3, -1]
+
+    test_dataset = GeneratorDataset(texts, 'text', shuffle=False)
+    test_dataset = test_dataset.map(bert_tokenizer, 'text', ['input_ids', 'offsets', 'word_ids'])
+    row = next(test_dataset.create_dict_iterator(output_numpy=True))
+    assert row['offsets'].tolist() == offsets.tolist()
+
+    input_ids, _, batch_offsets, batch_word_ids = bert_tokenizer.per_batch_map(texts)
+    assert batch_offsets.shape == input_ids.shape + (2,)
+    assert batch_offsets[0].tolist() == offsets.tolist()
+    assert batch_word_ids[1].tolist() == [-1, 0, 1, 2, 3, 4, -1]
+    assert (batch_offsets[0, len(ids):] == 0).all() and (batch_word_ids[0, len(ids):] == -1).all()
+
+    _, attention_mask, batch_offsets, batch_word_ids = bert_tokenizer.encode_batch(
+        ['i make', 'i make small mistakes'], max_length=4, return_offsets=True, return_word_ids=True)
+    assert attention_mask.tolist() == [[1, 1, 1, 1], [1, 1, 1, 1]]
+    assert batch_offsets[1].tolist() == [[0, 0], [0, 1], [2, 6], [7, 12]]
+    assert batch_word_ids.tolist() == [[-1, 0, 1, -1], [-1, 0, 1, 2]]
+    _, attention_mask, batch_offsets, batch_word_ids = bert_tokenizer.encode_batch(
+        ['i', 'i make'], return_offsets=True, return_word_ids=True)
+    assert attention_mask.tolist() == [[1, 1, 1, 0], [1, 1, 1, 1]]
+    assert batch_offsets[0].tolist() == [[0, 0], [0, 1], [0, 0], [0, 0]]
+    assert batch_word_ids[0].tolist() == [-1, 0, -1, -1]
@@ -0,0 +1,44 @@
+# Copyright 2022 Huawei Technologies Co., Ltd
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ============================================================================
+"""Test the HTMLCleaner"""
+
+import pickle
+from mindspore.dataset import NumpySlicesDataset
+from mindnlp.transforms import HTMLCleaner
+
+def test_html_cleaner():
+    """test HTMLCleaner"""
+    dataset = NumpySlicesDataset(data={"text": ["a &amp; b<br />c\\d", "plain &lt;br /&gt;text"]}, shuffle=False)
+
+    dataset = dataset.map(operations=HTMLCleaner())
+
+    data_after = [str(row[0]) for row in dataset.create_tuple_iterator(output_numpy=True)]
+    assert data_after == ["a & bc d", "plain text"]
+
+def test_html_cleaner_options():
+    """test HTMLCleaner without replacing backslashes and removing tags"""
+    html_cleaner = HTMLCleaner(replace_backslash=False, remove_tags=False)
+    assert str(html_cleaner("a &amp; b<br />c\\d")) == "a & b<br />c\\d"
+
+def test_html_cleaner_multiprocessing():
+    """test HTMLCleaner in python multiprocessing."""
+    html_cleaner = pickle.loads(pickle.dumps(HTMLCleaner()))
+    texts = [f"<p>row {i} &amp; more</p>" for i in range(8)]
+    dataset = NumpySlicesDataset(data={"text": texts}, shuffle=False)
+
+    dataset = dataset.map(html_cleaner, 'text', num_parallel_workers=1, python_multiprocessing=True)
+
+    data_after = [str(row[0]) for row in dataset.create_tuple_iterator(output_numpy=True)]
+    assert data_after == [f"row {i} & more" for i in range(8)]
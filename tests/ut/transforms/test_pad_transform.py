@@ -14,8 +14,9 @@
 # ============================================================================
 """Test the AddToken"""
 
+import numpy as np
 from mindspore.dataset import NumpySlicesDataset
-from mindnlp.transforms import PadTransform, Truncate
+from mindnlp.transforms import PadTransform, Truncate, pad_sequences
 from mindnlp.utils import less_min_pynative_first
 
 def test_pad_transform():
@@ -63,3 +64,22 @@ def test_pad_transform_with_seq_length_multi_transform():
 
     assert data.tolist() == [1, 2, 3, 0, 0, 0, 0, 0, 0, 0]
     assert seq_len == 3
+
+def test_pad_transform_batch():
+    """test PadTransform on a whole ragged batch."""
+    pad_transform_op = PadTransform(3, 0, True)
+    padded, lengths = pad_transform_op.pad_batch([np.array([1, 2, 3, 4]), np.array([5]), np.array([], np.int64)])
+    assert padded.tolist() == [[1, 2, 3], [5, 0, 0], [0, 0, 0]]
+    assert lengths.tolist() == [3, 1, 0]
+
+    padded = PadTransform(3, -1).pad_batch(np.array([1, 2, 3, 4, 5]), offsets=[0, 1, 5])
+    assert padded.tolist() == [[1, -1, -1], [2, 3, 4]]
+
+def test_pad_sequences():
+    """test pad_sequences pads to the longest row without max_length."""
+    padded, lengths = pad_sequences([[1.5], [2, 3], []])
+    assert padded.dtype == np.float64
+    assert padded.tolist() == [[1.5, 0], [2, 3], [0, 0]]
+    assert lengths.tolist() == [1, 2, 0]
+    padded, lengths = pad_sequences([], max_length=2)
+    assert padded.shape == (0, 2)
@@ -0,0 +1,64 @@
+# Copyright 2022 Huawei Technologies Co., Ltd
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ============================================================================
+"""Test the TextToIds"""
+
+import numpy as np
+import pytest
+from mindspore.dataset import NumpySlicesDataset, text
+from mindnlp import Vocab
+from mindnlp.transforms import BasicTokenizer, BertTokenizer, Lookup, PadTransform, TextToIds
+
+def test_text_to_ids():
+    """test TextToIds gives the ids of the tokenizer, Lookup and PadTransform chain"""
+    vocab = Vocab(['<pad>', '<unk>', 'hello', 'world', ','])
+    texts = ["Hello, world", "hello there world hello world"]
+    chained = NumpySlicesDataset(data={"text": texts}, shuffle=False)
+    chained = chained.map([BasicTokenizer(True), Lookup(vocab, '<unk>'), PadTransform(4, 0)], 'text')
+    for tokenizer in (BasicTokenizer(True), BasicTokenizer(True, py_transform=True)):
+        fused = NumpySlicesDataset(data={"text": texts}, shuffle=False)
+        fused = fused.map(TextToIds(tokenizer, vocab, max_length=4, pad_value=0), 'text')
+        for row, expected in zip(fused.create_tuple_iterator(output_numpy=True),
+                                 chained.create_tuple_iterator(output_numpy=True)):
+            assert row[0].dtype == np.int32
+            assert row[0].tolist() == expected[0].tolist()
+
+def test_text_to_ids_length():
+    """test TextToIds returning lengths with a mindspore vocab"""
+    vocab = text.Vocab.from_list(['<pad>', '<unk>', 'hello'])
+    ids, length = TextToIds(BasicTokenizer(), vocab, max_length=3, pad_value=0, return_length=True)("hello x")
+    assert ids.tolist() == [2, 1, 0]
+    assert length == 2
+    assert TextToIds(BasicTokenizer(), vocab)("hello hello x").tolist() == [2, 2, 1]
+
+def test_text_to_ids_invalid():
+    """test TextToIds rejects an unk_token missing from the vocab and tokenizers returning ids"""
+    vocab = Vocab(['<pad>', 'hello'])
+    with pytest.raises(ValueError):
+        TextToIds(BasicTokenizer(), vocab)
+    with pytest.raises(TypeError):
+        TextToIds(BertTokenizer(vocab), vocab, unk_token='<pad>')
+    with pytest.raises(TypeError):
+        TextToIds(BertTokenizer(vocab, return_token=True, return_offsets=True), vocab, unk_token='<pad>')
+    text_to_ids = TextToIds(BasicTokenizer(py_transform=True), vocab, unk_token=None)
+    assert text_to_ids("hello").tolist() == [1]
+    with pytest.raises(ValueError):
+        text_to_ids("hello x")
+
+def test_text_to_ids_pretrained_tokens():
+    """test TextToIds with a pretrained tokenizer returning string tokens"""
+    vocab = Vocab(['[PAD]', '[UNK]', '[CLS]', '[SEP]', 'hello', 'world'])
+    tokenizer = BertTokenizer(vocab, return_token=True)
+    chained = Lookup(vocab, '[UNK]')(tokenizer('hello world'))
+    assert TextToIds(tokenizer, vocab, unk_token='[UNK]')('hello world').tolist() == chained.tolist()
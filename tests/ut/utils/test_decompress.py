@@ -0,0 +1,116 @@
+# Copyright 2022 Huawei Technologies Co., Ltd
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ============================================================================
+"""
+Test Decompress
+"""
+
+import gzip
+import os
+import shutil
+import tarfile
+import tempfile
+import unittest
+import zipfile
+from unittest import mock
+from mindnlp.utils import unzip, ungz, open_member, list_members
+
+
+class TestOpenMember(unittest.TestCase):
+    r"""
+    Test open_member
+    """
+
+    def setUp(self):
+        self.root = tempfile.mkdtemp()
+        self.text = "".join(f"word{i} 0.1 0.2\n" for i in range(1000))
+        self.src = os.path.join(self.root, "vec.txt")
+        with open(self.src, "w", encoding="utf-8") as file:
+            file.write(self.text)
+
+        self.zip_path = os.path.join(self.root, "vec.zip")
+        with zipfile.ZipFile(self.zip_path, "w", zipfile.ZIP_DEFLATED) as zipf:
+            zipf.write(self.src, "vec.txt")
+        self.tar_path = os.path.join(self.root, "vec.tar.gz")
+        with tarfile.open(self.tar_path, "w:gz") as tar:
+            tar.add(self.src, "data/vec.txt")
+        self.gz_path = os.path.join(self.root, "vec.txt.gz")
+        with gzip.open(self.gz_path, "wb") as file:
+            file.write(self.text.encode("utf-8"))
+        os.remove(self.src)
+
+    def tearDown(self):
+        shutil.rmtree(self.root)
+
+    def test_open_member(self):
+        """test members are streamed from each archive type"""
+        for path, member in ((self.zip_path, "vec.txt"), (self.tar_path, "data/vec.txt"),
+                             (self.gz_path, None)):
+            with open_member(path, member, "r") as file:
+                lines = list(file)
+            assert "".join(lines) == self.text
+            with open_member(path, member, parallel=True) as file:
+                assert file.read() == self.text.encode("utf-8")
+
+    def test_list_members(self):
+        """test listing members without extracting"""
+        assert list_members(self.zip_path) == ["vec.txt"]
+        assert list_members(self.tar_path) == ["data/vec.txt"]
+        assert list_members(self.gz_path) == ["vec.txt"]
+        assert not os.path.exists(os.path.join(self.root, "vec.txt"))
+
+    def test_open_member_errors(self):
+        """test missing members and bad modes"""
+        with self.assertRaises(KeyError):
+            open_member(self.zip_path, "missing.txt")
+        with self.assertRaises(KeyError):
+            open_member(self.tar_path, "missing.txt")
+        with self.assertRaises(ValueError):
+            open_member(self.zip_path, "vec.txt", "w")
+
+    def test_unzip_skip_extracted(self):
+        """test unzip skips members already extracted"""
+        unzip(self.zip_path, self.root)
+        target = os.path.join(self.root, "vec.txt")
+        mtime = os.stat(target).st_mtime_ns
+        unzip(self.zip_path, self.root)
+        assert os.stat(target).st_mtime_ns == mtime
+
+    def test_ungz(self):
+        """test ungz streams to disk"""
+        path = ungz(self.gz_path)
+        with open(path, "r", encoding="utf-8") as file:
+            assert file.read() == self.text
+
+    def _fake_pigz(self, script):
+        bin_dir = os.path.join(self.root, "bin")
+        os.makedirs(bin_dir, exist_ok=True)
+        path = os.path.join(bin_dir, "pigz")
+        with open(path, "w", encoding="utf-8") as file:
+            file.write("#!/bin/sh\n" + script + "\n")
+        os.chmod(path, 0o755)
+        return mock.patch.dict(os.environ, {"PATH": bin_dir + os.pathsep + os.environ["PATH"]})
+
+    @unittest.skipIf(os.name == "nt" or shutil.which("gzip") is None, "needs a shell and gzip")
+    def test_open_member_parallel(self):
+        """test .gz files are decompressed by pigz and its exit status is checked"""
+        with self._fake_pigz('exec gzip "$@"'):
+            with open_member(self.gz_path, mode="r", parallel=True) as file:
+                assert file.read() == self.text
+            with open_member(self.gz_path, mode="r", parallel=True) as file:
+                assert file.readline() == "word0 0.1 0.2\n"
+        with self._fake_pigz('echo "pigz: corrupted" >&2; exit 1'):
+            with self.assertRaisesRegex(OSError, "corrupted"):
+                with open_member(self.gz_path, parallel=True) as file:
+                    file.read()
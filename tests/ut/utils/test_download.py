@@ -16,9 +16,18 @@
 Test Download
 """
 
-import unittest
+import hashlib
 import os
-from mindnlp.utils.download import get_cache_path, check_md5, get_filepath, match_file
+import shutil
+import tempfile
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from unittest import mock
+from mindnlp.utils import download, store
+from mindnlp.utils.download import get_cache_path, check_md5, get_filepath, match_file, http_get, \
+    get_from_cache
 
 class TestGetCachePath(unittest.TestCase):
     r"""
@@ -72,3 +81,173 @@ class TestMatchFile(unittest.TestCase):
         path = os.path.expanduser('~')
         match_file_result = match_file(name, path)
         assert match_file_result == ''
+
+
+class _RangeHandler(BaseHTTPRequestHandler):
+    """Serve `server.content` with Range support, dropping the first `server.fail_after` bytes sent."""
+
+    def log_message(self, *args): # pylint: disable=arguments-differ
+        pass
+
+    def _headers(self, start, end, partial, head=False):
+        self.send_response(206 if partial else 200)
+        if not head or self.server.head_length:
+            self.send_header("Content-Length", str(end - start + 1))
+        if self.server.accept_ranges:
+            self.send_header("Accept-Ranges", "bytes")
+        if partial:
+            self.send_header("Content-Range", f"bytes {start}-{end}/{len(self.server.content)}")
+        self.end_headers()
+
+    def do_HEAD(self): # pylint: disable=invalid-name
+        """HEAD"""
+        self._headers(0, len(self.server.content) - 1, False, head=True)
+
+    def do_GET(self): # pylint: disable=invalid-name
+        """GET"""
+        content = self.server.content
+        start, end = 0, len(content) - 1
+        range_header = self.headers.get("Range")
+        partial = bool(range_header) and self.server.accept_ranges
+        if partial:
+            first, last = range_header[len("bytes="):].split("-")
+            start, end = int(first), (int(last) if last else end)
+            self.server.ranges.append((start, end))
+        if self.server.statuses or start >= len(content):
+            self.send_response(self.server.statuses.pop(0) if self.server.statuses else 416)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        self._headers(start, end, partial)
+        body = content[start: end + 1]
+        self.server.gets += 1
+        if self.server.fail_after is not None:
+            body, self.server.fail_after = body[:self.server.fail_after], None
+            self.wfile.write(body)
+            self.close_connection = True
+            return
+        self.wfile.write(body)
+
+
+class TestHttpGet(unittest.TestCase):
+    r"""
+    Test http_get against a local server
+    """
+
+    def setUp(self):
+        self.root = tempfile.mkdtemp()
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), _RangeHandler)
+        self.server.content = os.urandom(300000)
+        self.server.accept_ranges = True
+        self.server.fail_after = None
+        self.server.ranges = []
+        self.server.gets = 0
+        self.server.statuses = []
+        self.server.head_length = True
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.url = f"http://127.0.0.1:{self.server.server_address[1]}/data.bin"
+        self.md5 = hashlib.md5(self.server.content).hexdigest()
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+        shutil.rmtree(self.root)
+
+    def _read(self, filename):
+        with open(filename, "rb") as file:
+            return file.read()
+
+    def test_http_get(self):
+        """test download with md5"""
+        _, filename = http_get(self.url, self.root, self.md5, chunk_size=4096)
+        assert self._read(filename) == self.server.content
+        with self.assertRaises(RuntimeError):
+            http_get(self.url, self.root, "0" * 32, download_file_name="bad.bin")
+
+    def test_http_get_resume(self):
+        """test a partial file is resumed with a range request"""
+        with open(os.path.join(self.root, "data.bin_tmp"), "wb") as file:
+            file.write(self.server.content[:100000])
+        _, filename = http_get(self.url, self.root, self.md5)
+        assert self._read(filename) == self.server.content
+        assert self.server.ranges == [(100000, len(self.server.content) - 1)]
+
+    def test_http_get_interrupted(self):
+        """test an interrupted transfer is resumed on retry"""
+        self.server.fail_after = 123456
+        _, filename = http_get(self.url, self.root, self.md5, chunk_size=4096)
+        assert self._read(filename) == self.server.content
+        assert len(self.server.ranges) == 1
+        assert 0 < self.server.ranges[0][0] <= 123456
+
+    def test_http_get_no_ranges(self):
+        """test servers without range support"""
+        self.server.accept_ranges = False
+        with open(os.path.join(self.root, "data.bin_tmp"), "wb") as file:
+            file.write(b"stale")
+        _, filename = http_get(self.url, self.root, self.md5)
+        assert self._read(filename) == self.server.content
+
+    def test_http_get_retry_status(self):
+        """test transient error statuses are retried and keep the partial file"""
+        with open(os.path.join(self.root, "data.bin_tmp"), "wb") as file:
+            file.write(self.server.content[:100000])
+        self.server.statuses = [503, 429]
+        _, filename = http_get(self.url, self.root, self.md5)
+        assert self._read(filename) == self.server.content
+        assert self.server.ranges[-1] == (100000, len(self.server.content) - 1)
+
+    def test_http_get_error_status(self):
+        """test other error statuses raise and remove the partial file"""
+        with open(os.path.join(self.root, "data.bin_tmp"), "wb") as file:
+            file.write(self.server.content[:100000])
+        self.server.statuses = [404]
+        with self.assertRaises(RuntimeError):
+            http_get(self.url, self.root, self.md5)
+        assert not os.listdir(self.root)
+
+    def test_http_get_range_not_satisfiable(self):
+        """test a complete partial file answered with 416 is verified by md5"""
+        self.server.head_length = False
+        with open(os.path.join(self.root, "data.bin_tmp"), "wb") as file:
+            file.write(self.server.content)
+        _, filename = http_get(self.url, self.root, self.md5)
+        assert self._read(filename) == self.server.content
+        assert self.server.ranges == [(len(self.server.content), len(self.server.content) - 1)]
+
+    def test_http_get_parallel(self):
+        """test large files are fetched as concurrent ranges"""
+        with mock.patch.object(download, "PARALLEL_DOWNLOAD_SIZE", 1000):
+            _, filename = http_get(self.url, self.root, self.md5, num_workers=3)
+        assert self._read(filename) == self.server.content
+        assert sorted(self.server.ranges) == [(0, 99999), (100000, 199999), (200000, 299999)]
+        assert os.listdir(self.root) == ["data.bin"]
+
+    def test_get_from_cache_concurrent(self):
+        """test concurrent requests of the same url download once"""
+        cache_dir = Path(self.root) / "datasets"
+        results = []
+        with mock.patch.dict(os.environ, {"CACHE_DIR": self.root}):
+            threads = [threading.Thread(target=lambda: results.append(get_from_cache(self.url, cache_dir, self.md5)))
+                       for _ in range(4)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+            assert self.server.gets == 1
+            assert len(results) == 4
+            assert all(self._read(path) == self.server.content for path, _ in results)
+
+            os.remove(cache_dir / "data.bin")
+            path, _ = get_from_cache(self.url, cache_dir, self.md5)
+            assert self.server.gets == 1
+            assert self._read(path) == self.server.content
+
+    def test_get_from_cache_md5(self):
+        """test the md5 computed while downloading is stored without reading the file again"""
+        cache_dir = Path(self.root) / "datasets"
+        with mock.patch.dict(os.environ, {"CACHE_DIR": self.root}), \
+                mock.patch.object(store, "_md5_file", side_effect=AssertionError("file read again")):
+            path, _ = get_from_cache(self.url, cache_dir)
+            assert download.get_store().lookup(self.url)[1] == self.md5
+        assert self._read(path) == self.server.content
@@ -0,0 +1,91 @@
+# Copyright 2022 Huawei Technologies Co., Ltd
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ============================================================================
+"""
+Test prefetch
+"""
+
+import threading
+import unittest
+from unittest import mock
+from mindnlp.abc import PreTrainedConfig, PreTrainedTokenizer
+from mindnlp.dataset.register import load_dataset
+from mindnlp.utils import download
+from mindnlp.utils.download import prefetch
+
+
+class _PrefetchConfig(PreTrainedConfig):
+    pretrained_config_archive_map = {"prefetch-test": "http://host/prefetch-test/config.json"}
+
+
+class _PrefetchTokenizer(PreTrainedTokenizer):
+    pretrained_vocab_map = {"prefetch-test": "http://host/prefetch-test/tokenizer.json"}
+
+
+class _PrefetchOtherTokenizer(PreTrainedTokenizer):
+    pretrained_vocab_map = {"prefetch-test": "http://host/prefetch-test/vocab.txt"}
+
+
+class TestPrefetch(unittest.TestCase):
+    r"""
+    Test prefetch
+    """
+
+    def test_prefetch(self):
+        """test all artifacts of a name are fetched concurrently, keeping every file of a kind"""
+        calls = []
+        barrier = threading.Barrier(3, timeout=10)
+
+        def fake_cached_path(url, folder_name=None, **_kwargs):
+            barrier.wait()
+            calls.append((url, folder_name))
+            return "/cache/" + url.rsplit("/", 1)[-1], None
+
+        with mock.patch.object(download, "cached_path", fake_cached_path):
+            paths = prefetch("prefetch-test", kinds=("config", "tokenizer"), num_workers=3)
+        assert sorted(calls) == [("http://host/prefetch-test/config.json", "prefetch-test"),
+                                 ("http://host/prefetch-test/tokenizer.json", "prefetch-test"),
+                                 ("http://host/prefetch-test/vocab.txt", "prefetch-test")]
+        assert paths == {("prefetch-test", "config"): ["/cache/config.json"],
+                         ("prefetch-test", "tokenizer"): ["/cache/tokenizer.json", "/cache/vocab.txt"]}
+
+    def test_prefetch_dataset(self):
+        """test datasets are fetched by their loaders"""
+        loader = mock.Mock()
+        with mock.patch.dict(load_dataset.mem_dict, {"prefetch_test": loader}):
+            prefetch(["prefetch_test"], kinds="dataset", cache_dir="/cache")
+        loader.assert_called_once_with(root="/cache", proxies=None)
+
+    def test_prefetch_dataset_splits(self):
+        """test the splits of a dataset are fetched concurrently into the default root of the loader"""
+        calls = []
+        barrier = threading.Barrier(2, timeout=10)
+
+        def loader(root="/default", split=("train", "test"), proxies=None):
+            barrier.wait()
+            calls.append((root, split, proxies))
+
+        with mock.patch.dict(load_dataset.mem_dict, {"prefetch_test": loader}):
+            prefetch("prefetch_test", kinds="dataset", num_workers=2)
+        assert sorted(calls) == [("/default", "test", None), ("/default", "train", None)]
+
+    def test_prefetch_errors(self):
+        """test unknown names and kinds, and failed downloads"""
+        with self.assertRaises(ValueError):
+            prefetch("prefetch-test", kinds="weights")
+        with self.assertRaises(ValueError):
+            prefetch("prefetch-unknown", kinds="config")
+        with mock.patch.object(download, "cached_path", side_effect=OSError("offline")):
+            with self.assertRaises(RuntimeError):
+                prefetch("prefetch-test", kinds=("config", "tokenizer"))
@@ -0,0 +1,135 @@
+# Copyright 2022 Huawei Technologies Co., Ltd
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ============================================================================
+"""
+Test ArtifactStore
+"""
+
+import os
+import shutil
+import tempfile
+import threading
+import time
+import unittest
+from mindnlp.utils.store import ArtifactStore, FileLock
+
+
+class TestArtifactStore(unittest.TestCase):
+    r"""
+    Test ArtifactStore
+    """
+
+    def setUp(self):
+        self.root = tempfile.mkdtemp()
+        self.store = ArtifactStore(os.path.join(self.root, "store"))
+
+    def tearDown(self):
+        shutil.rmtree(self.root)
+
+    def _file(self, name, content):
+        path = os.path.join(self.root, name)
+        with open(path, "wb") as file:
+            file.write(content)
+        return path
+
+    def test_add_lookup(self):
+        """test files are stored by content and looked up by key"""
+        path = self._file("a.bin", b"abc")
+        digest = self.store.add("http://host/a.bin", path)
+        blob, found = self.store.lookup("http://host/a.bin")
+        assert found == digest == "900150983cd24fb0d6963f7d28e17f72"
+        assert os.path.samefile(blob, path)
+        assert self.store.lookup("http://host/a.bin", "0" * 32) == (None, None)
+        assert self.store.lookup("http://host/b.bin") == (None, None)
+
+        other = ArtifactStore(self.store.root)
+        assert other.lookup("http://host/a.bin")[1] == digest
+
+        target = os.path.join(self.root, "out", "a.bin")
+        self.store.materialize(blob, target)
+        with open(target, "rb") as file:
+            assert file.read() == b"abc"
+
+    def test_shared_root(self):
+        """test blobs of a read-only shared store are symlinked"""
+        shared = ArtifactStore(os.path.join(self.root, "shared"))
+        shared.add("http://host/a.bin", self._file("a.bin", b"abc"))
+        store = ArtifactStore(os.path.join(self.root, "local"), shared_root=shared.root)
+        blob, _ = store.lookup("http://host/a.bin")
+        assert blob.startswith(shared.root)
+        target = os.path.join(self.root, "out.bin")
+        store.materialize(blob, target)
+        assert os.path.islink(target)
+
+    def test_evict(self):
+        """test least recently used blobs are evicted first"""
+        for name in ("a", "b", "c"):
+            self.store.add(name, self._file(name, name.encode() * 10))
+            time.sleep(0.01)
+        self.store.touch("a")
+        assert self.store.evict(20) == ["b"]
+        assert self.store.lookup("b") == (None, None)
+        assert self.store.lookup("a")[0] is not None
+        assert self.store.lookup("c")[0] is not None
+
+    def test_add_keeps_blob(self):
+        """test adding a file larger than max_size evicts other blobs but keeps the file"""
+        store = ArtifactStore(os.path.join(self.root, "small"), max_size=10)
+        store.add("a", self._file("a.bin", b"a" * 10))
+        path = self._file("b.bin", b"b" * 100)
+        store.add("b", path)
+        assert os.path.exists(path)
+        assert store.lookup("b")[0] is not None
+        assert store.lookup("a") == (None, None)
+
+    def test_evict_links(self):
+        """test evicting a blob removes its hard links and frees the space"""
+        path = self._file("a.bin", b"a" * 10)
+        self.store.add("a", path)
+        blob, _ = self.store.lookup("a")
+        target = os.path.join(self.root, "out", "a.bin")
+        self.store.materialize(blob, target)
+        assert os.stat(blob).st_nlink == 3
+
+        replaced = self._file("b.bin", b"b" * 10)
+        self.store.add("b", replaced)
+        os.remove(replaced)
+        self._file("b.bin", b"b" * 10)
+
+        assert sorted(self.store.evict(0)) == ["a", "b"]
+        assert not os.path.exists(blob)
+        assert not os.path.exists(path)
+        assert not os.path.exists(target)
+        assert os.path.exists(replaced)
+        assert not os.listdir(os.path.join(self.store.root, "blobs"))
+
+    def test_file_lock(self):
+        """test the lock excludes other holders"""
+        lock_path = os.path.join(self.root, "test.lock")
+        events = []
+
+        def worker(idx):
+            with FileLock(lock_path):
+                events.append(("enter", idx))
+                time.sleep(0.05)
+                events.append(("exit", idx))
+
+        threads = [threading.Thread(target=worker, args=(idx,)) for idx in range(3)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        for idx in range(0, len(events), 2):
+            assert events[idx][0] == "enter"
+            assert events[idx + 1] == ("exit", events[idx][1])
@@ -14,7 +14,12 @@
 # ============================================================================
 """Test Vocab"""
 
+import pickle
+from unittest import mock
+import numpy as np
+import pytest
 from mindnlp import Vocab
+from mindnlp.vocab import vocab as vocab_module
 
 def test_vocab_from_list():
     """test vocab from list."""
@@ -62,3 +67,56 @@ def test_append_token():
 
     assert 'd' in vocab
     assert vocab['d'] == 5
+
+def test_vocab_lookup_array():
+    """vocab lookup with numpy arrays"""
+    vocab = Vocab(['a', 'b', 'c', 'd', 'e'], special_tokens=['<pad>', '<unk>'])
+    ids = vocab.lookup_ids(np.array([['b', 'd'], ['e', 'b']]))
+    assert ids.tolist() == [[3, 5], [6, 3]]
+    assert vocab.lookup_ids(np.array(['a', 'x']), unk_id=1).tolist() == [2, 1]
+    assert vocab.lookup_tokens(np.array([[2, 1], [2, 3]])).tolist() == [['a', '<unk>'], ['a', 'b']]
+    with pytest.raises(ValueError):
+        vocab.lookup_ids(np.array(['x']))
+
+def test_vocab_with_gaps():
+    """vocab from dict whose ids are not contiguous"""
+    vocab = Vocab({'a': 0, 'c': 2})
+    assert len(vocab) == 2
+    assert vocab(1) is None
+    assert vocab('c') == 2
+    vocab.append_token('d')
+    assert vocab.vocab == {'a': 0, 'c': 2, 'd': 3}
+
+def test_vocab_save_load(tmp_path):
+    """test saving a vocab and memory-mapping it back"""
+    vocab = Vocab(['a', 'b', '深圳'], special_tokens=['<pad>', '<unk>'])
+    vocab.append_token('d')
+    vocab.save(str(tmp_path / 'vocab'))
+
+    loaded = Vocab.load(str(tmp_path / 'vocab'))
+    assert isinstance(loaded._blob, np.memmap) # pylint: disable=protected-access
+    assert len(loaded) == 6
+    assert loaded.vocab == vocab.vocab
+    assert loaded('深圳') == 4
+    assert loaded(5) == 'd'
+
+def test_vocab_dict_cached():
+    """test the vocab dict is built once and rebuilt after appending"""
+    vocab = Vocab(['a', 'b'])
+    token_dict = vocab.vocab
+    assert vocab.vocab is token_dict
+    assert pickle.loads(pickle.dumps(vocab)).vocab == token_dict
+    vocab.append_token('c')
+    assert vocab.vocab == {'a': 0, 'b': 1, 'c': 2}
+
+def test_vocab_from_pretrained_duplicates(tmp_path):
+    """test a repeated token of a pretrained vocab keeps its last id"""
+    path = tmp_path / 'vocab.txt'
+    path.write_text('header\na\nb\na\n<unk>\nc\n', encoding='utf-8')
+    with mock.patch.object(vocab_module, 'cache_file', return_value=(str(path), None)):
+        vocab = Vocab.from_pretrained(special_tokens=('<pad>', '<unk>'))
+    assert vocab('a') == 4
+    assert vocab('<unk>') == 1
+    assert vocab('c') == 6
+    assert vocab(2) is None
+    assert len(vocab) == 5